@@ -0,0 +1,55 @@
+"""
+Reads the ``.hsdeck`` files in this directory for the benchmark and profiling scripts.
+
+A deck file has one line for each card, giving how many copies there are and then the name of the card, such as
+``2 Fireball``.  The engine only supports 20 card decks, so longer decks are cut down to their first 20 cards.
+"""
+import glob
+import os
+
+from hearthbreaker.cards.heroes import hero_for_class
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.engine import Deck, card_lookup
+
+
+def all_decks():
+    """
+    Finds every deck file in this directory
+
+    :return: The paths of the files, sorted by name
+    :rtype: list[str]
+    """
+    return sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.hsdeck")))
+
+
+def load_deck(filename):
+    """
+    Reads the names of the cards in a deck file
+
+    :param str filename: The path of the deck file
+    :return: The name of each card, once for each copy of it, up to 20 cards
+    :rtype: list[str]
+    """
+    card_names = []
+    with open(filename, "r") as deck_file:
+        for line in deck_file.read().splitlines():
+            if line.strip():
+                count, name = line.split(" ", 1)
+                card_names.extend([name] * int(count))
+    return card_names[:20]
+
+
+def create_deck(card_names):
+    """
+    Makes a new deck from the names of its cards, played by the hero of the last class card in it, or by a mage if
+    there are only neutral cards
+
+    :param list[str] card_names: The names of the cards, as given by :func:`load_deck`
+    :rtype: hearthbreaker.engine.Deck
+    """
+    cards = [card_lookup(name) for name in card_names]
+    character_class = CHARACTER_CLASS.MAGE
+    for card in cards:
+        if card.character_class != CHARACTER_CLASS.ALL:
+            character_class = card.character_class
+    return Deck(cards, hero_for_class(character_class))
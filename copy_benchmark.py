@@ -0,0 +1,70 @@
+"""
+Measures how many times per second a game in progress can be copied with :meth:`hearthbreaker.engine.Game.copy`.
+
+Search based agents such as :class:`hearthbreaker.agents.mcts_agent.MCTSAgent` copy the game for every node they
+explore, so the speed of copying limits how far they can search.  For each deck, a mirror match between two random
+agents is played for a few turns, so that there are minions on the board and cards in hand, and then the game is
+copied repeatedly.
+
+usage: python copy_benchmark.py [--turns TURNS] [--seconds SECONDS] [--seed SEED] [deck [deck ...]]
+
+With no decks given, every ``.hsdeck`` file in this directory is used.  The engine only supports 20 card decks, so
+longer decks are cut down to their first 20 cards.
+"""
+import argparse
+import gc
+import os
+import time
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.engine import Game
+from benchmark_decks import all_decks, load_deck, create_deck
+
+
+def create_game(card_names, turns, seed):
+    game = Game([create_deck(card_names), create_deck(card_names)], [RandomAgent(), RandomAgent()], seed)
+    game.pre_game()
+    for turn in range(turns):
+        if game.game_ended:
+            break
+        game.play_single_turn()
+    return game
+
+
+def copies_per_second(game, seconds):
+    gc.collect()
+    copies = 0
+    start = time.perf_counter()
+    elapsed = 0
+    while elapsed < seconds:
+        for i in range(50):
+            game.copy()
+        copies += 50
+        elapsed = time.perf_counter() - start
+    return copies / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the speed of copying a game in progress")
+    parser.add_argument("decks", nargs="*", help="The decks to play.  Defaults to all .hsdeck files.")
+    parser.add_argument("--turns", type=int, default=10, help="How many turns to play before copying")
+    parser.add_argument("--seconds", type=float, default=2.0, help="How long to copy each game for")
+    parser.add_argument("--seed", type=int, default=1857, help="The seed for the games")
+    args = parser.parse_args()
+
+    decks = args.decks or all_decks()
+    print("{:<16}{:>10}{:>10}{:>16}".format("deck", "minions", "hand", "copies/sec"))
+    rates = []
+    for deck_file in decks:
+        game = create_game(load_deck(deck_file), args.turns, args.seed)
+        rate = copies_per_second(game, args.seconds)
+        rates.append(rate)
+        print("{:<16}{:>10}{:>10}{:>16.0f}".format(os.path.basename(deck_file),
+                                                   sum(len(player.minions) for player in game.players),
+                                                   sum(len(player.hand) for player in game.players), rate))
+    if rates:
+        print("{:<36}{:>16.0f}".format("mean", sum(rates) / len(rates)))
+
+
+if __name__ == "__main__":
+    main()
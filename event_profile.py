@@ -0,0 +1,58 @@
+"""
+Shows which events and which cards take up the time when games are simulated, using
+:class:`hearthbreaker.profiler.EventProfiler`.
+
+For each deck, mirror matches between two random agents are played out, and the time spent on each event and in the
+handlers bound by each card is added up over all of them.
+
+usage: python event_profile.py [--games GAMES] [--seed SEED] [--limit LIMIT] [--json] [deck [deck ...]]
+
+With no decks given, every ``.hsdeck`` file in this directory is used.  The engine only supports 20 card decks, so
+longer decks are cut down to their first 20 cards.
+"""
+import argparse
+import json
+import sys
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.engine import Game
+from hearthbreaker.profiler import EventProfiler
+from benchmark_decks import all_decks, load_deck, create_deck
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profiles the events triggered in games between random agents")
+    parser.add_argument("decks", nargs="*", help="The decks to play.  Defaults to all .hsdeck files.")
+    parser.add_argument("--games", type=int, default=20, help="How many games to play with each deck")
+    parser.add_argument("--seed", type=int, default=1857, help="The seed for the first game")
+    parser.add_argument("--limit", type=int, default=25, help="The most events and handlers to list")
+    parser.add_argument("--json", action="store_true", help="Write the full results as JSON instead of a table")
+    args = parser.parse_args()
+
+    decks = args.decks or all_decks()
+    profiler = EventProfiler()
+    failed = 0
+    for deck_file in decks:
+        card_names = load_deck(deck_file)
+        for seed in range(args.seed, args.seed + args.games):
+            game = Game([create_deck(card_names), create_deck(card_names)], [RandomAgent(), RandomAgent()], seed)
+            profiler.start()
+            try:
+                game.start()
+            except Exception:
+                # Some cards still have bugs which stop a game part of the way through.  What was recorded up to the
+                # error is kept.
+                failed += 1
+            finally:
+                profiler.stop()
+
+    if args.json:
+        print(json.dumps(profiler, default=lambda o: o.__to_json__(), indent=1))
+    else:
+        print(profiler.table(args.limit))
+    if failed:
+        print("{} of the games stopped with an error".format(failed), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from hearthbreaker import trace
 from hearthbreaker.agents.basic_agents import Agent
 
 # Agresive
@@ -15,39 +16,39 @@ class AggressiveAgent(Agent):
         return [True, True, True, True]
 
     def check_opponent_life(self, player):
-        print ("Health of opponent's hero: {}".format(player.game.other_player.hero.health))
+        trace.info("Health of opponent's hero:", player.game.other_player.hero.health)
     
     def attack_with_hero(self,player):
-        print('ATTACKING WITH HERO')
+        trace.debug('ATTACKING WITH HERO')
         if player.hero.can_attack():
-            print('BEFORE ATTACK WITH HERO')
+            trace.debug('BEFORE ATTACK WITH HERO')
             self.check_opponent_life(player)
             player.hero.attack()
             self.check_opponent_life(player)
-            print('AFTER ATTACK WITH HERO')
-        print('HERO CANNOT ATTACK')
+            trace.debug('AFTER ATTACK WITH HERO')
+        trace.debug('HERO CANNOT ATTACK')
 
     # player atakuje wszystkimi swoimi stronnikami, zaczyna od ataku na other_player.hero
     def attack_with_all_possible_minions(self,player):
         attack_done = False
         for minion in player.minions:
             if minion.can_attack():
-                print('BEFORE ATTACK WITH MINIONS')
+                trace.debug('BEFORE ATTACK WITH MINIONS')
                 self.check_opponent_life(player)
-                print(">>> Attacking with minion:\n\tlife:", minion)
+                trace.debug(">>> Attacking with minion:\n\tlife:", minion)
                 minion.attack()
                 player.game.attack_target(minion, player.game.other_player.hero)
                 attack_done = True
                 self.check_opponent_life(player)
-                print('AFTER ATTACK WITH MINIONS')
+                trace.debug('AFTER ATTACK WITH MINIONS')
         if not attack_done:
-            print('NONE MINION CAN ATTACK')
+            trace.debug('NONE MINION CAN ATTACK')
 
     # player używa wszystkie karty jakie może użyć, czyli dopóki starczy mu many
     def use_all_possible_cards(self, player):
-        print(">>>>>>>>>>>>>>> PLAYING CARDS FROM HAND >>>>>>>>>>>>>>>")
+        trace.debug(">>>>>>>>>>>>>>> PLAYING CARDS FROM HAND >>>>>>>>>>>>>>>")
         possible_cards_to_use = [ card for card in player.hand if (card.can_use(player, player.game))]
-        print(">>> Possible cards to use: ", possible_cards_to_use)
+        trace.debug(">>> Possible cards to use: ", possible_cards_to_use)
 
 
         card_costs = [card.mana for card in player.hand]
@@ -60,11 +61,11 @@ class AggressiveAgent(Agent):
             for card in player.hand:
                 if card.can_use(player, player.game):
                     player.game.play_card(card)
-                    print(">>> Using card from hand:\n>>>    ", card)
+                    trace.debug(">>> Using card from hand:\n>>>    ", card)
                     # print("used card",card)
                     done_something = True
                     break
-        print("<<<<<<<<<<<<<<< END OF PLAYING CARDS FROM HAND <<<<<<<<<<<<<<<")
+        trace.debug("<<<<<<<<<<<<<<< END OF PLAYING CARDS FROM HAND <<<<<<<<<<<<<<<")
 
 
     # player używa power swojego hero
@@ -73,45 +74,47 @@ class AggressiveAgent(Agent):
                 player.hero.power.use()
 
     def print_info_about_turn(self, player):
-        print("--> info -->")
-        print("My hero's health:", player.hero.health)
-        print("My hero's card:", player.hero.card)
-        print("Opponent's health:", player.game.other_player.hero.health)
-        print("My current mana:", player.mana)
-
-        print("Cards on hand:\n\t", end='')
+        if not trace.enabled(trace.INFO):
+            return
+        trace.info("--> info -->")
+        trace.info("My hero's health:", player.hero.health)
+        trace.info("My hero's card:", player.hero.card)
+        trace.info("Opponent's health:", player.game.other_player.hero.health)
+        trace.info("My current mana:", player.mana)
+
+        trace.info("Cards on hand:\n\t", end='')
         if player.hand:
             cards_details = [str(card.name) + " (" + str(card.mana) + " mana)" for card in player.hand]
-            print(*cards_details, sep='\n\t')
+            trace.info(*cards_details, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("Cards on table:\n\t", end='')
+        trace.info("Cards on table:\n\t", end='')
         if player.minions:
-            print(*player.minions, sep='\n\t')
+            trace.info(*player.minions, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("<-- info <--")
+        trace.info("<-- info <--")
 
     def do_turn(self, player):
-        print("\nSTART A TURN OF AGGRESSIVE AGENT", player)
+        trace.info("\nSTART A TURN OF AGGRESSIVE AGENT", player)
         self.print_info_about_turn(player)
         self.use_all_possible_cards(player)
         self.attack_with_all_possible_minions(player)
         self.attack_with_hero(player)
         self.use_hero_power(player)
-        print("END TURN OF AGGRESSIVE AGENT",player,"\n")
+        trace.info("END TURN OF AGGRESSIVE AGENT",player,"\n")
            
 
     def choose_target(self, targets):
-        print("--- CHOOSING TARGET ---\n--- Choosing target from list:\n---    ", end='')
-        print(*targets, sep='\n---    ')
+        trace.debug("--- CHOOSING TARGET ---\n--- Choosing target from list:\n---    ", end='')
+        trace.debug(*targets, sep='\n---    ')
         if (len(targets)>=2):
             target_chosen = targets[-1]
         else:
             target_chosen = targets[-1]
-        print("--- CHOSEN TARGET:\n---    ", target_chosen)
+        trace.debug("--- CHOSEN TARGET:\n---    ", target_chosen)
         return target_chosen
 
     def choose_index(self, card, player):
@@ -1,7 +1,7 @@
 import abc
 import copy
 
-import random
+from hearthbreaker import trace
 from hearthbreaker.cards.base import Card
 
 
@@ -41,8 +41,8 @@ class DoNothingAgent(Agent):
         return [True, True, True, True]
 
     def do_turn(self, player):
-        print("TURN OF DO NOTHING AGENT")
-        print('---\nTurn of', player)
+        trace.info("TURN OF DO NOTHING AGENT")
+        trace.info('---\nTurn of', player)
         pass
 
     def choose_target(self, targets):
@@ -107,19 +107,19 @@ class RandomAgent(DoNothingAgent):
                                filter(lambda card: card.can_use(player, player.game) and card.mana <= player.mana,
                                       player.hand)]
         for card in all_cards_which_can_be_used:
-            if random.randint(0, 1) == 1 and len(player.minions) < 7:
+            if player.game.random.randint(0, 1) == 1 and len(player.minions) < 7:
                 player.game.play_card(card)
                 cards_played.append(card)
-        print("Cards played:", cards_played)
+        trace.info("Cards played:", cards_played)
 
         ##### attacking with minions #####
         all_minions_who_can_attack = [minion for minion in filter(lambda minion: minion.can_attack(), player.minions)]
         if player.hero.can_attack():
             all_minions_who_can_attack.append(player.hero)
         for attacker in all_minions_who_can_attack:
-            if random.randint(0, 1) == 1:
+            if player.game.random.randint(0, 1) == 1:
                 attacks_performed.append(attacker)
-        print("Attacks:", attacks_performed)
+        trace.info("Attacks:", attacks_performed)
         for attacker in attacks_performed:
             attacker.attack()
 
@@ -131,15 +131,15 @@ class RandomAgent(DoNothingAgent):
         #     player.hero.power.use()
 
     def choose_target(self, targets):
-        target_chosen = targets[random.randint(0, len(targets) - 1)]
+        target_chosen = targets[targets[0].player.game.random.randint(0, len(targets) - 1)]
         return target_chosen
 
     def choose_index(self, card, player):
-        return random.randint(0, len(player.minions))
+        return player.game.random.randint(0, len(player.minions))
 
     def choose_option(self, options, player):
         options = self.filter_options(options, player)
-        return options[random.randint(0, len(options) - 1)]
+        return options[player.game.random.randint(0, len(options) - 1)]
 
 
 class OpponentAgent(DoNothingAgent):
@@ -150,25 +150,27 @@ class OpponentAgent(DoNothingAgent):
         return [True, True, True, True]
 
     def print_info_about_turn(self, player):
-        print("\nSTART A TURN OF OPPONENT AGENT", player)
-        print("My",player.hero)
-        print("Opponent's hero:", player.game.other_player.hero.card)
-        print("My mana:", player.mana)
-
-        print("Cards on hand:\n\t", end='')
+        if not trace.enabled(trace.INFO):
+            return
+        trace.info("\nSTART A TURN OF OPPONENT AGENT", player)
+        trace.info("My",player.hero)
+        trace.info("Opponent's hero:", player.game.other_player.hero.card)
+        trace.info("My mana:", player.mana)
+
+        trace.info("Cards on hand:\n\t", end='')
         if player.hand:
             cards_details = [str(card.name) + " (" + str(card.mana) + " mana)" for card in player.hand]
-            print(*cards_details, sep='\n\t')
+            trace.info(*cards_details, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("Cards on table:\n\t", end='')
+        trace.info("Cards on table:\n\t", end='')
         if player.minions:
-            print(*player.minions, sep='\n\t')
+            trace.info(*player.minions, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("<-- info <--")
+        trace.info("<-- info <--")
 
     def do_turn(self, player):
         player.game.remove_dead_minions()
@@ -181,19 +183,19 @@ class OpponentAgent(DoNothingAgent):
                                filter(lambda card: card.can_use(player, player.game) and card.mana <= player.mana,
                                       player.hand)]
         for card in all_cards_which_can_be_used:
-            if random.randint(0, 1) == 1 and len(player.minions) < 7:
+            if player.game.random.randint(0, 1) == 1 and len(player.minions) < 7:
                 player.game.play_card(card)
                 cards_played.append(card)
-        print("Cards played:", cards_played)
+        trace.info("Cards played:", cards_played)
 
         ##### attacking with minions #####
         all_minions_who_can_attack = [minion for minion in filter(lambda minion: minion.can_attack(), player.minions)]
         if player.hero.can_attack():
             all_minions_who_can_attack.append(player.hero)
         for attacker in all_minions_who_can_attack:
-            if random.randint(0, 1) == 1:
+            if player.game.random.randint(0, 1) == 1:
                 attacks_performed.append(attacker)
-        print("Attacks:", attacks_performed)
+        trace.info("Attacks:", attacks_performed)
         for attacker in attacks_performed:
             attacker.attack()
 
@@ -208,14 +210,14 @@ class OpponentAgent(DoNothingAgent):
     def choose_target(self, targets):
         # print("--- CHOOSING TARGET ---\n--- Choosing target from list:\n---    ", end='')
         # print(*targets, sep='\n---    ')
-        target_chosen = targets[random.randint(0, len(targets) - 1)]
+        target_chosen = targets[targets[0].player.game.random.randint(0, len(targets) - 1)]
         # print("--- Chosen target:\n---   ", target_chosen)
         return target_chosen
 
     def choose_index(self, card, player):
-        return random.randint(0, len(player.minions))
+        return player.game.random.randint(0, len(player.minions))
 
     def choose_option(self, options, player):
         options = self.filter_options(options, player)
-        return options[random.randint(0, len(options) - 1)]
+        return options[player.game.random.randint(0, len(options) - 1)]
 
@@ -1,3 +1,4 @@
+from hearthbreaker import trace
 from hearthbreaker.agents.basic_agents import Agent
 
 
@@ -6,16 +7,16 @@ class ControllingAgent(Agent):
         return [True, True, True, True]
 
     def check_opponent_life(self, player):
-        print("Health of opponent's hero: {}".format(player.game.other_player.hero.health))
+        trace.info("Health of opponent's hero:", player.game.other_player.hero.health)
 
     def attack_with_hero(self, player):
         if player.hero.can_attack():
-            print('BEFORE ATTACK WITH HERO')
+            trace.debug('BEFORE ATTACK WITH HERO')
             self.check_opponent_life(player)
             player.hero.attack()
             self.check_opponent_life(player)
-            print('AFTER ATTACK WITH HERO')
-        print('HERO CANNOT ATTACK')
+            trace.debug('AFTER ATTACK WITH HERO')
+        trace.debug('HERO CANNOT ATTACK')
 
 
 
@@ -30,35 +31,37 @@ class ControllingAgent(Agent):
         for minion in attacking_minions:
         # for minion in attacking_minions[:int(len(attacking_minions)/4)]:
             attack_done = True
-            print('BEFORE ATTACK WITH MINIONS')
+            trace.debug('BEFORE ATTACK WITH MINIONS')
             self.check_opponent_life(player)
-            print(">>> Attacking with minion:\n\tlife:", minion)
+            trace.debug(">>> Attacking with minion:\n\tlife:", minion)
             minion.attack()
             self.check_opponent_life(player)
-            print('AFTER ATTACK WITH MINIONS')
+            trace.debug('AFTER ATTACK WITH MINIONS')
         if not attack_done:
-            print('NONE MINION CAN ATTACK')
+            trace.debug('NONE MINION CAN ATTACK')
 
     def print_info_about_turn(self, player):
-        print("--> info -->")
-        print("My hero's health:", player.hero.health)
-        print("Opponent's health:", player.game.other_player.hero.health)
-        print("My current mana:", player.mana)
-
-        print("Cards on hand:\n\t", end='')
+        if not trace.enabled(trace.INFO):
+            return
+        trace.info("--> info -->")
+        trace.info("My hero's health:", player.hero.health)
+        trace.info("Opponent's health:", player.game.other_player.hero.health)
+        trace.info("My current mana:", player.mana)
+
+        trace.info("Cards on hand:\n\t", end='')
         if player.hand:
             cards_details = [str(card.name) + " (" + str(card.mana) + " mana)" for card in player.hand]
-            print(*cards_details, sep='\n\t')
+            trace.info(*cards_details, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("Cards on table:\n\t", end='')
+        trace.info("Cards on table:\n\t", end='')
         if player.minions:
-            print(*player.minions, sep='\n\t')
+            trace.info(*player.minions, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("<-- info <--")
+        trace.info("<-- info <--")
 
     def play_all_possible_cards_from_hand(self, player):
         '''
@@ -67,9 +70,9 @@ class ControllingAgent(Agent):
         '''
 
         # choose cards that can be played
-        print(">>>>>>>>>>>>>>> PLAYING CARDS FROM HAND >>>>>>>>>>>>>>>")
+        trace.debug(">>>>>>>>>>>>>>> PLAYING CARDS FROM HAND >>>>>>>>>>>>>>>")
         possible_cards_to_use = [ card for card in player.hand if (card.can_use(player, player.game))]
-        print(">>> Possible cards to use: ", possible_cards_to_use)
+        trace.debug(">>> Possible cards to use: ", possible_cards_to_use)
 
 
         # create a list of possible moves (based on mana points)
@@ -89,20 +92,20 @@ class ControllingAgent(Agent):
         all_possible_moves_sorted_by_mana_left_after_move = sorted(all_possible_moves, key=lambda tuple: tuple[1])
 
         # print nicely
-        print(">>> Possible moves to make (cards, mana_left_aftre_move): ", end=' ')
+        trace.debug(">>> Possible moves to make (cards, mana_left_aftre_move): ", end=' ')
         if all_possible_moves_sorted_by_mana_left_after_move:
-            print("\n>>>    ", end='')
-            print(*all_possible_moves_sorted_by_mana_left_after_move, sep='\n>>>    ')
+            trace.debug("\n>>>    ", end='')
+            trace.debug(*all_possible_moves_sorted_by_mana_left_after_move, sep='\n>>>    ')
         else:
-            print("[]")
+            trace.debug("[]")
 
         # choose best cards to be played
         cards_to_use = all_possible_moves_sorted_by_mana_left_after_move[0][0] if all_possible_moves_sorted_by_mana_left_after_move else []
         for card in cards_to_use:
             if card.can_use(player, player.game):
                 player.game.play_card(card)
-                print(">>> Using card from hand:\n>>>    ", card)
-        print("<<<<<<<<<<<<<<< END OF PLAYING CARDS FROM HAND <<<<<<<<<<<<<<<")
+                trace.debug(">>> Using card from hand:\n>>>    ", card)
+        trace.debug("<<<<<<<<<<<<<<< END OF PLAYING CARDS FROM HAND <<<<<<<<<<<<<<<")
 
     def use_hero_power(self, player):
         '''
@@ -119,7 +122,7 @@ class ControllingAgent(Agent):
         :param player:
         :return:
         '''
-        print("\nSTART A TURN OF CONTROLLING AGENT", player)
+        trace.info("\nSTART A TURN OF CONTROLLING AGENT", player)
         self.print_info_about_turn(player)
 
         self.play_all_possible_cards_from_hand(player)
@@ -127,7 +130,7 @@ class ControllingAgent(Agent):
         self.attack_opponents_minions_with_my_own_minions(player)
         self.attack_with_hero(player)
         self.use_hero_power(player)
-        print("END TURN OF CONTROLLING AGENT",player,"\n")
+        trace.info("END TURN OF CONTROLLING AGENT",player,"\n")
 
     def choose_target(self, targets):
         '''
@@ -136,16 +139,16 @@ class ControllingAgent(Agent):
         :return:
         '''
 
-        print("--- CHOOSING TARGET ---\n--- Choosing target from list:\n---    ", end='')
-        print(*targets, sep='\n---    ')
+        trace.debug("--- CHOOSING TARGET ---\n--- Choosing target from list:\n---    ", end='')
+        trace.debug(*targets, sep='\n---    ')
 
         # >>> ERROR: sometimes both heros are in targets list, making it possible for minion to attack its owner
         if len(targets)>=2 and type(targets[-2])==type(targets[-1]):
-            print('='*10, " ERROR ", '='*10, "TYPES", '='*10 ,type(targets[-2]), type(targets[-1]))
+            trace.error('='*10, " ERROR ", '='*10, "TYPES", '='*10 ,type(targets[-2]), type(targets[-1]))
         # <<< ERROR
 
         target_chosen = targets[0]
-        print("--- CHOSEN TARGET:\n---    ", target_chosen)
+        trace.debug("--- CHOSEN TARGET:\n---    ", target_chosen)
 
         return target_chosen
 
@@ -1,26 +1,38 @@
+from hearthbreaker import trace
 from hearthbreaker.agents.basic_agents import Agent, DoNothingAgent
-from itertools import combinations 
-import functools
-import operator
+from itertools import combinations, islice
+import multiprocessing
 import random
 import math
 from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingAgent, OpponentAgent
+from hearthbreaker.zobrist import state_hashes, tag_keys
 
 global_depth = []
 global_nodesvisited = []
 
+# Progressive widening: a node visited n times may have up to WIDENING_CONSTANT * n ** WIDENING_EXPONENT children, so
+# that the search looks deeper into a few moves, rather than trying each of thousands of moves once
+WIDENING_CONSTANT = 2
+WIDENING_EXPONENT = 0.5
+
+# What a card in hand is worth to evaluate_position, against a point of health or attack on the board
+HAND_CARD_VALUE = 2
+
+
 def find_minion(m, ms):
-    filtered_minions = list(filter(lambda x: x.key==m.key, ms)) 
+    filtered_minions = list(filter(lambda x: x.key==m.key, ms))
     if len(filtered_minions)<1:
         raise Exception('No minion: {}\n found in: {}\n key: {}, keys: {}\n\n'.format(m, ms, m.key, list(map(lambda x: x.key, ms))))
     return filtered_minions[0]
 
+
 def find_target(t, ts, hero):
     if t.is_hero():
         return hero
     else:
         return find_minion(t, ts)
 
+
 def attack_target(minion, target, game):
     m = find_minion(minion, game.current_player.minions)
     if (m.health<1):
@@ -46,7 +58,9 @@ def play_move(game, chosen_move):
 
     if len(cards) > 0:
         for card in cards:
-            game.play_card(card)
+            # The move may have been found in another line of the search, so play the matching card from the hand
+            hand = game.current_player.hand
+            game.play_card(hand[hand.index(card)])
     if len(attacks) > 0:
         for (minion, target) in attacks:
             game.attack_target(minion, target)
@@ -54,6 +68,21 @@ def play_move(game, chosen_move):
     game._end_turn()
 
 
+def is_playable(game, move):
+    """ Whether move can be made in the position game is in: its cards are in the hand, and the minions making and
+        taking its attacks are on the board.  A move found in an earlier search, with other cards drawn, may not be.
+    """
+    cards, attacks = move
+    hand = [card.name for card in game.current_player.hand]
+    for card in cards:
+        if card.name not in hand:
+            return False
+        hand.remove(card.name)
+    attackers = {minion.key for minion in game.current_player.minions}
+    defenders = {minion.key for minion in game.other_player.minions}
+    return all(minion.key in attackers and (target.is_hero() or target.key in defenders) for minion, target in attacks)
+
+
 def get_minions_to_use(game):
     minions_to_use = []
     for minion in game.current_player.minions:
@@ -61,153 +90,259 @@ def get_minions_to_use(game):
             minions_to_use.append(minion)
     return minions_to_use
 
-def get_inner_tree(game):
-    attack_sequences = []
-    minions_use = get_minions_to_use(game)
-    for minion in minions_use:
-        targets = minion.get_targets()
-        for target in targets:
+
+def get_attacks(game):
+    """ List the attacks the current player can make, as (minion, target) pairs.
+    """
+    return [(minion, target) for minion in get_minions_to_use(game) for target in minion.get_targets()]
+
+
+def symmetry_key(character):
+    """ A key which is the same for characters that an attack could be made by or on with the same outcome, such as
+        two undamaged River Crocolisks, so that only one of them needs to be tried.
+        Next to a minion with an aura, where a minion stands makes a difference, so each of them is kept apart.
+    """
+    if character.is_hero():
+        return "hero",
+    if any(minion.auras for minion in character.player.minions):
+        return id(character),
+    return (character.card.name, character.health, character.calculate_max_health(), character.calculate_attack(),
+            character.taunt, character.divine_shield, character.stealth, character.frozen, character.windfury(),
+            character.exhausted, character.attacks_performed, tag_keys(character.deathrattle),
+            tag_keys(character.effects), tag_keys(character.buffs))
+
+
+def iter_attack_sequences(game):
+    """ Generate every sequence of attacks the current player can make, one at a time, ending with no attacks at all.
+        Sequences which only differ in the order of the same attacks, or in which of two interchangeable minions
+        attacks or is attacked, are only generated once, and a sequence comes just after the longer sequences which
+        start with it.
+        Each sequence is found by trying it out on the game itself, which is put back into its starting position
+        before the sequence is handed out, so the game must be in that position whenever the next one is asked for.
+    """
+    checkpoint = game.checkpoint()
+    # The hashes of the positions already reached, so that the same attacks in a different order are only listed once,
+    # and the positions after them are only looked into once
+    seen = {game.state_hash()}
+
+    def extend(sequence, last_face):
+        attacks = get_attacks(game)
+        if not attacks:
+            return
+        # Everything in the game keeps its identity when it is put back, so the attacks listed here stay valid
+        position = game.checkpoint()
+        tried = set()
+        for minion, target in attacks:
+            symmetry = (symmetry_key(minion), symmetry_key(target))
+            if symmetry in tried:
+                continue
+            tried.add(symmetry)
+            # Attacks on the hero by minions with no effects of their own, with no secret to set off, can be made in
+            # any order, so one after the other they are only tried in the order the minions stand in
+            face = target.is_hero() and not minion.effects and not game.other_player.secrets
+            if face and minion.index < last_face:
+                continue
+            game.undo_to(position)
             if minion.health == 0 or target.health==0:
-                print("ERROR - get_inner_tree returns minions with 0 health")
-            attack = (minion, target)
-            attack_sequences.append([attack]) 
-            game_copy = game.copy()
-            # print("ATTACK TARGET", minion, "===>", target)
-            # print("MY minions in game_copy: ", game_copy.current_player.minions)
-            # print("Opponent's minions in game_copy: ", game_copy.other_player.minions)
-            attack_target(minion, target, game_copy)
-            # print("AFTER ATTACK", minion, "===>", target)
-            # print("minions in game_copy", game_copy.other_player.minions)
-            a = get_inner_tree(game_copy)
-            new_a = list(map(lambda x: [attack]+x,a))
-            attack_sequences += new_a
-    
-    return attack_sequences
+                trace.error("ERROR - iter_attack_sequences returns minions with 0 health")
+            attack_target(minion, target, game)
+            game.remove_dead_minions()
+            reached = game.state_hash()
+            if reached in seen:
+                continue
+            seen.add(reached)
+            longer = sequence + [(minion, target)]
+            for s in extend(longer, minion.index if face else -1):
+                yield s
+            game.undo_to(checkpoint)
+            yield longer
+
+    for s in extend([], -1):
+        yield s
+    game.undo_to(checkpoint)
+    yield []
+
+
+def evaluate_position(game, player):
+    """ Score the position for player, from 0 (lost) to 1 (won), for rollouts which are cut short.
+        Each side's strength is its hero's health and armor, the attack and health of its minions, and a few points
+        for each card in hand, and the score is player's share of the total.
+    """
+    if player.hero.dead:
+        return 0
+    if player.opponent.hero.dead:
+        return 1
+    strengths = []
+    for p in (player, player.opponent):
+        strength = p.hero.health + p.hero.armor + HAND_CARD_VALUE * len(p.hand)
+        for minion in p.minions:
+            if minion.health > 0:
+                strength += minion.calculate_attack() + minion.health
+        strengths.append(strength)
+    return strengths[0] / sum(strengths)
+
+
+def get_inner_tree(game):
+    """ List every sequence of attacks the current player can make. See iter_attack_sequences.
+    """
+    return [sequence for sequence in iter_attack_sequences(game) if sequence]
+
 
 class GameState:
     """ A state of the game, i.e. the game board. These are the only functions which are
         absolutely necessary to implement uct in any 2-player complete information deterministic
-        zero-sum game, although they can be enhanced and made quicker, for example by using a 
+        zero-sum game, although they can be enhanced and made quicker, for example by using a
         GetRandomMove() function to generate a random move during rollout.
         By convention the players are numbered 1 and 2.
     """
-    def __init__(self, game):
+    def __init__(self, game, evaluator=evaluate_position):
         self.game = game
-        self.playerJustMoved = game.current_player # At the root pretend the player just moved is player 2 - player 1 has the first move
-        
+        self.playerJustMoved = game.other_player  # At the root pretend the player just moved is the one waiting
+        self.evaluator = evaluator  # scores the position when a rollout is stopped before the game is over
+
     def clone(self):
-        return GameState(self.game.copy())
+        return GameState(self.game.copy(), self.evaluator)
 
     def do_move(self, move):
-        """ update a state by carrying out the given move.
+        """ update a state by carrying out the given move, and then start the next player's turn, so that the
+            state is what the next player would see when asked to move.
             Must update playerJustMoved.
         """
-        play_move(self.game, move)
         self.playerJustMoved = self.game.current_player
+        play_move(self.game, move)
+        if not self.game.current_player.hero.dead and not self.game.other_player.hero.dead:
+            self.game._start_turn()
 
-        
     def get_moves(self):
         """ Get all possible moves from this state.
         """
-
+        return list(self.iter_moves())
+
+    def iter_moves(self):
+        """ Generate the possible moves from this state one at a time, so that only as many are built as are used.
+            Nothing is worked out until the first move is asked for, and the game must be in this state whenever
+            a move is asked for, as the attacks are tried out on it.
+            Moves with more cards (by mana) and longer attack sequences come first, and the two are mixed, so that the
+            first few moves are already quite different from each other.
+        """
         player = self.game.current_player
         opponent = self.game.other_player
         if player.hero.dead or opponent.hero.dead:
-            return []
-        cards = player.hand
+            return
 
         # remove dead minions from table
         self.game.remove_dead_minions()
-        # self.game.current_player.minions = [minion for minion in self.current_player.minions if minion.health > 0]
-        # self.game.other_player.minions = [minion for minion in self.other_player.minions if minion.health > 0]
-
-        # print("\n-> GET INFO ABOUT GAME ->\n\tcurrent player life:",player.hero,"\n\tcurrent player hand:", player.hand, "\n\tcurrent player minions:", player.minions)
-        # print("\topponent's life:",player.hero,"\n\topponent's hand:",opponent.hand, "\n\topponent's minions:",opponent.minions)
-        # print("<- GET INFO ABOUT GAME <-\n")
-
-        possible_cards_to_play = list(filter(lambda x: x.mana <= player.mana and x.can_use(player, player.game), cards))
-        # get all combinations of cards play (order doesn't matter):
-        a = list(filter(lambda x: x.mana_cost() <= player.mana, cards))
-        cards_combinations = []
-        for r in range(len(possible_cards_to_play)+1):
-	        cards_combinations.extend(list(combinations(possible_cards_to_play, r)))
-
-        # print("CARDS COMB BEF")
-        # print(cards_combinations)
-        # print("MANA", player.mana)
-        cards_combinations = list(
-            filter(lambda xs: sum([x.mana_cost() for x in xs]) <= player.mana, cards_combinations))  # + [[]]
-        # print("CARDS COMB AF")
-        # print(cards_combinations)
-        # print(list(filter(lambda xs: sum([x.mana_cost() for x in xs]) > player.mana, cards_combinations)) + [[]])
-        # print("-------------------")
-
-        # get all combinations of attacks (order matters):
-        attack_sequences = get_inner_tree(self.game) + [[]]
-
-        seq = map(lambda cc: list(map(lambda aseq: (cc,aseq), attack_sequences)), cards_combinations)
-        # [[(), ()],[(), ()]] => [(), (), (), ()]
-        all_possible_moves = functools.reduce(operator.add, seq, [])
 
+        possible_cards_to_play = list(filter(lambda x: x.mana <= player.mana and x.can_use(player, player.game),
+                                             player.hand))
+        # get all combinations of cards play (order doesn't matter), as long as there is mana and room for them:
         # player can have up to 7 cards on the table
-        all_possible_moves = [move for move in all_possible_moves if len(move[0])+len(player.minions)<=7]
-
-
-        ##### printing informations
-        # print("---\n", player, "'s mana:", player.mana)
-        # print("Possible cards to play:", possible_cards_to_play)
-        # print("Cards combinations:", cards_combinations)
-        # print("Attack sequences:", attack_sequences)
-        # print("All possible moves:",all_possible_moves)
-
-        return all_possible_moves
+        # copies of the same card are interchangeable, so each combination is only listed once
+        cards_combinations = []
+        seen = set()
+        for r in range(min(len(possible_cards_to_play), 7 - len(player.minions)) + 1):
+            for cards in combinations(possible_cards_to_play, r):
+                cost = sum(x.mana_cost() for x in cards)
+                names = tuple(sorted(x.name for x in cards))
+                if cost <= player.mana and names not in seen:
+                    seen.add(names)
+                    cards_combinations.append((cost, cards))
+        cards_combinations = [cards for cost, cards in sorted(cards_combinations, key=lambda c: -c[0])]
+
+        # get all combinations of attacks (order matters), as they are needed:
+        attack_sequences = []
+        more_attack_sequences = iter_attack_sequences(self.game)
+
+        # Pairs are taken in order of the sum of their positions in the two lists
+        total = 0
+        while True:
+            if more_attack_sequences is not None and len(attack_sequences) <= total:
+                sequence = next(more_attack_sequences, None)
+                if sequence is None:
+                    more_attack_sequences = None
+                else:
+                    attack_sequences.append(sequence)
+            if more_attack_sequences is None and total > len(cards_combinations) + len(attack_sequences) - 2:
+                return
+            for i in range(max(0, total - len(attack_sequences) + 1), min(total, len(cards_combinations) - 1) + 1):
+                yield cards_combinations[i], attack_sequences[total - i]
+            total += 1
 
     def get_result(self, playerjm):
-        """ Get the game result from the viewpoint of playerjm. 
+        """ Get the game result from the viewpoint of playerjm, or the evaluator's score if the game isn't over.
         """
-        return 0 if playerjm.hero.dead else 1
+        if playerjm.hero.dead or playerjm.opponent.hero.dead:
+            return 0 if playerjm.hero.dead else 1
+        return self.evaluator(self.game, playerjm)
 
     def __repr__(self):
         pass
 
+
 class MCTSAgent(DoNothingAgent):
-    def __init__(self, depth=100):
+    def __init__(self, depth=100, reuse_tree=True, workers=1, rollout_depth=None, evaluator=evaluate_position):
         super().__init__()
         self.depth = depth
+        # Rollouts stop after rollout_depth turns (or when a hero dies, if None), and evaluator then scores the position
+        self.rollout_depth = rollout_depth
+        self.evaluator = evaluator
+        # With more than one worker, the iterations are shared between independent searches in separate processes
+        # (see parallel_uct), and the tree isn't kept between turns
+        self.workers = workers
+        # When reusing the tree, the node for the move chosen last turn is kept, and its child for the board the
+        # opponent actually left us with becomes the root of the next search, along with its statistics (see
+        # Node.reroot)
+        self.reuse_tree = reuse_tree
+        self.tree = None
+        self.reused = 0  # how many searches started from a reused node
 
     def print_info_about_turn(self, player):
-        print("\nTURN OF MCTS AGENT")
-        print("--> info -->")
-        print("My", player.hero)
-        print("My health:", player.hero.health)
-        print("Opponent's health:", player.game.other_player.hero.health)
-        print("My mana:", player.mana)
-
-        print("Cards on hand:\n\t", end='')
+        if not trace.enabled(trace.INFO):
+            return
+        trace.info("\nTURN OF MCTS AGENT")
+        trace.info("--> info -->")
+        trace.info("My", player.hero)
+        trace.info("My health:", player.hero.health)
+        trace.info("Opponent's health:", player.game.other_player.hero.health)
+        trace.info("My mana:", player.mana)
+
+        trace.info("Cards on hand:\n\t", end='')
         if player.hand:
             cards_details = [str(card.name) + " (" + str(card.mana) + " mana)" for card in player.hand]
-            print(*cards_details, sep='\n\t')
+            trace.info(*cards_details, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("Cards on table:\n\t", end='')
+        trace.info("Cards on table:\n\t", end='')
         if player.minions:
-            print(*player.minions, sep='\n\t')
+            trace.info(*player.minions, sep='\n\t')
         else:
-            print('[]')
+            trace.info('[]')
 
-        print("<-- info <--")
+        trace.info("<-- info <--")
 
     def do_turn(self, player):
         # self.print_info_about_turn(player)
-        state = GameState(player.game)
-        move = uct(rootstate = state, itermax = self.depth, verbose = False)
+        if player.hero.dead or player.game.other_player.hero.dead:  # e.g. from fatigue at the start of the turn
+            self.tree = None
+            return
+        state = GameState(player.game, self.evaluator)
+        if self.workers > 1:
+            move = parallel_uct(rootstate=state, itermax=self.depth, workers=self.workers,
+                                rollout_depth=self.rollout_depth)
+            play_move(player.game, move)
+            return
+        rootnode = self.find_root(player.game)
+        move = uct(rootstate=state, itermax=self.depth, verbose=False, rootnode=rootnode,
+                   rollout_depth=self.rollout_depth)
 
         # print("*** AFTER UCT ***")
         # print("Before playing the move:")
         # print("\tHand:", player.hand,"\n\tMinions:", player.minions, "\n\tMana:", player.mana, "\n\tHero:", player.hero.health)
 
         # print("---\nChosen move:", move)
+        if self.reuse_tree:
+            self.tree = rootnode.most_visited_child()
         play_move(player.game, move)
 
         # print("---\nAfter playing the move:")
@@ -215,36 +350,145 @@ class MCTSAgent(DoNothingAgent):
 
         # print("*********")
 
+    def find_root(self, game):
+        """ Return the node to search from: the most visited child of last turn's chosen node which has reached the
+            same board as the game, or a new node if there isn't one.  The cards in hand and in the deck are left out,
+            as the search drew other cards than the game did.
+        """
+        tree, self.tree = self.tree, None
+        if tree is not None and tree.playerJustMoved.game is game:
+            board = state_hashes(game)[1]
+            reached = [c for c in tree.childNodes if c.boardHash == board]
+            if reached:
+                node = max(reached, key=lambda c: c.visits)
+                node.reroot(game)
+                self.reused += 1
+                return node
+        return Node(state=GameState(game))
+
+
 class Node:
     """ A node in the game tree. Note wins is always from the viewpoint of playerJustMoved.
         Crashes if state not specified.
     """
-    def __init__(self, move = None, parent = None, state = None):
-        self.move = move # the move that got us to this node - "None" for the root node
-        self.parentNode = parent # "None" for the root node
+    # A search makes a node for nearly every iteration, so they are kept small
+    __slots__ = ["move", "parentNode", "childNodes", "wins", "visits", "untriedMoves", "moves", "playerJustMoved",
+                 "stateHash", "boardHash", "seed"]
+
+    def __init__(self, move=None, parent=None, state=None):
+        self.move = move  # the move that got us to this node - "None" for the root node
+        self.parentNode = parent  # "None" for the root node
         self.childNodes = []
         self.wins = 0
         self.visits = 0
-        self.untriedMoves = state.get_moves() # future child nodes
-        self.playerJustMoved = state.playerJustMoved # the only part of the state that the Node needs later
-        
+        self.untriedMoves = []  # future child nodes, taken from moves by widen
+        self.moves = None  # the moves from this node, generated when it is first reached again
+        self.playerJustMoved = state.playerJustMoved  # the only part of the state that the Node needs later
+        # identify moves which lead to the same position, and (leaving out the cards drawn) the same board
+        self.stateHash, self.boardHash = state_hashes(state.game)
+        self.seed = None  # the seed for random events during the moves from this node, such as drawing a card
+
     def uct_select_child(self):
         """ Use the UCB1 formula to select a child node. Often a constant UCTK is applied so we have
             lambda c: c.wins/c.visits + UCTK * sqrt(2*log(self.visits)/c.visits to vary the amount of
             exploration versus exploitation.
         """
-        s = sorted(self.childNodes, key = lambda c: c.wins/c.visits + math.sqrt(2*math.log(self.visits)/c.visits))[-1]
-        return s
-    
+        # a single pass over the children rather than a sort, with the part that is the same for each worked out once
+        exploration = 2 * math.log(self.visits)
+        best = None
+        best_score = None
+        for c in self.childNodes:
+            score = c.wins / c.visits + math.sqrt(exploration / c.visits)
+            if best is None or score >= best_score:
+                best, best_score = c, score
+        return best
+
+    def find_child(self, state_hash, move=None):
+        """ Return the child node whose position has the given hash, or None if there isn't one.
+            A child kept by reroot, whose position hasn't been reached since, is found by its move instead.
+        """
+        for c in self.childNodes:
+            if c.stateHash == state_hash:
+                return c
+        if move is not None:
+            for c in self.childNodes:
+                if c.stateHash is None and c.move == move:
+                    return c
+        return None
+
+    def reroot(self, game):
+        """ Make this node the root of a search from game, which has the same board as this node's position, but
+            perhaps other cards in hand.  What came of the cards drawn in the last search is forgotten: the moves
+            generated (whose generator would put its old position back into the game), the seed, and the positions
+            after each child's move.  Children whose move can't be made now are dropped, and the rest keep their
+            statistics, and take on their new position when it is next reached (see reached).
+        """
+        self.parentNode = None
+        self.moves = None
+        self.untriedMoves = []
+        self.seed = None
+        self.stateHash, self.boardHash = state_hashes(game)
+        self.childNodes = [c for c in self.childNodes if is_playable(game, c.move)]
+        for c in self.childNodes:
+            c.childNodes = []
+            c.moves = None
+            c.untriedMoves = []
+            c.seed = None
+            c.stateHash = c.boardHash = None
+
+    def reached(self, game):
+        """ Note that the search has reached this node, with game in its position, and give the node the hashes of
+            that position if reroot left it without them.
+        """
+        if self.stateHash is None:
+            self.stateHash, self.boardHash = state_hashes(game)
+
+    def widen(self, state):
+        """ Take as many untried moves as this node is now allowed from state, which must be this node's position.
+            Most nodes are only ever visited once, by the iteration that adds them, so no moves are generated until
+            a node is reached again.
+        """
+        if self.moves is None:
+            self.moves = state.iter_moves()
+        width = max(1, math.ceil(WIDENING_CONSTANT * self.visits ** WIDENING_EXPONENT))
+        while len(self.childNodes) + len(self.untriedMoves) < width:
+            move = next(self.moves, None)
+            if move is None:
+                break
+            self.untriedMoves.append(move)
+
+    def chance_seed(self, rng):
+        """ Return the seed to use for the moves made from this node, drawing it from rng the first time.
+            Fixing the seed means a move always leads to the same position, so that a child's untried moves
+            (which depend on the card it drew, say) are still the moves available when it is next visited.
+        """
+        if self.seed is None:
+            self.seed = rng.getrandbits(64)
+        return self.seed
+
+    def most_visited_child(self):
+        """ Return the child node which has been visited the most, which is the move to make.
+        """
+        return max(reversed(self.childNodes), key=lambda c: c.visits)
+
+    def pop_untried_move(self, rng):
+        """ Remove a random move from untriedMoves and return it.
+            The last move takes its place, so that nothing has to be shifted along.
+        """
+        i = rng.randrange(len(self.untriedMoves))
+        m = self.untriedMoves[i]
+        self.untriedMoves[i] = self.untriedMoves[-1]
+        self.untriedMoves.pop()
+        return m
+
     def add_child(self, m, s):
-        """ Remove m from untriedMoves and add a new child node for this move.
+        """ Add a new child node for the move m, which must already have been taken from untriedMoves.
             Return the added child node
         """
-        n = Node(move = m, parent = self, state = s)
-        self.untriedMoves.remove(m)
+        n = Node(move=m, parent=self, state=s)
         self.childNodes.append(n)
         return n
-    
+
     def update(self, result):
         """ update this node - one additional visit and result additional wins. result must be from the viewpoint of playerJustmoved.
         """
@@ -274,14 +518,27 @@ class Node:
         return s
 
 
-def uct(rootstate, itermax, verbose=False):
-    rootnode = Node(state=rootstate)
+def uct(rootstate, itermax, verbose=False, rng=None, rootnode=None, rollout_depth=None):
+    """ Search from rootstate for itermax iterations and return the most visited move.  Rollouts are played out with
+        random moves until a hero dies, or, with a rollout_depth, for at most that many turns, after which the
+        position is scored by rootstate's evaluator.
+    """
+    # The search draws from its own generator, seeded with a single draw from the game's, so that the search is
+    # reproducible and the many copies it explores don't consume the real game's random numbers.
+    if rng is None:
+        rng = random.Random(rootstate.game.random.getrandbits(64))
+    if rootnode is None:
+        rootnode = Node(state=rootstate)
     counters = []
     visited = []
+    # Each iteration plays on the real game, which is wound back to this checkpoint once the iteration is done
+    game = rootstate.game
+    root_checkpoint = game.checkpoint()
 
     for i in range(itermax):
         node = rootnode
-        state = rootstate.clone()
+        state = GameState(game, rootstate.evaluator)
+        node.widen(state)
         visited.append(len(node.childNodes)/(len(node.untriedMoves)+len(node.childNodes))*100)
 
         # print("Turn:", state.game._turns_passed, ", iteration:", i, "\nTried moves:", len(node.childNodes),
@@ -289,46 +546,132 @@ def uct(rootstate, itermax, verbose=False):
 
         # Select
         while node.untriedMoves == [] and node.childNodes != []:  # node is fully expanded and non-terminal
+            game.random.seed(node.chance_seed(rng))
             node = node.uct_select_child()
             # print("==========\nSelect - chosen move:", node.move)
             state.do_move(node.move)
+            node.reached(game)
+            node.widen(state)
             # print("Select - finished selecting for move:", node.move, "\n==========")
 
         # Expand
         if node.untriedMoves != []:  # if we can expand (i.e. state/node is non-terminal)
-            m = random.choice(node.untriedMoves)
+            m = node.pop_untried_move(rng)
             # print("==========\nExpand - chosen move:", m)
+            game.random.seed(node.chance_seed(rng))
             state.do_move(m)
-            node = node.add_child(m, state)  # add child and descend tree
+            # Different moves often reach the same position (the same attacks in a different order, say), so they
+            # share a node rather than splitting the visits between them
+            transposition = node.find_child(game.state_hash(), m)
+            if transposition is not None:
+                node = transposition
+                node.reached(game)
+            else:
+                node = node.add_child(m, state)  # add child and descend tree
             # print("Expand - finished expanding for move:", m, "\n==========")
 
         # My rollout
-        curr_player_won = 0
-        if not state.game.current_player.hero.dead and not state.game.other_player.hero.dead:
-            game_copy = state.game.copy()
-            game_copy.players[0].change_agent(RandomAgent())
-            game_copy.players[1].change_agent(RandomAgent())
-    
-            while not game_copy.current_player.hero.dead and not game_copy.other_player.hero.dead:
-                game_copy._start_turn()
-                game_copy.remove_dead_minions()
-                game_copy.current_player.agent.do_turn(game_copy.current_player)
-                game_copy._end_turn()
-            curr_player_won = 0 if game_copy.current_player.hero.dead else 1
-            # print("Rollout - current player won") if curr_player_won == 0 else print("Rollout - other player won")
-        counter = 0 
+        if not game.current_player.hero.dead and not game.other_player.hero.dead:
+            game.random.seed(rng.getrandbits(64))
+            game.players[0].change_agent(RandomAgent())
+            game.players[1].change_agent(RandomAgent())
+
+            # The state is always at the start of a turn
+            turns = 0
+            while not game.current_player.hero.dead and not game.other_player.hero.dead:
+                if rollout_depth is not None and turns >= rollout_depth:
+                    break
+                turns += 1
+                game.remove_dead_minions()
+                game.current_player.agent.do_turn(game.current_player)
+                game._end_turn()
+                if not game.current_player.hero.dead and not game.other_player.hero.dead:
+                    game._start_turn()
+        counter = 0
+        # The result is the same for the whole path, only the point of view changes
+        result = state.get_result(game.players[0])
         # My Backpropagate
         while node != None:  # backpropagate from the expanded node and work back to the root node
             # print("==========\nBackpropagation - updating node:", node)
-            node.update(curr_player_won)  # state is terminal. update node with result from POV of node.playerJustMoved
+            # state is terminal. update node with result from POV of node.playerJustMoved
+            node.update(result if node.playerJustMoved is game.players[0] else 1 - result)
             # print("Backpropagation - finished updating node:", node, "\n==========")
             node = node.parentNode
             counter +=1
         counters.append(counter)
+        game.undo_to(root_checkpoint)
 
     # Output some information about the tree - can be omitted
-    if (verbose): print("Tree info:",rootnode.tree_to_string(0))
-    else: print("Children of tree info:",rootnode.children_to_string())
+    if trace.enabled(trace.INFO):
+        if verbose:
+            trace.info("Tree info:", rootnode.tree_to_string(0))
+        else:
+            trace.info("Children of tree info:", rootnode.children_to_string())
     global_depth.append((rootstate.game._turns_passed, sum(counters)/len(counters)))
     global_nodesvisited.append((rootstate.game._turns_passed, sum(visited)/len(visited)))
-    return sorted(rootnode.childNodes, key=lambda c: c.visits)[-1].move # return the move that was most visited
\ No newline at end of file
+    return rootnode.most_visited_child().move  # return the move that was most visited
+
+
+# The position being searched by parallel_uct.  The worker processes are forked from the searching process, so they
+# inherit it rather than having it pickled (which the event handlers bound throughout a game don't allow).  For the
+# same reason a pool of workers can't be kept from one search to the next, as it would still be searching the position
+# it was forked from.
+_parallel_state = None
+
+
+def _search_worker(job):
+    seed, itermax, rollout_depth = job
+    # The moves are generated lazily, as in uct, and identified by the order they were generated in, which is the same
+    # in every search (and in the searching process) as each starts from the same position and random state.
+    moves = []
+
+    def generate_moves():
+        for move in _parallel_state.iter_moves():
+            moves.append(move)
+            yield move
+
+    rootnode = Node(state=_parallel_state)
+    rootnode.moves = generate_moves()
+    uct(_parallel_state, itermax, rng=random.Random(seed), rootnode=rootnode, rollout_depth=rollout_depth)
+    positions = {id(move): index for index, move in enumerate(moves)}
+    return [(positions[id(c.move)], c.visits, c.wins) for c in rootnode.childNodes]
+
+
+def parallel_uct(rootstate, itermax, workers, rng=None, rollout_depth=None):
+    """ Share itermax iterations between independent searches from rootstate, each run in its own process with its
+        own seed, and return the move with the most visits across all of the searches.  Where processes can't be
+        forked, the searches are run one after another instead.  There are never more searches than iterations, and
+        with no iterations at all the first move generated is returned.
+    """
+    global _parallel_state
+    if rng is None:
+        rng = random.Random(rootstate.game.random.getrandbits(64))
+    workers = min(workers, itermax)
+    if workers < 1:
+        return next(rootstate.iter_moves())
+    budgets = [itermax // workers + (1 if i < itermax % workers else 0) for i in range(workers)]
+    jobs = [(rng.getrandbits(64), budget, rollout_depth) for budget in budgets]
+
+    _parallel_state = rootstate
+    try:
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:
+            results = [_search_worker(job) for job in jobs]
+        else:
+            with context.Pool(len(jobs)) as pool:
+                results = pool.map(_search_worker, jobs)
+    finally:
+        _parallel_state = None
+
+    visits = {}
+    wins = {}
+    for result in results:
+        for index, v, w in result:
+            visits[index] = visits.get(index, 0) + v
+            wins[index] = wins.get(index, 0) + w
+    # Only as many moves are generated here as the searches got through
+    moves = list(islice(rootstate.iter_moves(), max(visits) + 1))
+    if trace.enabled(trace.INFO):
+        trace.info("Children of parallel tree info:", [(moves[i], wins[i], visits[i]) for i in sorted(visits)])
+    return moves[max(sorted(visits), key=lambda i: visits[i])]
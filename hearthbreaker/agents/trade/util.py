@@ -53,16 +53,16 @@ class Util:
         return res.values()
 
     @staticmethod
-    def rand_el(list):
-        i = random.randint(0, len(list) - 1)
+    def rand_el(list, rng=random):
+        i = rng.randint(0, len(list) - 1)
         return list[i]
 
     @staticmethod
-    def rand_prefer_minion(targets):
+    def rand_prefer_minion(targets, rng=random):
         minions = [card for card in filter(lambda c: not isinstance(c, Hero), targets)]
         if len(minions) > 0:
             targets = minions
-        return Util.rand_el(targets)
+        return Util.rand_el(targets, rng)
 
     @staticmethod
     def filter_out_one(arr, f):
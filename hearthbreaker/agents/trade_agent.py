@@ -1,3 +1,4 @@
+from hearthbreaker import trace
 from hearthbreaker.agents.basic_agents import DoNothingAgent
 from hearthbreaker.agents.trade.possible_play import PlayMixin
 from hearthbreaker.agents.trade.trade import TradeMixin, AttackMixin
@@ -30,10 +31,10 @@ class ChooseTargetMixin:
 
         targets = self.prune_targets(all_targets, False)
         if len(targets) == 0:
-            return Util.rand_el(all_targets)
+            return Util.rand_el(all_targets, self.player.game.random)
 
         if not self.current_trade:
-            return Util.rand_prefer_minion(targets)
+            return Util.rand_prefer_minion(targets, self.player.game.random)
             # raise Exception("No current trade")
 
         for target in targets:
@@ -41,14 +42,14 @@ class ChooseTargetMixin:
                 return target
 
         # raise Exception("Could not find target {}".format(target))
-        return Util.rand_prefer_minion(targets)
+        return Util.rand_prefer_minion(targets, self.player.game.random)
 
     def choose_target_friendly(self, targets):
         pruned = self.prune_targets(targets, True)
         if len(pruned) == 0:
-            return Util.rand_el(targets)
+            return Util.rand_el(targets, self.player.game.random)
 
-        return Util.rand_el(pruned)
+        return Util.rand_el(pruned, self.player.game.random)
 
     def prune_targets(self, targets, get_friendly):
         res = []
@@ -59,7 +60,7 @@ class ChooseTargetMixin:
 
             if is_friendly == get_friendly:
                 res.append(target)
-                print("trade_agent.py -> ChooseTargetMixin -> prune_targets")
+                trace.debug("trade_agent.py -> ChooseTargetMixin -> prune_targets")
 
         return res
 
@@ -92,7 +93,7 @@ class ChooseTargetMixin:
     def choose_target(self, targets):
         res = self.choose_target_inner(targets)
         # print("Target {}".format(res))
-        print("trade_agent.py -> ChooseTargetMixin -> choose_target")
+        trace.debug("trade_agent.py -> ChooseTargetMixin -> choose_target")
         return res
 
 
@@ -1,3 +1,4 @@
-from hearthbreaker.cards.minions import *
-from hearthbreaker.cards.spells import *
-from hearthbreaker.cards.weapons import *
\ No newline at end of file
+from hearthbreaker.cards import minions, spells, weapons
+from hearthbreaker.cards.registry import lazy_package
+
+lazy_package(__name__, [(package.__name__, package.__all__) for package in [minions, spells, weapons]])
@@ -3,6 +3,7 @@ from functools import reduce
 import hearthbreaker.constants
 from hearthbreaker.constants import CARD_RARITY, MINION_TYPE
 from hearthbreaker.game_objects import Bindable, GameObject, GameException, Hero
+from hearthbreaker.tags.base import copy_tags
 
 
 def _battlecry_targetable(target):
@@ -171,6 +172,26 @@ class Card(Bindable, GameObject):
     def __hash__(self):
         return hash((self.name, self.mana))
 
+    def copy(self):
+        """
+        Creates a copy of this card which is not attached to any player.
+
+        The card's definition (its name, cost, battlecry and so on) is shared with the copy rather than being
+        rebuilt.  Only the events, effects, auras and buffs belonging to this particular card are duplicated.
+
+        :rtype: Card
+        """
+        new_card = type(self).__new__(type(self))
+        new_card.__dict__ = self.__dict__.copy()
+        new_card.events = {}
+        new_card.effects = copy_tags(self.effects)
+        new_card.auras = copy_tags(self.auras)
+        new_card.buffs = copy_tags(self.buffs)
+        new_card.player = None
+        new_card._attached = False
+        new_card._stat_cache = {}
+        return new_card
+
     def replace(self, new_card):
         index = self.player.hand.index(self)
         self.unattach()
@@ -187,6 +208,11 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
     :see: :class:`Card`
     :see: :meth:`create_minion`
     """
+    #: Set on a class whose :meth:`create_minion` makes the same minion every time, whichever card of the class it is
+    #: called on and whoever the player is.  The first minion made is then kept, and later minions are copied from it
+    #: (see :meth:`new_minion`).
+    shared_minion = False
+
     def __init__(self, name, mana, character_class, rarity, collectible=True,
                  minion_type=hearthbreaker.constants.MINION_TYPE.NONE, ref_name=None, battlecry=None, choices=None,
                  combo=None, overload=0, effects=None, buffs=None):
@@ -232,6 +258,11 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
     def __repr__(self):
         return repr((self.name, self.mana))
 
+    def copy(self):
+        new_card = super().copy()
+        new_card._placeholder = None
+        return new_card
+
     def can_use(self, player, game):
         """
         Checks if this minion can be played.  The card must be able to play AND the board must not be full.
@@ -270,7 +301,7 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
         super().use(player, game)
         if (len(player.minions) >= 7 and not self._placeholder) or len(player.minions) >= 8:
             raise GameException("Cannot place a minion on a board with more than 7 minons on it")
-        minion = self.create_minion(player)
+        minion = self.new_minion(player)
         minion.card = self
         minion.player = player
         minion.game = game
@@ -329,7 +360,7 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
         """
         if len(player.minions) < 7:
             self.attach(self, player)
-            minion = self.create_minion(player)
+            minion = self.new_minion(player)
             minion.card = self
             minion.player = player
             minion.game = game
@@ -357,6 +388,26 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
         """
         pass
 
+    def new_minion(self, player):
+        """
+        Creates the minion associated with this card with :meth:`create_minion`.  If the class sets
+        :attr:`shared_minion`, the first minion created for the class is kept, and every minion after that is a copy of
+        it which shares the definitions of its tags (see :meth:`hearthbreaker.game_objects.Minion.copy_template`).
+
+        :param hearthbreaker.game_objects.Player player: The player who the newly created minion will belong to.
+        :rtype: hearthbreaker.game_objects.Minion
+        """
+        card_class = type(self)
+        if not card_class.shared_minion:
+            return self.create_minion(player)
+        # Kept with the create_minion it came from, so that a class which is given a different create_minion (as some
+        # tests do) doesn't use a minion from the old one
+        template = card_class.__dict__.get("_minion_template")
+        if template is None or template[0] is not card_class.create_minion:
+            template = (card_class.create_minion, self.create_minion(player))
+            card_class._minion_template = template
+        return template[1].copy_template()
+
     @staticmethod
     def is_spell():
         return False
@@ -540,6 +591,9 @@ class WeaponCard(Card, metaclass=abc.ABCMeta):
     """
     Represents a :class:`Card` for creating a :class:`Weapon`
     """
+    #: Set on a class whose :meth:`create_weapon` makes the same weapon every time, as for
+    #: :attr:`MinionCard.shared_minion`
+    shared_weapon = False
 
     def __init__(self, name, mana, character_class, rarity, collectible=True, overload=0, battlecry=None, combo=None):
         """
@@ -570,7 +624,7 @@ class WeaponCard(Card, metaclass=abc.ABCMeta):
         :param hearthbreaker.engine.Game game: The game this weapon will be used in
         """
         super().use(player, game)
-        weapon = self.create_weapon(player)
+        weapon = self.new_weapon(player)
         weapon.card = self
         weapon.player = player
         weapon.game = game
@@ -589,6 +643,23 @@ class WeaponCard(Card, metaclass=abc.ABCMeta):
         """
         pass
 
+    def new_weapon(self, player):
+        """
+        Creates the weapon associated with this card with :meth:`create_weapon`, copying it from the first weapon
+        created for the class if the class sets :attr:`shared_weapon`, in the same way as :meth:`MinionCard.new_minion`.
+
+        :param hearthbreaker.game_objects.Player player: The player who will use the weapon
+        :rtype: hearthbreaker.game_objects.Weapon
+        """
+        card_class = type(self)
+        if not card_class.shared_weapon:
+            return self.create_weapon(player)
+        template = card_class.__dict__.get("_weapon_template")
+        if template is None or template[0] is not card_class.create_weapon:
+            template = (card_class.create_weapon, self.create_weapon(player))
+            card_class._weapon_template = template
+        return template[1].copy_template()
+
     @staticmethod
     def is_spell():
         return False
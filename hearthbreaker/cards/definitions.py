@@ -0,0 +1,240 @@
+"""
+Cards described as data rather than as Python classes.
+
+A card definition file (such as ``card_defs.json``) is a JSON list of cards, each giving a card's name, cost, class
+and rarity, its stats, and its tags in the same form as they are written to a replay.  :func:`load_cards` compiles
+the file into card classes, which can be used in the same way as the classes in :mod:`hearthbreaker.cards`, and
+:func:`register_cards` makes them available to :func:`hearthbreaker.engine.card_lookup`.
+
+Building the tags from JSON takes far longer than anything else about loading a file, so every tag is built only
+once, when the file is compiled.  The cards share these tags, copying only the ones which belong to their owner (see
+:meth:`hearthbreaker.tags.base.Tag.copy`).  The compiled definitions are also cached on disk under the hash of the
+file, so later loads of the same file don't have to build the tags at all.
+
+**Example**::
+
+    from hearthbreaker.cards.definitions import load_cards, register_cards
+
+    register_cards(load_cards("custom_cards.json"))
+"""
+import collections
+import hashlib
+import json
+import os
+import pickle
+import re
+
+from hearthbreaker.cards.base import MinionCard, WeaponCard
+from hearthbreaker.constants import CHARACTER_CLASS, MINION_TYPE, CARD_RARITY
+from hearthbreaker.game_objects import Minion, Weapon
+from hearthbreaker.tags.base import Battlecry, Choice, Deathrattle, Effect, Aura, Buff, copy_tags
+
+# Changed whenever the compiled definitions would no longer match those in older caches, such as when the attributes
+# of a tag are changed
+CACHE_VERSION = 1
+
+
+class CardDefinition:
+    """
+    A card from a definition file, with all of its tags built
+    """
+
+    def __init__(self, card_def):
+        """
+        Compiles the JSON description of a card
+
+        :param dict card_def: The description of the card, as found in a card definition file
+        """
+        #: Whether the card is a ``"minion"`` or a ``"weapon"``
+        self.type = card_def['type']
+        #: The name the card is looked up with
+        self.ref_name = card_def.get('ref_name', card_def['name'])
+        #: The name of the card's class, made from its ``ref_name`` in the same way as the classes in
+        #: :mod:`hearthbreaker.cards` are named
+        self.class_name = "".join(word[0].upper() + word[1:]
+                                  for word in re.sub("[:'.()-]", "", self.ref_name).split())
+        #: The arguments the card is created with, apart from the tags which belong to it
+        self.card_args = {
+            'name': card_def['name'],
+            'mana': card_def['mana'],
+            'character_class': CHARACTER_CLASS.from_str(card_def['character_class']),
+            'rarity': CARD_RARITY.from_str(card_def['rarity']),
+            'collectible': card_def.get('collectible', True),
+        }
+        if 'overload' in card_def:
+            self.card_args['overload'] = card_def['overload']
+        if 'combo' in card_def:
+            self.card_args['combo'] = Battlecry.from_json(**card_def['combo'])
+        #: The effects and buffs belonging to the card, which each card has its own copy of
+        self.card_tags = {}
+        #: The arguments the minion or weapon is created with, apart from the tags which belong to it
+        self.object_args = {'attack': card_def['attack']}
+        #: The effects, auras and buffs belonging to the minion or weapon, which each one has its own copy of
+        self.object_tags = {}
+        impl = card_def.get('impl', {})
+        if 'effects' in impl:
+            self.object_tags['effects'] = [Effect.from_json(**effect) for effect in impl['effects']]
+        if 'auras' in impl:
+            self.object_tags['auras'] = [Aura.from_json(**aura) for aura in impl['auras']]
+        if 'buffs' in impl:
+            self.object_tags['buffs'] = [Buff.from_json(**buff) for buff in impl['buffs']]
+
+        if self.type == 'minion':
+            self.card_args['ref_name'] = self.ref_name
+            if 'minion_type' in card_def:
+                self.card_args['minion_type'] = MINION_TYPE.from_str(card_def['minion_type'])
+            if 'battlecry' in card_def:
+                self.card_args['battlecry'] = tuple(Battlecry.from_json(**battlecry)
+                                                    for battlecry in card_def['battlecry'])
+            if 'choices' in card_def:
+                self.card_args['choices'] = [Choice.from_json(**choice) for choice in card_def['choices']]
+            if 'effects' in card_def:
+                self.card_tags['effects'] = [Effect.from_json(**effect) for effect in card_def['effects']]
+            if 'buffs' in card_def:
+                self.card_tags['buffs'] = [Buff.from_json(**buff) for buff in card_def['buffs']]
+            self.object_args['health'] = card_def['health']
+            if 'enrage' in card_def:
+                self.object_tags['enrage'] = [Aura.from_json(**enrage) for enrage in card_def['enrage']]
+            if 'deathrattle' in card_def:
+                self.object_tags['deathrattle'] = [Deathrattle.from_json(**deathrattle)
+                                                   for deathrattle in card_def['deathrattle']]
+        elif self.type == 'weapon':
+            if 'battlecry' in card_def:
+                self.card_args['battlecry'] = Battlecry.from_json(**card_def['battlecry'])
+            self.object_args['durability'] = card_def['durability']
+            if 'deathrattle' in card_def:
+                self.object_args['deathrattle'] = Deathrattle.from_json(**card_def['deathrattle'])
+        else:
+            raise ValueError("Unknown card type '{}' for {}".format(self.type, self.ref_name))
+
+    def make_class(self):
+        """
+        Creates the class of this card
+
+        :rtype: type
+        """
+        base = DefinedMinionCard if self.type == 'minion' else DefinedWeaponCard
+        return type(base)(self.class_name, (base,), {'definition': self, '__module__': __name__})
+
+
+class DefinedMinionCard(MinionCard):
+    """
+    The base class of minion cards compiled from a :class:`CardDefinition`
+    """
+    #: The definition of the card
+    definition = None
+    # The minion only depends on the definition, which every card of the class shares
+    shared_minion = True
+
+    def __init__(self):
+        definition = self.definition
+        tags = {name: copy_tags(tag_list) for name, tag_list in definition.card_tags.items()}
+        super().__init__(**dict(definition.card_args, **tags))
+
+    def create_minion(self, player):
+        definition = self.definition
+        args = definition.object_args
+        tags = {name: copy_tags(tag_list) for name, tag_list in definition.object_tags.items()}
+        return Minion(args['attack'], args['health'], **tags)
+
+
+class DefinedWeaponCard(WeaponCard):
+    """
+    The base class of weapon cards compiled from a :class:`CardDefinition`
+    """
+    #: The definition of the card
+    definition = None
+    # The weapon only depends on the definition, which every card of the class shares
+    shared_weapon = True
+
+    def __init__(self):
+        super().__init__(**self.definition.card_args)
+
+    def create_weapon(self, player):
+        definition = self.definition
+        args = definition.object_args
+        tags = {name: copy_tags(tag_list) for name, tag_list in definition.object_tags.items()}
+        return Weapon(args['attack'], args['durability'], args.get('deathrattle'), **tags)
+
+
+def compile_definitions(card_defs):
+    """
+    Compiles the descriptions of cards in a card definition file
+
+    :param list[dict] card_defs: The cards, as loaded from the file
+    :rtype: list[CardDefinition]
+    """
+    # Makes sure every kind of tag can be found by name
+    import hearthbreaker.tags.action
+    import hearthbreaker.tags.card_source
+    import hearthbreaker.tags.condition
+    import hearthbreaker.tags.event
+    import hearthbreaker.tags.selector
+    import hearthbreaker.tags.status
+
+    return [CardDefinition(card_def) for card_def in card_defs]
+
+
+def load_definitions(filename, cache_dir=None):
+    """
+    Loads the compiled descriptions of the cards in a card definition file, from the cache if the file has been
+    compiled before.
+
+    :param str filename: The card definition file to load
+    :param str cache_dir: The directory to keep compiled files in, or None to keep them in a ``__pycache__``
+                          directory next to the definition file.  If the cache can't be written to, the file is
+                          compiled every time it is loaded.
+    :rtype: list[CardDefinition]
+    """
+    with open(filename, "rb") as definition_file:
+        contents = definition_file.read()
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(filename)), "__pycache__")
+    digest = hashlib.sha1(contents).hexdigest()
+    cache_file = os.path.join(cache_dir, "{}.{}.{}.pickle".format(os.path.basename(filename), digest, CACHE_VERSION))
+    try:
+        with open(cache_file, "rb") as cached:
+            return pickle.load(cached)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError):
+        # Missing, or written by an older version of the tags
+        pass
+
+    definitions = compile_definitions(json.loads(contents.decode("utf-8")))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+        with open(temp_file, "wb") as cached:
+            pickle.dump(definitions, cached, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+    return definitions
+
+
+def load_cards(filename, cache_dir=None):
+    """
+    Compiles the cards in a card definition file into card classes.
+
+    :param str filename: The card definition file to load
+    :param str cache_dir: The directory to keep compiled files in, as for :func:`load_definitions`
+    :return: The class of each card, by its ``ref_name``, in the order they are in the file
+    :rtype: collections.OrderedDict
+    """
+    return collections.OrderedDict((definition.ref_name, definition.make_class())
+                                   for definition in load_definitions(filename, cache_dir))
+
+
+def register_cards(card_classes):
+    """
+    Makes cards available to :func:`hearthbreaker.engine.card_lookup`, replacing any cards with the same
+    ``ref_name``.
+
+    Registered cards can be looked up by name, for decks and replays, but aren't included when picking random cards
+    from the whole collection.
+
+    :param dict card_classes: The class of each card, by its ``ref_name``, as returned by :func:`load_cards`
+    """
+    import hearthbreaker.engine
+
+    for ref_name, card_class in card_classes.items():
+        hearthbreaker.engine.card_table[ref_name] = card_class()
@@ -0,0 +1,705 @@
+"""
+The module and class of every card, by the name it is looked up with.
+
+Generated by update_card_manifest.py.  Do not edit.
+"""
+CARDS = [
+    ("Ashbringer", "hearthbreaker.cards.minions.paladin", "Ashbringer"),
+    ("Blood Fury", "hearthbreaker.cards.weapons.warlock", "BloodFury"),
+    ("Battle Axe", "hearthbreaker.cards.minions.warrior", "BattleAxe"),
+    ("Light's Justice", "hearthbreaker.cards.weapons.paladin", "LightsJustice"),
+    ("Sword of Justice", "hearthbreaker.cards.weapons.paladin", "SwordOfJustice"),
+    ("Truesilver Champion", "hearthbreaker.cards.weapons.paladin", "TruesilverChampion"),
+    ("Coghammer", "hearthbreaker.cards.weapons.paladin", "Coghammer"),
+    ("Argent Lance", "hearthbreaker.cards.weapons.paladin", "ArgentLance"),
+    ("Eaglehorn Bow", "hearthbreaker.cards.weapons.hunter", "EaglehornBow"),
+    ("Gladiator's Longbow", "hearthbreaker.cards.weapons.hunter", "GladiatorsLongbow"),
+    ("Glaivezooka", "hearthbreaker.cards.weapons.hunter", "Glaivezooka"),
+    ("Wicked Knife", "hearthbreaker.cards.weapons.rogue", "WickedKnife"),
+    ("Assassin's Blade", "hearthbreaker.cards.weapons.rogue", "AssassinsBlade"),
+    ("Perdition's Blade", "hearthbreaker.cards.weapons.rogue", "PerditionsBlade"),
+    ("Cogmaster's Wrench", "hearthbreaker.cards.weapons.rogue", "CogmastersWrench"),
+    ("Doomhammer", "hearthbreaker.cards.weapons.shaman", "Doomhammer"),
+    ("Stormforged Axe", "hearthbreaker.cards.weapons.shaman", "StormforgedAxe"),
+    ("Powermace", "hearthbreaker.cards.weapons.shaman", "Powermace"),
+    ("Fiery War Axe", "hearthbreaker.cards.weapons.warrior", "FieryWarAxe"),
+    ("Arcanite Reaper", "hearthbreaker.cards.weapons.warrior", "ArcaniteReaper"),
+    ("Gorehowl", "hearthbreaker.cards.weapons.warrior", "Gorehowl"),
+    ("Heavy Axe", "hearthbreaker.cards.weapons.warrior", "HeavyAxe"),
+    ("Death's Bite", "hearthbreaker.cards.weapons.warrior", "DeathsBite"),
+    ("Ogre Warmaul", "hearthbreaker.cards.weapons.warrior", "OgreWarmaul"),
+    ("Bananas", "hearthbreaker.cards.minions.neutral", "Bananas"),
+    ("I Am Murloc", "hearthbreaker.cards.minions.neutral", "IAmMurloc"),
+    ("Power of the Horde", "hearthbreaker.cards.minions.neutral", "PowerOfTheHorde"),
+    ("Rogues Do It...", "hearthbreaker.cards.minions.neutral", "RoguesDoIt"),
+    ("Dream", "hearthbreaker.cards.minions.neutral", "Dream"),
+    ("Ysera Awakens", "hearthbreaker.cards.minions.neutral", "YseraAwakens"),
+    ("Nightmare", "hearthbreaker.cards.minions.neutral", "Nightmare"),
+    ("The Coin", "hearthbreaker.cards.spells.neutral", "TheCoin"),
+    ("Armor Plating", "hearthbreaker.cards.spells.neutral", "ArmorPlating"),
+    ("Emergency Coolant", "hearthbreaker.cards.spells.neutral", "EmergencyCoolant"),
+    ("Finicky Cloakfield", "hearthbreaker.cards.spells.neutral", "FinickyCloakfield"),
+    ("Reversing Switch", "hearthbreaker.cards.spells.neutral", "ReversingSwitch"),
+    ("Rusty Horn", "hearthbreaker.cards.spells.neutral", "RustyHorn"),
+    ("Time Rewinder", "hearthbreaker.cards.spells.neutral", "TimeRewinder"),
+    ("Whirling Blades", "hearthbreaker.cards.spells.neutral", "WhirlingBlades"),
+    ("Gallywix's Coin", "hearthbreaker.cards.spells.neutral", "GallywixsCoin"),
+    ("Battle Rage", "hearthbreaker.cards.spells.warrior", "BattleRage"),
+    ("Brawl", "hearthbreaker.cards.spells.warrior", "Brawl"),
+    ("Charge", "hearthbreaker.cards.spells.warrior", "Charge"),
+    ("Cleave", "hearthbreaker.cards.spells.warrior", "Cleave"),
+    ("Commanding Shout", "hearthbreaker.cards.spells.warrior", "CommandingShout"),
+    ("Execute", "hearthbreaker.cards.spells.warrior", "Execute"),
+    ("Heroic Strike", "hearthbreaker.cards.spells.warrior", "HeroicStrike"),
+    ("Inner Rage", "hearthbreaker.cards.spells.warrior", "InnerRage"),
+    ("Mortal Strike", "hearthbreaker.cards.spells.warrior", "MortalStrike"),
+    ("Rampage", "hearthbreaker.cards.spells.warrior", "Rampage"),
+    ("Shield Block", "hearthbreaker.cards.spells.warrior", "ShieldBlock"),
+    ("Shield Slam", "hearthbreaker.cards.spells.warrior", "ShieldSlam"),
+    ("Slam", "hearthbreaker.cards.spells.warrior", "Slam"),
+    ("Upgrade!", "hearthbreaker.cards.spells.warrior", "Upgrade"),
+    ("Whirlwind", "hearthbreaker.cards.spells.warrior", "Whirlwind"),
+    ("Bouncing Blade", "hearthbreaker.cards.spells.warrior", "BouncingBlade"),
+    ("Crush", "hearthbreaker.cards.spells.warrior", "Crush"),
+    ("Burrowing Mine", "hearthbreaker.cards.spells.warrior", "BurrowingMine"),
+    ("Revenge", "hearthbreaker.cards.spells.warrior", "Revenge"),
+    ("Innervate", "hearthbreaker.cards.spells.druid", "Innervate"),
+    ("Moonfire", "hearthbreaker.cards.spells.druid", "Moonfire"),
+    ("Claw", "hearthbreaker.cards.spells.druid", "Claw"),
+    ("Naturalize", "hearthbreaker.cards.spells.druid", "Naturalize"),
+    ("Savagery", "hearthbreaker.cards.spells.druid", "Savagery"),
+    ("Mark of the Wild", "hearthbreaker.cards.spells.druid", "MarkOfTheWild"),
+    ("Power of the Wild", "hearthbreaker.cards.spells.druid", "PowerOfTheWild"),
+    ("Wild Growth", "hearthbreaker.cards.spells.druid", "WildGrowth"),
+    ("Excess Mana", "hearthbreaker.cards.spells.druid", "ExcessMana"),
+    ("Wrath", "hearthbreaker.cards.spells.druid", "Wrath"),
+    ("Healing Touch", "hearthbreaker.cards.spells.druid", "HealingTouch"),
+    ("Mark of Nature", "hearthbreaker.cards.spells.druid", "MarkOfNature"),
+    ("Savage Roar", "hearthbreaker.cards.spells.druid", "SavageRoar"),
+    ("Bite", "hearthbreaker.cards.spells.druid", "Bite"),
+    ("Soul of the Forest", "hearthbreaker.cards.spells.druid", "SoulOfTheForest"),
+    ("Swipe", "hearthbreaker.cards.spells.druid", "Swipe"),
+    ("Nourish", "hearthbreaker.cards.spells.druid", "Nourish"),
+    ("Starfall", "hearthbreaker.cards.spells.druid", "Starfall"),
+    ("Force of Nature", "hearthbreaker.cards.spells.druid", "ForceOfNature"),
+    ("Starfire", "hearthbreaker.cards.spells.druid", "Starfire"),
+    ("Poison Seeds", "hearthbreaker.cards.spells.druid", "PoisonSeeds"),
+    ("Dark Wispers", "hearthbreaker.cards.spells.druid", "DarkWispers"),
+    ("Recycle", "hearthbreaker.cards.spells.druid", "Recycle"),
+    ("Tree of Life", "hearthbreaker.cards.spells.druid", "TreeOfLife"),
+    ("Astral Communion", "hearthbreaker.cards.spells.druid", "AstralCommunion"),
+    ("Hunter's Mark", "hearthbreaker.cards.spells.hunter", "HuntersMark"),
+    ("Arcane Shot", "hearthbreaker.cards.spells.hunter", "ArcaneShot"),
+    ("Bestial Wrath", "hearthbreaker.cards.spells.hunter", "BestialWrath"),
+    ("Flare", "hearthbreaker.cards.spells.hunter", "Flare"),
+    ("Tracking", "hearthbreaker.cards.spells.hunter", "Tracking"),
+    ("Deadly Shot", "hearthbreaker.cards.spells.hunter", "DeadlyShot"),
+    ("Multi-Shot", "hearthbreaker.cards.spells.hunter", "MultiShot"),
+    ("Explosive Shot", "hearthbreaker.cards.spells.hunter", "ExplosiveShot"),
+    ("Kill Command", "hearthbreaker.cards.spells.hunter", "KillCommand"),
+    ("Unleash the Hounds", "hearthbreaker.cards.spells.hunter", "UnleashTheHounds"),
+    ("Animal Companion", "hearthbreaker.cards.spells.hunter", "AnimalCompanion"),
+    ("Call Pet", "hearthbreaker.cards.spells.hunter", "CallPet"),
+    ("Cobra Shot", "hearthbreaker.cards.spells.hunter", "CobraShot"),
+    ("Feign Death", "hearthbreaker.cards.spells.hunter", "FeignDeath"),
+    ("Quick Shot", "hearthbreaker.cards.spells.hunter", "QuickShot"),
+    ("Powershot", "hearthbreaker.cards.spells.hunter", "Powershot"),
+    ("Arcane Missiles", "hearthbreaker.cards.spells.mage", "ArcaneMissiles"),
+    ("Ice Lance", "hearthbreaker.cards.spells.mage", "IceLance"),
+    ("Mirror Image", "hearthbreaker.cards.spells.mage", "MirrorImage"),
+    ("Arcane Explosion", "hearthbreaker.cards.spells.mage", "ArcaneExplosion"),
+    ("Frostbolt", "hearthbreaker.cards.spells.mage", "Frostbolt"),
+    ("Arcane Intellect", "hearthbreaker.cards.spells.mage", "ArcaneIntellect"),
+    ("Frost Nova", "hearthbreaker.cards.spells.mage", "FrostNova"),
+    ("Cone of Cold", "hearthbreaker.cards.spells.mage", "ConeOfCold"),
+    ("Fireball", "hearthbreaker.cards.spells.mage", "Fireball"),
+    ("Polymorph", "hearthbreaker.cards.spells.mage", "Polymorph"),
+    ("Blizzard", "hearthbreaker.cards.spells.mage", "Blizzard"),
+    ("Flamestrike", "hearthbreaker.cards.spells.mage", "Flamestrike"),
+    ("Pyroblast", "hearthbreaker.cards.spells.mage", "Pyroblast"),
+    ("Flamecannon", "hearthbreaker.cards.spells.mage", "Flamecannon"),
+    ("Echo of Medivh", "hearthbreaker.cards.spells.mage", "EchoOfMedivh"),
+    ("Unstable Portal", "hearthbreaker.cards.spells.mage", "UnstablePortal"),
+    ("Dragon's Breath", "hearthbreaker.cards.spells.mage", "DragonsBreath"),
+    ("Arcane Blast", "hearthbreaker.cards.spells.mage", "ArcaneBlast"),
+    ("Avenging Wrath", "hearthbreaker.cards.spells.paladin", "AvengingWrath"),
+    ("Blessed Champion", "hearthbreaker.cards.spells.paladin", "BlessedChampion"),
+    ("Blessing of Kings", "hearthbreaker.cards.spells.paladin", "BlessingOfKings"),
+    ("Blessing of Might", "hearthbreaker.cards.spells.paladin", "BlessingOfMight"),
+    ("Blessing of Wisdom", "hearthbreaker.cards.spells.paladin", "BlessingOfWisdom"),
+    ("Consecration", "hearthbreaker.cards.spells.paladin", "Consecration"),
+    ("Divine Favor", "hearthbreaker.cards.spells.paladin", "DivineFavor"),
+    ("Equality", "hearthbreaker.cards.spells.paladin", "Equality"),
+    ("Hammer of Wrath", "hearthbreaker.cards.spells.paladin", "HammerOfWrath"),
+    ("Hand of Protection", "hearthbreaker.cards.spells.paladin", "HandOfProtection"),
+    ("Holy Light", "hearthbreaker.cards.spells.paladin", "HolyLight"),
+    ("Holy Wrath", "hearthbreaker.cards.spells.paladin", "HolyWrath"),
+    ("Humility", "hearthbreaker.cards.spells.paladin", "Humility"),
+    ("Lay on Hands", "hearthbreaker.cards.spells.paladin", "LayOnHands"),
+    ("Seal of Light", "hearthbreaker.cards.spells.paladin", "SealOfLight"),
+    ("Muster for Battle", "hearthbreaker.cards.spells.paladin", "MusterForBattle"),
+    ("Solemn Vigil", "hearthbreaker.cards.spells.paladin", "SolemnVigil"),
+    ("Circle of Healing", "hearthbreaker.cards.spells.priest", "CircleOfHealing"),
+    ("Divine Spirit", "hearthbreaker.cards.spells.priest", "DivineSpirit"),
+    ("Holy Fire", "hearthbreaker.cards.spells.priest", "HolyFire"),
+    ("Holy Nova", "hearthbreaker.cards.spells.priest", "HolyNova"),
+    ("Holy Smite", "hearthbreaker.cards.spells.priest", "HolySmite"),
+    ("Inner Fire", "hearthbreaker.cards.spells.priest", "InnerFire"),
+    ("Mass Dispel", "hearthbreaker.cards.spells.priest", "MassDispel"),
+    ("Mind Blast", "hearthbreaker.cards.spells.priest", "MindBlast"),
+    ("Mind Control", "hearthbreaker.cards.spells.priest", "MindControl"),
+    ("Mind Vision", "hearthbreaker.cards.spells.priest", "MindVision"),
+    ("Mindgames", "hearthbreaker.cards.spells.priest", "Mindgames"),
+    ("Power Word: Shield", "hearthbreaker.cards.spells.priest", "PowerWordShield"),
+    ("Shadow Madness", "hearthbreaker.cards.spells.priest", "ShadowMadness"),
+    ("Shadow Word: Death", "hearthbreaker.cards.spells.priest", "ShadowWordDeath"),
+    ("Shadow Word: Pain", "hearthbreaker.cards.spells.priest", "ShadowWordPain"),
+    ("Shadowform", "hearthbreaker.cards.spells.priest", "Shadowform"),
+    ("Silence", "hearthbreaker.cards.spells.priest", "Silence"),
+    ("Thoughtsteal", "hearthbreaker.cards.spells.priest", "Thoughtsteal"),
+    ("Velen's Chosen", "hearthbreaker.cards.spells.priest", "VelensChosen"),
+    ("Lightbomb", "hearthbreaker.cards.spells.priest", "Lightbomb"),
+    ("Light of the Naaru", "hearthbreaker.cards.spells.priest", "LightOfTheNaaru"),
+    ("Resurrect", "hearthbreaker.cards.spells.priest", "Resurrect"),
+    ("Assassinate", "hearthbreaker.cards.spells.rogue", "Assassinate"),
+    ("Backstab", "hearthbreaker.cards.spells.rogue", "Backstab"),
+    ("Betrayal", "hearthbreaker.cards.spells.rogue", "Betrayal"),
+    ("Blade Flurry", "hearthbreaker.cards.spells.rogue", "BladeFlurry"),
+    ("Cold Blood", "hearthbreaker.cards.spells.rogue", "ColdBlood"),
+    ("Conceal", "hearthbreaker.cards.spells.rogue", "Conceal"),
+    ("Deadly Poison", "hearthbreaker.cards.spells.rogue", "DeadlyPoison"),
+    ("Eviscerate", "hearthbreaker.cards.spells.rogue", "Eviscerate"),
+    ("Fan of Knives", "hearthbreaker.cards.spells.rogue", "FanOfKnives"),
+    ("Headcrack", "hearthbreaker.cards.spells.rogue", "Headcrack"),
+    ("Preparation", "hearthbreaker.cards.spells.rogue", "Preparation"),
+    ("Sap", "hearthbreaker.cards.spells.rogue", "Sap"),
+    ("Shadowstep", "hearthbreaker.cards.spells.rogue", "Shadowstep"),
+    ("Shiv", "hearthbreaker.cards.spells.rogue", "Shiv"),
+    ("Sinister Strike", "hearthbreaker.cards.spells.rogue", "SinisterStrike"),
+    ("Sprint", "hearthbreaker.cards.spells.rogue", "Sprint"),
+    ("Vanish", "hearthbreaker.cards.spells.rogue", "Vanish"),
+    ("Tinker's Sharpsword Oil", "hearthbreaker.cards.spells.rogue", "TinkersSharpswordOil"),
+    ("Sabotage", "hearthbreaker.cards.spells.rogue", "Sabotage"),
+    ("Gang Up", "hearthbreaker.cards.spells.rogue", "GangUp"),
+    ("Ancestral Healing", "hearthbreaker.cards.spells.shaman", "AncestralHealing"),
+    ("Ancestral Spirit", "hearthbreaker.cards.spells.shaman", "AncestralSpirit"),
+    ("Bloodlust", "hearthbreaker.cards.spells.shaman", "Bloodlust"),
+    ("Earth Shock", "hearthbreaker.cards.spells.shaman", "EarthShock"),
+    ("Far Sight", "hearthbreaker.cards.spells.shaman", "FarSight"),
+    ("Feral Spirit", "hearthbreaker.cards.spells.shaman", "FeralSpirit"),
+    ("Forked Lightning", "hearthbreaker.cards.spells.shaman", "ForkedLightning"),
+    ("Frost Shock", "hearthbreaker.cards.spells.shaman", "FrostShock"),
+    ("Hex", "hearthbreaker.cards.spells.shaman", "Hex"),
+    ("Lava Burst", "hearthbreaker.cards.spells.shaman", "LavaBurst"),
+    ("Lightning Bolt", "hearthbreaker.cards.spells.shaman", "LightningBolt"),
+    ("Lightning Storm", "hearthbreaker.cards.spells.shaman", "LightningStorm"),
+    ("Rockbiter Weapon", "hearthbreaker.cards.spells.shaman", "RockbiterWeapon"),
+    ("Totemic Might", "hearthbreaker.cards.spells.shaman", "TotemicMight"),
+    ("Windfury", "hearthbreaker.cards.spells.shaman", "Windfury"),
+    ("Reincarnate", "hearthbreaker.cards.spells.shaman", "Reincarnate"),
+    ("Crackle", "hearthbreaker.cards.spells.shaman", "Crackle"),
+    ("Ancestor's Call", "hearthbreaker.cards.spells.shaman", "AncestorsCall"),
+    ("Lava Shock", "hearthbreaker.cards.spells.shaman", "LavaShock"),
+    ("Ancestral Knowledge", "hearthbreaker.cards.spells.shaman", "AncestralKnowledge"),
+    ("Mortal Coil", "hearthbreaker.cards.spells.warlock", "MortalCoil"),
+    ("Hellfire", "hearthbreaker.cards.spells.warlock", "Hellfire"),
+    ("Shadow Bolt", "hearthbreaker.cards.spells.warlock", "ShadowBolt"),
+    ("Drain Life", "hearthbreaker.cards.spells.warlock", "DrainLife"),
+    ("Soulfire", "hearthbreaker.cards.spells.warlock", "Soulfire"),
+    ("Twisting Nether", "hearthbreaker.cards.spells.warlock", "TwistingNether"),
+    ("Demonfire", "hearthbreaker.cards.spells.warlock", "Demonfire"),
+    ("Sacrificial Pact", "hearthbreaker.cards.spells.warlock", "SacrificialPact"),
+    ("Siphon Soul", "hearthbreaker.cards.spells.warlock", "SiphonSoul"),
+    ("Sense Demons", "hearthbreaker.cards.spells.warlock", "SenseDemons"),
+    ("Bane of Doom", "hearthbreaker.cards.spells.warlock", "BaneOfDoom"),
+    ("Shadowflame", "hearthbreaker.cards.spells.warlock", "Shadowflame"),
+    ("Corruption", "hearthbreaker.cards.spells.warlock", "Corruption"),
+    ("Power Overwhelming", "hearthbreaker.cards.spells.warlock", "PowerOverwhelming"),
+    ("Darkbomb", "hearthbreaker.cards.spells.warlock", "Darkbomb"),
+    ("Demonheart", "hearthbreaker.cards.spells.warlock", "Demonheart"),
+    ("Imp-losion", "hearthbreaker.cards.spells.warlock", "Implosion"),
+    ("Demonwrath", "hearthbreaker.cards.spells.warlock", "Demonwrath"),
+    ("Fist of Jaraxxus", "hearthbreaker.cards.spells.warlock", "FistOfJaraxxus"),
+    ("Bloodfen Raptor", "hearthbreaker.cards.minions.neutral", "BloodfenRaptor"),
+    ("Elven Archer", "hearthbreaker.cards.minions.neutral", "ElvenArcher"),
+    ("Novice Engineer", "hearthbreaker.cards.minions.neutral", "NoviceEngineer"),
+    ("Stonetusk Boar", "hearthbreaker.cards.minions.neutral", "StonetuskBoar"),
+    ("Ironbeak Owl", "hearthbreaker.cards.minions.neutral", "IronbeakOwl"),
+    ("War Golem", "hearthbreaker.cards.minions.neutral", "WarGolem"),
+    ("Mogu'shan Warden", "hearthbreaker.cards.minions.neutral", "MogushanWarden"),
+    ("Faerie Dragon", "hearthbreaker.cards.minions.neutral", "FaerieDragon"),
+    ("Kobold Geomancer", "hearthbreaker.cards.minions.neutral", "KoboldGeomancer"),
+    ("Argent Squire", "hearthbreaker.cards.minions.neutral", "ArgentSquire"),
+    ("Silvermoon Guardian", "hearthbreaker.cards.minions.neutral", "SilvermoonGuardian"),
+    ("Twilight Drake", "hearthbreaker.cards.minions.neutral", "TwilightDrake"),
+    ("Magma Rager", "hearthbreaker.cards.minions.neutral", "MagmaRager"),
+    ("Dire Wolf Alpha", "hearthbreaker.cards.minions.neutral", "DireWolfAlpha"),
+    ("Worgen Infiltrator", "hearthbreaker.cards.minions.neutral", "WorgenInfiltrator"),
+    ("Archmage", "hearthbreaker.cards.minions.neutral", "Archmage"),
+    ("Dalaran Mage", "hearthbreaker.cards.minions.neutral", "DalaranMage"),
+    ("Malygos", "hearthbreaker.cards.minions.neutral", "Malygos"),
+    ("Azure Drake", "hearthbreaker.cards.minions.neutral", "AzureDrake"),
+    ("Ogre Magi", "hearthbreaker.cards.minions.neutral", "OgreMagi"),
+    ("Spellbreaker", "hearthbreaker.cards.minions.neutral", "Spellbreaker"),
+    ("Bloodmage Thalnos", "hearthbreaker.cards.minions.neutral", "BloodmageThalnos"),
+    ("Loot Hoarder", "hearthbreaker.cards.minions.neutral", "LootHoarder"),
+    ("Leper Gnome", "hearthbreaker.cards.minions.neutral", "LeperGnome"),
+    ("Ironforge Rifleman", "hearthbreaker.cards.minions.neutral", "IronforgeRifleman"),
+    ("Gnomish Inventor", "hearthbreaker.cards.minions.neutral", "GnomishInventor"),
+    ("Goldshire Footman", "hearthbreaker.cards.minions.neutral", "GoldshireFootman"),
+    ("Frostwolf Grunt", "hearthbreaker.cards.minions.neutral", "FrostwolfGrunt"),
+    ("Ironfur Grizzly", "hearthbreaker.cards.minions.neutral", "IronfurGrizzly"),
+    ("Lord of the Arena", "hearthbreaker.cards.minions.neutral", "LordOfTheArena"),
+    ("Murloc Raider", "hearthbreaker.cards.minions.neutral", "MurlocRaider"),
+    ("Mana Addict", "hearthbreaker.cards.minions.neutral", "ManaAddict"),
+    ("Oasis Snapjaw", "hearthbreaker.cards.minions.neutral", "OasisSnapjaw"),
+    ("Reckless Rocketeer", "hearthbreaker.cards.minions.neutral", "RecklessRocketeer"),
+    ("River Crocolisk", "hearthbreaker.cards.minions.neutral", "RiverCrocolisk"),
+    ("Mud Alligator", "hearthbreaker.cards.minions.neutral", "MudAlligator"),
+    ("Sen'jin Shieldmasta", "hearthbreaker.cards.minions.neutral", "SenjinShieldmasta"),
+    ("Scarlet Crusader", "hearthbreaker.cards.minions.neutral", "ScarletCrusader"),
+    ("Shieldbearer", "hearthbreaker.cards.minions.neutral", "Shieldbearer"),
+    ("Silverback Patriarch", "hearthbreaker.cards.minions.neutral", "SilverbackPatriarch"),
+    ("Jungle Panther", "hearthbreaker.cards.minions.neutral", "JunglePanther"),
+    ("Ravenholdt Assassin", "hearthbreaker.cards.minions.neutral", "RavenholdtAssassin"),
+    ("Stormpike Commando", "hearthbreaker.cards.minions.neutral", "StormpikeCommando"),
+    ("Stormwind Knight", "hearthbreaker.cards.minions.neutral", "StormwindKnight"),
+    ("Stranglethorn Tiger", "hearthbreaker.cards.minions.neutral", "StranglethornTiger"),
+    ("Sunwalker", "hearthbreaker.cards.minions.neutral", "Sunwalker"),
+    ("Thrallmar Farseer", "hearthbreaker.cards.minions.neutral", "ThrallmarFarseer"),
+    ("Windfury Harpy", "hearthbreaker.cards.minions.neutral", "WindfuryHarpy"),
+    ("Young Dragonhawk", "hearthbreaker.cards.minions.neutral", "YoungDragonhawk"),
+    ("Wolfrider", "hearthbreaker.cards.minions.neutral", "Wolfrider"),
+    ("Booty Bay Bodyguard", "hearthbreaker.cards.minions.neutral", "BootyBayBodyguard"),
+    ("Boulderfist Ogre", "hearthbreaker.cards.minions.neutral", "BoulderfistOgre"),
+    ("Chillwind Yeti", "hearthbreaker.cards.minions.neutral", "ChillwindYeti"),
+    ("Hotwind Jinn", "hearthbreaker.cards.minions.neutral", "HotwindJinn"),
+    ("Core Hound", "hearthbreaker.cards.minions.neutral", "CoreHound"),
+    ("Voodoo Doctor", "hearthbreaker.cards.minions.neutral", "VoodooDoctor"),
+    ("Earthen Ring Farseer", "hearthbreaker.cards.minions.neutral", "EarthenRingFarseer"),
+    ("Arcane Golem", "hearthbreaker.cards.minions.neutral", "ArcaneGolem"),
+    ("Priestess of Elune", "hearthbreaker.cards.minions.neutral", "PriestessOfElune"),
+    ("Darkscale Healer", "hearthbreaker.cards.minions.neutral", "DarkscaleHealer"),
+    ("Argent Commander", "hearthbreaker.cards.minions.neutral", "ArgentCommander"),
+    ("Bluegill Warrior", "hearthbreaker.cards.minions.neutral", "BluegillWarrior"),
+    ("Wisp", "hearthbreaker.cards.minions.neutral", "Wisp"),
+    ("Nightblade", "hearthbreaker.cards.minions.neutral", "Nightblade"),
+    ("Shattered Sun Cleric", "hearthbreaker.cards.minions.neutral", "ShatteredSunCleric"),
+    ("The Black Knight", "hearthbreaker.cards.minions.neutral", "TheBlackKnight"),
+    ("Abusive Sergeant", "hearthbreaker.cards.minions.neutral", "AbusiveSergeant"),
+    ("Dark Iron Dwarf", "hearthbreaker.cards.minions.neutral", "DarkIronDwarf"),
+    ("Abomination", "hearthbreaker.cards.minions.neutral", "Abomination"),
+    ("Fen Creeper", "hearthbreaker.cards.minions.neutral", "FenCreeper"),
+    ("Venture Co. Mercenary", "hearthbreaker.cards.minions.neutral", "VentureCoMercenary"),
+    ("Amani Berserker", "hearthbreaker.cards.minions.neutral", "AmaniBerserker"),
+    ("Squire", "hearthbreaker.cards.minions.neutral", "Squire"),
+    ("Silver Hand Knight", "hearthbreaker.cards.minions.neutral", "SilverHandKnight"),
+    ("Stormwind Champion", "hearthbreaker.cards.minions.neutral", "StormwindChampion"),
+    ("Deathwing", "hearthbreaker.cards.minions.neutral", "Deathwing"),
+    ("Alexstrasza", "hearthbreaker.cards.minions.neutral", "Alexstrasza"),
+    ("Emperor Cobra", "hearthbreaker.cards.minions.neutral", "EmperorCobra"),
+    ("Crazed Alchemist", "hearthbreaker.cards.minions.neutral", "CrazedAlchemist"),
+    ("Acidic Swamp Ooze", "hearthbreaker.cards.minions.neutral", "AcidicSwampOoze"),
+    ("Ancient Brewmaster", "hearthbreaker.cards.minions.neutral", "AncientBrewmaster"),
+    ("Youthful Brewmaster", "hearthbreaker.cards.minions.neutral", "YouthfulBrewmaster"),
+    ("Baron Geddon", "hearthbreaker.cards.minions.neutral", "BaronGeddon"),
+    ("Angry Chicken", "hearthbreaker.cards.minions.neutral", "AngryChicken"),
+    ("Raging Worgen", "hearthbreaker.cards.minions.neutral", "RagingWorgen"),
+    ("Tauren Warrior", "hearthbreaker.cards.minions.neutral", "TaurenWarrior"),
+    ("Spiteful Smith", "hearthbreaker.cards.minions.neutral", "SpitefulSmith"),
+    ("Blood Knight", "hearthbreaker.cards.minions.neutral", "BloodKnight"),
+    ("Frostwolf Warlord", "hearthbreaker.cards.minions.neutral", "FrostwolfWarlord"),
+    ("Raid Leader", "hearthbreaker.cards.minions.neutral", "RaidLeader"),
+    ("Mechanical Dragonling", "hearthbreaker.cards.minions.neutral", "MechanicalDragonling"),
+    ("Dragonling Mechanic", "hearthbreaker.cards.minions.neutral", "DragonlingMechanic"),
+    ("Murloc Scout", "hearthbreaker.cards.minions.neutral", "MurlocScout"),
+    ("Murloc Tidehunter", "hearthbreaker.cards.minions.neutral", "MurlocTidehunter"),
+    ("Boar", "hearthbreaker.cards.minions.neutral", "Boar"),
+    ("Razorfen Hunter", "hearthbreaker.cards.minions.neutral", "RazorfenHunter"),
+    ("Knife Juggler", "hearthbreaker.cards.minions.neutral", "KnifeJuggler"),
+    ("Baine Bloodhoof", "hearthbreaker.cards.minions.neutral", "BaineBloodhoof"),
+    ("Cairne Bloodhoof", "hearthbreaker.cards.minions.neutral", "CairneBloodhoof"),
+    ("Damaged Golem", "hearthbreaker.cards.minions.neutral", "DamagedGolem"),
+    ("Harvest Golem", "hearthbreaker.cards.minions.neutral", "HarvestGolem"),
+    ("Finkle Einhorn", "hearthbreaker.cards.minions.neutral", "FinkleEinhorn"),
+    ("The Beast", "hearthbreaker.cards.minions.neutral", "TheBeast"),
+    ("Sylvanas Windrunner", "hearthbreaker.cards.minions.neutral", "SylvanasWindrunner"),
+    ("Stampeding Kodo", "hearthbreaker.cards.minions.neutral", "StampedingKodo"),
+    ("Frost Elemental", "hearthbreaker.cards.minions.neutral", "FrostElemental"),
+    ("Demolisher", "hearthbreaker.cards.minions.neutral", "Demolisher"),
+    ("Doomsayer", "hearthbreaker.cards.minions.neutral", "Doomsayer"),
+    ("Gruul", "hearthbreaker.cards.minions.neutral", "Gruul"),
+    ("Gnoll", "hearthbreaker.cards.minions.neutral", "Gnoll"),
+    ("Hogger", "hearthbreaker.cards.minions.neutral", "Hogger"),
+    ("Imp", "hearthbreaker.cards.minions.neutral", "Imp"),
+    ("Imp Master", "hearthbreaker.cards.minions.neutral", "ImpMaster"),
+    ("Injured Blademaster", "hearthbreaker.cards.minions.neutral", "InjuredBlademaster"),
+    ("Master Swordsmith", "hearthbreaker.cards.minions.neutral", "MasterSwordsmith"),
+    ("Nat Pagle", "hearthbreaker.cards.minions.neutral", "NatPagle"),
+    ("Nozdormu", "hearthbreaker.cards.minions.neutral", "Nozdormu"),
+    ("Ragnaros the Firelord", "hearthbreaker.cards.minions.neutral", "RagnarosTheFirelord"),
+    ("Ancient Watcher", "hearthbreaker.cards.minions.neutral", "AncientWatcher"),
+    ("Coldlight Oracle", "hearthbreaker.cards.minions.neutral", "ColdlightOracle"),
+    ("Coldlight Seer", "hearthbreaker.cards.minions.neutral", "ColdlightSeer"),
+    ("Grimscale Oracle", "hearthbreaker.cards.minions.neutral", "GrimscaleOracle"),
+    ("Murloc Warleader", "hearthbreaker.cards.minions.neutral", "MurlocWarleader"),
+    ("Big Game Hunter", "hearthbreaker.cards.minions.neutral", "BigGameHunter"),
+    ("Bloodsail Corsair", "hearthbreaker.cards.minions.neutral", "BloodsailCorsair"),
+    ("Bloodsail Raider", "hearthbreaker.cards.minions.neutral", "BloodsailRaider"),
+    ("Captain Greenskin", "hearthbreaker.cards.minions.neutral", "CaptainGreenskin"),
+    ("Hungry Crab", "hearthbreaker.cards.minions.neutral", "HungryCrab"),
+    ("Mad Bomber", "hearthbreaker.cards.minions.neutral", "MadBomber"),
+    ("Mana Wraith", "hearthbreaker.cards.minions.neutral", "ManaWraith"),
+    ("Mind Control Tech", "hearthbreaker.cards.minions.neutral", "MindControlTech"),
+    ("Murloc Tidecaller", "hearthbreaker.cards.minions.neutral", "MurlocTidecaller"),
+    ("Onyxia", "hearthbreaker.cards.minions.neutral", "Onyxia"),
+    ("Whelp", "hearthbreaker.cards.minions.neutral", "Whelp"),
+    ("Southsea Captain", "hearthbreaker.cards.minions.neutral", "SouthseaCaptain"),
+    ("Southsea Deckhand", "hearthbreaker.cards.minions.neutral", "SouthseaDeckhand"),
+    ("Young Priestess", "hearthbreaker.cards.minions.neutral", "YoungPriestess"),
+    ("Acolyte of Pain", "hearthbreaker.cards.minions.neutral", "AcolyteOfPain"),
+    ("Cult Master", "hearthbreaker.cards.minions.neutral", "CultMaster"),
+    ("Secretkeeper", "hearthbreaker.cards.minions.neutral", "Secretkeeper"),
+    ("Violet Apprentice", "hearthbreaker.cards.minions.neutral", "VioletApprentice"),
+    ("Violet Teacher", "hearthbreaker.cards.minions.neutral", "VioletTeacher"),
+    ("Gadgetzan Auctioneer", "hearthbreaker.cards.minions.neutral", "GadgetzanAuctioneer"),
+    ("Flame of Azzinoth", "hearthbreaker.cards.minions.neutral", "FlameOfAzzinoth"),
+    ("Illidan Stormrage", "hearthbreaker.cards.minions.neutral", "IllidanStormrage"),
+    ("Flesheating Ghoul", "hearthbreaker.cards.minions.neutral", "FlesheatingGhoul"),
+    ("Lightwarden", "hearthbreaker.cards.minions.neutral", "Lightwarden"),
+    ("Questing Adventurer", "hearthbreaker.cards.minions.neutral", "QuestingAdventurer"),
+    ("Gurubashi Berserker", "hearthbreaker.cards.minions.neutral", "GurubashiBerserker"),
+    ("Ancient Mage", "hearthbreaker.cards.minions.neutral", "AncientMage"),
+    ("Defender of Argus", "hearthbreaker.cards.minions.neutral", "DefenderOfArgus"),
+    ("Sunfury Protector", "hearthbreaker.cards.minions.neutral", "SunfuryProtector"),
+    ("Harrison Jones", "hearthbreaker.cards.minions.neutral", "HarrisonJones"),
+    ("King Mukla", "hearthbreaker.cards.minions.neutral", "KingMukla"),
+    ("Leeroy Jenkins", "hearthbreaker.cards.minions.neutral", "LeeroyJenkins"),
+    ("Mountain Giant", "hearthbreaker.cards.minions.neutral", "MountainGiant"),
+    ("Molten Giant", "hearthbreaker.cards.minions.neutral", "MoltenGiant"),
+    ("Sea Giant", "hearthbreaker.cards.minions.neutral", "SeaGiant"),
+    ("Dread Corsair", "hearthbreaker.cards.minions.neutral", "DreadCorsair"),
+    ("Captain's Parrot", "hearthbreaker.cards.minions.neutral", "CaptainsParrot"),
+    ("Tinkmaster Overspark", "hearthbreaker.cards.minions.neutral", "TinkmasterOverspark"),
+    ("Squirrel", "hearthbreaker.cards.minions.neutral", "Squirrel"),
+    ("Devilsaur", "hearthbreaker.cards.minions.neutral", "Devilsaur"),
+    ("Alarm-o-Bot", "hearthbreaker.cards.minions.neutral", "AlarmoBot"),
+    ("Elite Tauren Chieftain", "hearthbreaker.cards.minions.neutral", "EliteTaurenChieftain"),
+    ("Murloc", "hearthbreaker.cards.minions.neutral", "Murloc"),
+    ("Millhouse Manastorm", "hearthbreaker.cards.minions.neutral", "MillhouseManastorm"),
+    ("Pint-Sized Summoner", "hearthbreaker.cards.minions.neutral", "PintSizedSummoner"),
+    ("Old Murk-Eye", "hearthbreaker.cards.minions.neutral", "OldMurkEye"),
+    ("Laughing Sister", "hearthbreaker.cards.minions.neutral", "LaughingSister"),
+    ("Emerald Drake", "hearthbreaker.cards.minions.neutral", "EmeraldDrake"),
+    ("Ysera", "hearthbreaker.cards.minions.neutral", "Ysera"),
+    ("Chicken", "hearthbreaker.cards.minions.neutral", "Chicken"),
+    ("Gelbin Mekkatorque", "hearthbreaker.cards.minions.neutral", "GelbinMekkatorque"),
+    ("Emboldener 3000", "hearthbreaker.cards.minions.neutral", "Emboldener3000"),
+    ("Homing Chicken", "hearthbreaker.cards.minions.neutral", "HomingChicken"),
+    ("Poultryizer", "hearthbreaker.cards.minions.neutral", "Poultryizer"),
+    ("Repair Bot", "hearthbreaker.cards.minions.neutral", "RepairBot"),
+    ("Lorewalker Cho", "hearthbreaker.cards.minions.neutral", "LorewalkerCho"),
+    ("Wild Pyromancer", "hearthbreaker.cards.minions.neutral", "WildPyromancer"),
+    ("Faceless Manipulator", "hearthbreaker.cards.minions.neutral", "FacelessManipulator"),
+    ("Nerubian", "hearthbreaker.cards.minions.neutral", "Nerubian"),
+    ("Nerubian Egg", "hearthbreaker.cards.minions.neutral", "NerubianEgg"),
+    ("Maexxna", "hearthbreaker.cards.minions.neutral", "Maexxna"),
+    ("Spectral Spider", "hearthbreaker.cards.minions.neutral", "SpectralSpider"),
+    ("Haunted Creeper", "hearthbreaker.cards.minions.neutral", "HauntedCreeper"),
+    ("Nerub'ar Weblord", "hearthbreaker.cards.minions.neutral", "NerubarWeblord"),
+    ("Unstable Ghoul", "hearthbreaker.cards.minions.neutral", "UnstableGhoul"),
+    ("Loatheb", "hearthbreaker.cards.minions.neutral", "Loatheb"),
+    ("Stoneskin Gargoyle", "hearthbreaker.cards.minions.neutral", "StoneskinGargoyle"),
+    ("Slime", "hearthbreaker.cards.minions.neutral", "Slime"),
+    ("Sludge Belcher", "hearthbreaker.cards.minions.neutral", "SludgeBelcher"),
+    ("Baron Rivendare", "hearthbreaker.cards.minions.neutral", "BaronRivendare"),
+    ("Dancing Swords", "hearthbreaker.cards.minions.neutral", "DancingSwords"),
+    ("Deathlord", "hearthbreaker.cards.minions.neutral", "Deathlord"),
+    ("Spectral Knight", "hearthbreaker.cards.minions.neutral", "SpectralKnight"),
+    ("Undertaker", "hearthbreaker.cards.minions.neutral", "Undertaker"),
+    ("Wailing Soul", "hearthbreaker.cards.minions.neutral", "WailingSoul"),
+    ("Zombie Chow", "hearthbreaker.cards.minions.neutral", "ZombieChow"),
+    ("Thaddius", "hearthbreaker.cards.minions.neutral", "Thaddius"),
+    ("Feugen", "hearthbreaker.cards.minions.neutral", "Feugen"),
+    ("Stalagg", "hearthbreaker.cards.minions.neutral", "Stalagg"),
+    ("Mad Scientist", "hearthbreaker.cards.minions.neutral", "MadScientist"),
+    ("Echoing Ooze", "hearthbreaker.cards.minions.neutral", "EchoingOoze"),
+    ("Shade of Naxxramas", "hearthbreaker.cards.minions.neutral", "ShadeOfNaxxramas"),
+    ("Kel'Thuzad", "hearthbreaker.cards.minions.neutral", "KelThuzad"),
+    ("Piloted Shredder", "hearthbreaker.cards.minions.neutral", "PilotedShredder"),
+    ("Piloted Sky Golem", "hearthbreaker.cards.minions.neutral", "PilotedSkyGolem"),
+    ("Sneed's Old Shredder", "hearthbreaker.cards.minions.neutral", "SneedsOldShredder"),
+    ("Antique Healbot", "hearthbreaker.cards.minions.neutral", "AntiqueHealbot"),
+    ("Annoy-o-Tron", "hearthbreaker.cards.minions.neutral", "AnnoyoTron"),
+    ("Arcane Nullifier X-21", "hearthbreaker.cards.minions.neutral", "ArcaneNullifierX21"),
+    ("Blingtron 3000", "hearthbreaker.cards.minions.neutral", "Blingtron3000"),
+    ("Bomb Lobber", "hearthbreaker.cards.minions.neutral", "BombLobber"),
+    ("Burly Rockjaw Trogg", "hearthbreaker.cards.minions.neutral", "BurlyRockjawTrogg"),
+    ("Mechwarper", "hearthbreaker.cards.minions.neutral", "Mechwarper"),
+    ("Frog", "hearthbreaker.cards.minions.neutral", "Frog"),
+    ("Clockwork Giant", "hearthbreaker.cards.minions.neutral", "ClockworkGiant"),
+    ("Clockwork Gnome", "hearthbreaker.cards.minions.neutral", "ClockworkGnome"),
+    ("Boom Bot", "hearthbreaker.cards.minions.neutral", "BoomBot"),
+    ("Dr. Boom", "hearthbreaker.cards.minions.neutral", "DoctorBoom"),
+    ("Target Dummy", "hearthbreaker.cards.minions.neutral", "TargetDummy"),
+    ("Explosive Sheep", "hearthbreaker.cards.minions.neutral", "ExplosiveSheep"),
+    ("Puddlestomper", "hearthbreaker.cards.minions.neutral", "Puddlestomper"),
+    ("Micro Machine", "hearthbreaker.cards.minions.neutral", "MicroMachine"),
+    ("Mechanical Yeti", "hearthbreaker.cards.minions.neutral", "MechanicalYeti"),
+    ("Spider Tank", "hearthbreaker.cards.minions.neutral", "SpiderTank"),
+    ("Gilblin Stalker", "hearthbreaker.cards.minions.neutral", "GilblinStalker"),
+    ("Ship's Cannon", "hearthbreaker.cards.minions.neutral", "ShipsCannon"),
+    ("Ogre Brute", "hearthbreaker.cards.minions.neutral", "OgreBrute"),
+    ("Mogor the Ogre", "hearthbreaker.cards.minions.neutral", "MogorTheOgre"),
+    ("Toshley", "hearthbreaker.cards.minions.neutral", "Toshley"),
+    ("Force-Tank MAX", "hearthbreaker.cards.minions.neutral", "ForceTankMAX"),
+    ("Fel Reaver", "hearthbreaker.cards.minions.neutral", "FelReaver"),
+    ("Madder Bomber", "hearthbreaker.cards.minions.neutral", "MadderBomber"),
+    ("Gazlowe", "hearthbreaker.cards.minions.neutral", "Gazlowe"),
+    ("Mini-Mage", "hearthbreaker.cards.minions.neutral", "MiniMage"),
+    ("Salty Dog", "hearthbreaker.cards.minions.neutral", "SaltyDog"),
+    ("Gnomeregan Infantry", "hearthbreaker.cards.minions.neutral", "GnomereganInfantry"),
+    ("Flying Machine", "hearthbreaker.cards.minions.neutral", "FlyingMachine"),
+    ("Lost Tallstrider", "hearthbreaker.cards.minions.neutral", "LostTallstrider"),
+    ("Hemet Nesingwary", "hearthbreaker.cards.minions.neutral", "HemetNesingwary"),
+    ("Illuminator", "hearthbreaker.cards.minions.neutral", "Illuminator"),
+    ("Mekgineer Thermaplugg", "hearthbreaker.cards.minions.neutral", "MekgineerThermaplugg"),
+    ("Stonesplinter Trogg", "hearthbreaker.cards.minions.neutral", "StonesplinterTrogg"),
+    ("Troggzor the Earthinator", "hearthbreaker.cards.minions.neutral", "TroggzorTheEarthinator"),
+    ("Hobgoblin", "hearthbreaker.cards.minions.neutral", "Hobgoblin"),
+    ("Cogmaster", "hearthbreaker.cards.minions.neutral", "Cogmaster"),
+    ("Goblin Sapper", "hearthbreaker.cards.minions.neutral", "GoblinSapper"),
+    ("Tinkertown Technician", "hearthbreaker.cards.minions.neutral", "TinkertownTechnician"),
+    ("Junkbot", "hearthbreaker.cards.minions.neutral", "Junkbot"),
+    ("Jeeves", "hearthbreaker.cards.minions.neutral", "Jeeves"),
+    ("Lil' Exorcist", "hearthbreaker.cards.minions.neutral", "LilExorcist"),
+    ("Recombobulator", "hearthbreaker.cards.minions.neutral", "Recombobulator"),
+    ("Enhance-o Mechano", "hearthbreaker.cards.minions.neutral", "EnhanceoMechano"),
+    ("Foe Reaper 4000", "hearthbreaker.cards.minions.neutral", "FoeReaper4000"),
+    ("Kezan Mystic", "hearthbreaker.cards.minions.neutral", "KezanMystic"),
+    ("V-07-TR-0N", "hearthbreaker.cards.minions.neutral", "V07TR0N"),
+    ("Mimiron's Head", "hearthbreaker.cards.minions.neutral", "MimironsHead"),
+    ("Chicken (Gnomish Experimenter)", "hearthbreaker.cards.minions.neutral", "GnomishChicken"),
+    ("Gnomish Experimenter", "hearthbreaker.cards.minions.neutral", "GnomishExperimenter"),
+    ("Hungry Dragon", "hearthbreaker.cards.minions.neutral", "HungryDragon"),
+    ("Blackwing Technician", "hearthbreaker.cards.minions.neutral", "BlackwingTechnician"),
+    ("Grim Patron", "hearthbreaker.cards.minions.neutral", "GrimPatron"),
+    ("Emperor Thaurissan", "hearthbreaker.cards.minions.neutral", "EmperorThaurissan"),
+    ("Majordomo Executus", "hearthbreaker.cards.minions.neutral", "MajordomoExecutus"),
+    ("Volcanic Drake", "hearthbreaker.cards.minions.neutral", "VolcanicDrake"),
+    ("Blackwing Corruptor", "hearthbreaker.cards.minions.neutral", "BlackwingCorruptor"),
+    ("Drakonid Crusher", "hearthbreaker.cards.minions.neutral", "DrakonidCrusher"),
+    ("Black Whelp", "hearthbreaker.cards.minions.neutral", "BlackWhelp"),
+    ("Dragon Egg", "hearthbreaker.cards.minions.neutral", "DragonEgg"),
+    ("Chromaggus", "hearthbreaker.cards.minions.neutral", "Chromaggus"),
+    ("Dragonkin Sorcerer", "hearthbreaker.cards.minions.neutral", "DragonkinSorcerer"),
+    ("Rend Blackhand", "hearthbreaker.cards.minions.neutral", "RendBlackhand"),
+    ("Nefarian", "hearthbreaker.cards.minions.neutral", "Nefarian"),
+    ("Tournament Medic", "hearthbreaker.cards.minions.neutral", "TournamentMedic"),
+    ("Argent Horserider", "hearthbreaker.cards.minions.neutral", "ArgentHorserider"),
+    ("Argent Watchman", "hearthbreaker.cards.minions.neutral", "ArgentWatchman"),
+    ("Armored Warhorse", "hearthbreaker.cards.minions.neutral", "ArmoredWarhorse"),
+    ("Keeper of the Grove", "hearthbreaker.cards.minions.druid", "KeeperOfTheGrove"),
+    ("Druid of the Claw (cat)", "hearthbreaker.cards.minions.druid", "CatDruid"),
+    ("Druid of the Claw (bear)", "hearthbreaker.cards.minions.druid", "BearDruid"),
+    ("Druid of the Claw", "hearthbreaker.cards.minions.druid", "DruidOfTheClaw"),
+    ("Ancient of Lore", "hearthbreaker.cards.minions.druid", "AncientOfLore"),
+    ("Ancient of War", "hearthbreaker.cards.minions.druid", "AncientOfWar"),
+    ("Ironbark Protector", "hearthbreaker.cards.minions.druid", "IronbarkProtector"),
+    ("Treant (taunt)", "hearthbreaker.cards.minions.druid", "TauntTreant"),
+    ("Treant", "hearthbreaker.cards.minions.druid", "Treant"),
+    ("Treant (charge)", "hearthbreaker.cards.minions.druid", "ChargeTreant"),
+    ("Treant (poison seeds)", "hearthbreaker.cards.minions.druid", "PoisonSeedsTreant"),
+    ("Panther", "hearthbreaker.cards.minions.druid", "Panther"),
+    ("Cenarius", "hearthbreaker.cards.minions.druid", "Cenarius"),
+    ("Anodized Robo Cub", "hearthbreaker.cards.minions.druid", "AnodizedRoboCub"),
+    ("Mech-Bear-Cat", "hearthbreaker.cards.minions.druid", "MechBearCat"),
+    ("Druid of the Fang (cobra)", "hearthbreaker.cards.minions.druid", "CobraForm"),
+    ("Druid of the Fang", "hearthbreaker.cards.minions.druid", "DruidOfTheFang"),
+    ("Malorne", "hearthbreaker.cards.minions.druid", "Malorne"),
+    ("Grove Tender", "hearthbreaker.cards.minions.druid", "GroveTender"),
+    ("Druid of the Flame (cat)", "hearthbreaker.cards.minions.druid", "FlameCat"),
+    ("Druid of the Flame (bird)", "hearthbreaker.cards.minions.druid", "FlameBird"),
+    ("Druid of the Flame", "hearthbreaker.cards.minions.druid", "DruidOfTheFlame"),
+    ("Volcanic Lumberer", "hearthbreaker.cards.minions.druid", "VolcanicLumberer"),
+    ("Timber Wolf", "hearthbreaker.cards.minions.hunter", "TimberWolf"),
+    ("Hyena", "hearthbreaker.cards.minions.hunter", "Hyena"),
+    ("Savannah Highmane", "hearthbreaker.cards.minions.hunter", "SavannahHighmane"),
+    ("Houndmaster", "hearthbreaker.cards.minions.hunter", "Houndmaster"),
+    ("King Krush", "hearthbreaker.cards.minions.hunter", "KingKrush"),
+    ("Starving Buzzard", "hearthbreaker.cards.minions.hunter", "StarvingBuzzard"),
+    ("Tundra Rhino", "hearthbreaker.cards.minions.hunter", "TundraRhino"),
+    ("Scavenging Hyena", "hearthbreaker.cards.minions.hunter", "ScavengingHyena"),
+    ("Webspinner", "hearthbreaker.cards.minions.hunter", "Webspinner"),
+    ("Hound", "hearthbreaker.cards.minions.hunter", "Hound"),
+    ("Huffer", "hearthbreaker.cards.minions.hunter", "Huffer"),
+    ("Misha", "hearthbreaker.cards.minions.hunter", "Misha"),
+    ("Leokk", "hearthbreaker.cards.minions.hunter", "Leokk"),
+    ("Snake", "hearthbreaker.cards.minions.hunter", "Snake"),
+    ("Metaltooth Leaper", "hearthbreaker.cards.minions.hunter", "MetaltoothLeaper"),
+    ("King of Beasts", "hearthbreaker.cards.minions.hunter", "KingOfBeasts"),
+    ("Gahz'rilla", "hearthbreaker.cards.minions.hunter", "Gahzrilla"),
+    ("Steamwheedle Sniper", "hearthbreaker.cards.minions.hunter", "SteamwheedleSniper"),
+    ("Core Rager", "hearthbreaker.cards.minions.hunter", "CoreRager"),
+    ("Acidmaw", "hearthbreaker.cards.minions.hunter", "Acidmaw"),
+    ("Mana Wyrm", "hearthbreaker.cards.minions.mage", "ManaWyrm"),
+    ("Sorcerer's Apprentice", "hearthbreaker.cards.minions.mage", "SorcerersApprentice"),
+    ("Kirin Tor Mage", "hearthbreaker.cards.minions.mage", "KirinTorMage"),
+    ("Ethereal Arcanist", "hearthbreaker.cards.minions.mage", "EtherealArcanist"),
+    ("Sheep", "hearthbreaker.cards.minions.mage", "Sheep"),
+    ("Water Elemental", "hearthbreaker.cards.minions.mage", "WaterElemental"),
+    ("Archmage Antonidas", "hearthbreaker.cards.minions.mage", "ArchmageAntonidas"),
+    ("Snowchugger", "hearthbreaker.cards.minions.mage", "Snowchugger"),
+    ("Spellbender (minion)", "hearthbreaker.cards.minions.mage", "SpellbenderMinion"),
+    ("Mirror Image (minion)", "hearthbreaker.cards.minions.mage", "MirrorImageMinion"),
+    ("Goblin Blastmage", "hearthbreaker.cards.minions.mage", "GoblinBlastmage"),
+    ("Soot Spewer", "hearthbreaker.cards.minions.mage", "SootSpewer"),
+    ("Wee Spellstopper", "hearthbreaker.cards.minions.mage", "WeeSpellstopper"),
+    ("Flame Leviathan", "hearthbreaker.cards.minions.mage", "FlameLeviathan"),
+    ("Flamewaker", "hearthbreaker.cards.minions.mage", "Flamewaker"),
+    ("Aldor Peacekeeper", "hearthbreaker.cards.minions.paladin", "AldorPeacekeeper"),
+    ("Argent Protector", "hearthbreaker.cards.minions.paladin", "ArgentProtector"),
+    ("Defender", "hearthbreaker.cards.minions.paladin", "DefenderMinion"),
+    ("Guardian of Kings", "hearthbreaker.cards.minions.paladin", "GuardianOfKings"),
+    ("Tirion Fordring", "hearthbreaker.cards.minions.paladin", "TirionFordring"),
+    ("Cobalt Guardian", "hearthbreaker.cards.minions.paladin", "CobaltGuardian"),
+    ("Silver Hand Recruit", "hearthbreaker.cards.minions.paladin", "SilverHandRecruit"),
+    ("Shielded Minibot", "hearthbreaker.cards.minions.paladin", "ShieldedMinibot"),
+    ("Quartermaster", "hearthbreaker.cards.minions.paladin", "Quartermaster"),
+    ("Scarlet Purifier", "hearthbreaker.cards.minions.paladin", "ScarletPurifier"),
+    ("Bolvar Fordragon", "hearthbreaker.cards.minions.paladin", "BolvarFordragon"),
+    ("Dragon Consort", "hearthbreaker.cards.minions.paladin", "DragonConsort"),
+    ("Auchenai Soulpriest", "hearthbreaker.cards.minions.priest", "AuchenaiSoulpriest"),
+    ("Cabal Shadow Priest", "hearthbreaker.cards.minions.priest", "CabalShadowPriest"),
+    ("Lightspawn", "hearthbreaker.cards.minions.priest", "Lightspawn"),
+    ("Lightwell", "hearthbreaker.cards.minions.priest", "Lightwell"),
+    ("Northshire Cleric", "hearthbreaker.cards.minions.priest", "NorthshireCleric"),
+    ("Prophet Velen", "hearthbreaker.cards.minions.priest", "ProphetVelen"),
+    ("Temple Enforcer", "hearthbreaker.cards.minions.priest", "TempleEnforcer"),
+    ("Shadow of Nothing", "hearthbreaker.cards.minions.priest", "ShadowOfNothing"),
+    ("Dark Cultist", "hearthbreaker.cards.minions.priest", "DarkCultist"),
+    ("Shrinkmeister", "hearthbreaker.cards.minions.priest", "Shrinkmeister"),
+    ("Upgraded Repair Bot", "hearthbreaker.cards.minions.priest", "UpgradedRepairBot"),
+    ("Shadowbomber", "hearthbreaker.cards.minions.priest", "Shadowbomber"),
+    ("Shadowboxer", "hearthbreaker.cards.minions.priest", "Shadowboxer"),
+    ("Vol'jin", "hearthbreaker.cards.minions.priest", "Voljin"),
+    ("Twilight Whelp", "hearthbreaker.cards.minions.priest", "TwilightWhelp"),
+    ("Defias Bandit", "hearthbreaker.cards.minions.rogue", "DefiasBandit"),
+    ("Defias Ringleader", "hearthbreaker.cards.minions.rogue", "DefiasRingleader"),
+    ("Edwin VanCleef", "hearthbreaker.cards.minions.rogue", "EdwinVanCleef"),
+    ("Kidnapper", "hearthbreaker.cards.minions.rogue", "Kidnapper"),
+    ("Master of Disguise", "hearthbreaker.cards.minions.rogue", "MasterOfDisguise"),
+    ("Patient Assassin", "hearthbreaker.cards.minions.rogue", "PatientAssassin"),
+    ("SI:7 Agent", "hearthbreaker.cards.minions.rogue", "SI7Agent"),
+    ("Anub'ar Ambusher", "hearthbreaker.cards.minions.rogue", "AnubarAmbusher"),
+    ("One-eyed Cheat", "hearthbreaker.cards.minions.rogue", "OneeyedCheat"),
+    ("Iron Sensei", "hearthbreaker.cards.minions.rogue", "IronSensei"),
+    ("Ogre Ninja", "hearthbreaker.cards.minions.rogue", "OgreNinja"),
+    ("Trade Prince Gallywix", "hearthbreaker.cards.minions.rogue", "TradePrinceGallywix"),
+    ("Goblin Auto-Barber", "hearthbreaker.cards.minions.rogue", "GoblinAutoBarber"),
+    ("Dark Iron Skulker", "hearthbreaker.cards.minions.rogue", "DarkIronSkulker"),
+    ("Anub'arak", "hearthbreaker.cards.minions.rogue", "Anubarak"),
+    ("Al'Akir the Windlord", "hearthbreaker.cards.minions.shaman", "AlAkirTheWindlord"),
+    ("Dust Devil", "hearthbreaker.cards.minions.shaman", "DustDevil"),
+    ("Earth Elemental", "hearthbreaker.cards.minions.shaman", "EarthElemental"),
+    ("Fire Elemental", "hearthbreaker.cards.minions.shaman", "FireElemental"),
+    ("Flametongue Totem", "hearthbreaker.cards.minions.shaman", "FlametongueTotem"),
+    ("Mana Tide Totem", "hearthbreaker.cards.minions.shaman", "ManaTideTotem"),
+    ("Unbound Elemental", "hearthbreaker.cards.minions.shaman", "UnboundElemental"),
+    ("Windspeaker", "hearthbreaker.cards.minions.shaman", "Windspeaker"),
+    ("Healing Totem", "hearthbreaker.cards.minions.shaman", "HealingTotem"),
+    ("Searing Totem", "hearthbreaker.cards.minions.shaman", "SearingTotem"),
+    ("Stoneclaw Totem", "hearthbreaker.cards.minions.shaman", "StoneclawTotem"),
+    ("Wrath of Air Totem", "hearthbreaker.cards.minions.shaman", "WrathOfAirTotem"),
+    ("Spirit Wolf", "hearthbreaker.cards.minions.shaman", "SpiritWolf"),
+    ("Vitality Totem", "hearthbreaker.cards.minions.shaman", "VitalityTotem"),
+    ("Siltfin Spiritwalker", "hearthbreaker.cards.minions.shaman", "SiltfinSpiritwalker"),
+    ("Whirling Zap-o-matic", "hearthbreaker.cards.minions.shaman", "WhirlingZapomatic"),
+    ("Dunemaul Shaman", "hearthbreaker.cards.minions.shaman", "DunemaulShaman"),
+    ("Neptulon", "hearthbreaker.cards.minions.shaman", "Neptulon"),
+    ("Fireguard Destroyer", "hearthbreaker.cards.minions.shaman", "FireguardDestroyer"),
+    ("Flame Imp", "hearthbreaker.cards.minions.warlock", "FlameImp"),
+    ("Pit Lord", "hearthbreaker.cards.minions.warlock", "PitLord"),
+    ("Voidwalker", "hearthbreaker.cards.minions.warlock", "Voidwalker"),
+    ("Dread Infernal", "hearthbreaker.cards.minions.warlock", "DreadInfernal"),
+    ("Felguard", "hearthbreaker.cards.minions.warlock", "Felguard"),
+    ("Doomguard", "hearthbreaker.cards.minions.warlock", "Doomguard"),
+    ("Succubus", "hearthbreaker.cards.minions.warlock", "Succubus"),
+    ("Summoning Portal", "hearthbreaker.cards.minions.warlock", "SummoningPortal"),
+    ("Blood Imp", "hearthbreaker.cards.minions.warlock", "BloodImp"),
+    ("Lord Jaraxxus", "hearthbreaker.cards.minions.warlock", "LordJaraxxus"),
+    ("Infernal", "hearthbreaker.cards.minions.warlock", "Infernal"),
+    ("Void Terror", "hearthbreaker.cards.minions.warlock", "VoidTerror"),
+    ("Voidcaller", "hearthbreaker.cards.minions.warlock", "Voidcaller"),
+    ("Anima Golem", "hearthbreaker.cards.minions.warlock", "AnimaGolem"),
+    ("Imp (warlock)", "hearthbreaker.cards.minions.warlock", "Imp"),
+    ("Worthless Imp", "hearthbreaker.cards.minions.warlock", "WorthlessImp"),
+    ("Fel Cannon", "hearthbreaker.cards.minions.warlock", "FelCannon"),
+    ("Mal'Ganis", "hearthbreaker.cards.minions.warlock", "MalGanis"),
+    ("Floating Watcher", "hearthbreaker.cards.minions.warlock", "FloatingWatcher"),
+    ("Mistress of Pain", "hearthbreaker.cards.minions.warlock", "MistressOfPain"),
+    ("Imp Gang Boss", "hearthbreaker.cards.minions.warlock", "ImpGangBoss"),
+    ("Arathi Weaponsmith", "hearthbreaker.cards.minions.warrior", "ArathiWeaponsmith"),
+    ("Armorsmith", "hearthbreaker.cards.minions.warrior", "Armorsmith"),
+    ("Cruel Taskmaster", "hearthbreaker.cards.minions.warrior", "CruelTaskmaster"),
+    ("Frothing Berserker", "hearthbreaker.cards.minions.warrior", "FrothingBerserker"),
+    ("Grommash Hellscream", "hearthbreaker.cards.minions.warrior", "GrommashHellscream"),
+    ("Kor'kron Elite", "hearthbreaker.cards.minions.warrior", "KorkronElite"),
+    ("Warsong Commander", "hearthbreaker.cards.minions.warrior", "WarsongCommander"),
+    ("Warbot", "hearthbreaker.cards.minions.warrior", "Warbot"),
+    ("Shieldmaiden", "hearthbreaker.cards.minions.warrior", "Shieldmaiden"),
+    ("Siege Engine", "hearthbreaker.cards.minions.warrior", "SiegeEngine"),
+    ("Iron Juggernaut", "hearthbreaker.cards.minions.warrior", "IronJuggernaut"),
+    ("Screwjank Clunker", "hearthbreaker.cards.minions.warrior", "ScrewjankClunker"),
+    ("Axe Flinger", "hearthbreaker.cards.minions.warrior", "AxeFlinger"),
+    ("Alexstrasza's Champion", "hearthbreaker.cards.minions.warrior", "AlexstraszasChampion"),
+    ("Explosive Trap", "hearthbreaker.cards.spells.hunter", "ExplosiveTrap"),
+    ("Freezing Trap", "hearthbreaker.cards.spells.hunter", "FreezingTrap"),
+    ("Misdirection", "hearthbreaker.cards.spells.hunter", "Misdirection"),
+    ("Snipe", "hearthbreaker.cards.spells.hunter", "Snipe"),
+    ("Snake Trap", "hearthbreaker.cards.spells.hunter", "SnakeTrap"),
+    ("Bear Trap", "hearthbreaker.cards.spells.hunter", "BearTrap"),
+    ("Counterspell", "hearthbreaker.cards.spells.mage", "Counterspell"),
+    ("Ice Barrier", "hearthbreaker.cards.spells.mage", "IceBarrier"),
+    ("Mirror Entity", "hearthbreaker.cards.spells.mage", "MirrorEntity"),
+    ("Spellbender", "hearthbreaker.cards.spells.mage", "Spellbender"),
+    ("Vaporize", "hearthbreaker.cards.spells.mage", "Vaporize"),
+    ("Ice Block", "hearthbreaker.cards.spells.mage", "IceBlock"),
+    ("Duplicate", "hearthbreaker.cards.spells.mage", "Duplicate"),
+    ("Avenge", "hearthbreaker.cards.spells.paladin", "Avenge"),
+    ("Eye for an Eye", "hearthbreaker.cards.spells.paladin", "EyeForAnEye"),
+    ("Noble Sacrifice", "hearthbreaker.cards.spells.paladin", "NobleSacrifice"),
+    ("Redemption", "hearthbreaker.cards.spells.paladin", "Redemption"),
+    ("Repentance", "hearthbreaker.cards.spells.paladin", "Repentance"),
+    ("moonfire_keeper", "hearthbreaker.cards.minions.druid", "Moonfire"),
+    ("Dispel", "hearthbreaker.cards.minions.druid", "Dispel"),
+    ("Cat Form", "hearthbreaker.cards.minions.druid", "CatForm"),
+    ("Bear Form", "hearthbreaker.cards.minions.druid", "BearForm"),
+    ("Ancient Secrets", "hearthbreaker.cards.minions.druid", "AncientSecrets"),
+    ("Ancient Teachings", "hearthbreaker.cards.minions.druid", "AncientTeachings"),
+    ("Rooted", "hearthbreaker.cards.minions.druid", "Health"),
+    ("Uproot", "hearthbreaker.cards.minions.druid", "Attack"),
+    ("Give your other minions +2/+2 and taunt", "hearthbreaker.cards.minions.druid", "IncreaseStats"),
+    ("Summon two 2/2 Treants with taunt", "hearthbreaker.cards.minions.druid", "SummonTreants"),
+    ("Attack Mode", "hearthbreaker.cards.minions.druid", "AttackMode"),
+    ("Tank Mode", "hearthbreaker.cards.minions.druid", "TankMode"),
+    ("Gift of Mana", "hearthbreaker.cards.minions.druid", "GiftOfMana"),
+    ("Gift of Cards", "hearthbreaker.cards.minions.druid", "GiftOfCards"),
+    ("Flame Cat Form", "hearthbreaker.cards.minions.druid", "FlameCatForm"),
+    ("Flame Bird Form", "hearthbreaker.cards.minions.druid", "FlameBirdForm"),
+    ("Leader of the Pack", "hearthbreaker.cards.spells.druid", "LeaderOfThePack"),
+    ("Summon a Panther", "hearthbreaker.cards.spells.druid", "SummonPanther"),
+    ("Do two damage to all enemy minions", "hearthbreaker.cards.spells.druid", "DamageAll"),
+    ("Do five damage to an enemy minion", "hearthbreaker.cards.spells.druid", "DamageOne"),
+    ("Malfurion Stormrage", "hearthbreaker.cards.heroes", "Malfurion"),
+    ("Rexxar", "hearthbreaker.cards.heroes", "Rexxar"),
+    ("Jaina Proudmoore", "hearthbreaker.cards.heroes", "Jaina"),
+    ("Uther the Lightbringer", "hearthbreaker.cards.heroes", "Uther"),
+    ("Anduin Wrynn", "hearthbreaker.cards.heroes", "Anduin"),
+    ("Valeera Sanguinar", "hearthbreaker.cards.heroes", "Valeera"),
+    ("Thrall", "hearthbreaker.cards.heroes", "Thrall"),
+    ("Gul'dan", "hearthbreaker.cards.heroes", "Guldan"),
+    ("Garrosh Hellscream", "hearthbreaker.cards.heroes", "Garrosh"),
+    ("Lord Jarraxus (hero)", "hearthbreaker.cards.heroes", "Jaraxxus"),
+    ("Ragnaros the Firelord (hero)", "hearthbreaker.cards.heroes", "Ragnaros"),
+]
@@ -1,414 +1,409 @@
-from hearthbreaker.cards.minions.neutral import (
-    BloodfenRaptor,
-    IronbeakOwl,
-    NoviceEngineer,
-    StonetuskBoar,
-    WarGolem,
-    MogushanWarden,
-    FaerieDragon,
-    KoboldGeomancer,
-    ElvenArcher,
-    ArgentSquire,
-    SilvermoonGuardian,
-    TwilightDrake,
-    MagmaRager,
-    DireWolfAlpha,
-    WorgenInfiltrator,
-    Archmage,
-    DalaranMage,
-    Malygos,
-    AzureDrake,
-    OgreMagi,
-    Spellbreaker,
-    BloodmageThalnos,
-    LootHoarder,
-    LeperGnome,
-    IronforgeRifleman,
-    GnomishInventor,
-    GoldshireFootman,
-    FrostwolfGrunt,
-    IronfurGrizzly,
-    LordOfTheArena,
-    MurlocRaider,
-    ManaAddict,
-    OasisSnapjaw,
-    RecklessRocketeer,
-    RiverCrocolisk,
-    MudAlligator,
-    SenjinShieldmasta,
-    ScarletCrusader,
-    Shieldbearer,
-    SilverbackPatriarch,
-    JunglePanther,
-    RavenholdtAssassin,
-    StormpikeCommando,
-    StormwindKnight,
-    StranglethornTiger,
-    Sunwalker,
-    ThrallmarFarseer,
-    WindfuryHarpy,
-    YoungDragonhawk,
-    Wolfrider,
-    BootyBayBodyguard,
-    BoulderfistOgre,
-    ChillwindYeti,
-    HotwindJinn,
-    CoreHound,
-    VoodooDoctor,
-    EarthenRingFarseer,
-    ArcaneGolem,
-    PriestessOfElune,
-    DarkscaleHealer,
-    ArgentCommander,
-    BluegillWarrior,
-    Wisp,
-    Nightblade,
-    ShatteredSunCleric,
-    TheBlackKnight,
-    AbusiveSergeant,
-    DarkIronDwarf,
-    Abomination,
-    AmaniBerserker,
-    SilverHandKnight,
-    FenCreeper,
-    VentureCoMercenary,
-    StormwindChampion,
-    Deathwing,
-    Alexstrasza,
-    EmperorCobra,
-    CrazedAlchemist,
-    AcidicSwampOoze,
-    AncientBrewmaster,
-    YouthfulBrewmaster,
-    BaronGeddon,
-    AngryChicken,
-    RagingWorgen,
-    TaurenWarrior,
-    SpitefulSmith,
-    BloodKnight,
-    FrostwolfWarlord,
-    RaidLeader,
-    DragonlingMechanic,
-    MurlocTidehunter,
-    RazorfenHunter,
-    KnifeJuggler,
-    CairneBloodhoof,
-    HarvestGolem,
-    TheBeast,
-    SylvanasWindrunner,
-    StampedingKodo,
-    FrostElemental,
-    Demolisher,
-    Doomsayer,
-    Gruul,
-    Hogger,
-    ImpMaster,
-    InjuredBlademaster,
-    MasterSwordsmith,
-    NatPagle,
-    Nozdormu,
-    RagnarosTheFirelord,
-    ColdlightOracle,
-    ColdlightSeer,
-    GrimscaleOracle,
-    MurlocWarleader,
-    AncientWatcher,
-    BigGameHunter,
-    BloodsailCorsair,
-    BloodsailRaider,
-    CaptainGreenskin,
-    HungryCrab,
-    MadBomber,
-    ManaWraith,
-    MindControlTech,
-    MurlocTidecaller,
-    Onyxia,
-    SouthseaCaptain,
-    SouthseaDeckhand,
-    YoungPriestess,
-    AcolyteOfPain,
-    CultMaster,
-    Secretkeeper,
-    VioletTeacher,
-    GadgetzanAuctioneer,
-    IllidanStormrage,
-    Lightwarden,
-    FlesheatingGhoul,
-    QuestingAdventurer,
-    GurubashiBerserker,
-    AncientMage,
-    DefenderOfArgus,
-    SunfuryProtector,
-    HarrisonJones,
-    KingMukla,
-    LeeroyJenkins,
-    SeaGiant,
-    MoltenGiant,
-    MountainGiant,
-    DreadCorsair,
-    CaptainsParrot,
-    TinkmasterOverspark,
-    AlarmoBot,
-    EliteTaurenChieftain,
-    MillhouseManastorm,
-    PintSizedSummoner,
-    OldMurkEye,
-    Ysera,
-    GelbinMekkatorque,
-    LorewalkerCho,
-    WildPyromancer,
-    FacelessManipulator,
-    NerubianEgg,
-    Maexxna,
-    HauntedCreeper,
-    NerubarWeblord,
-    UnstableGhoul,
-    Loatheb,
-    StoneskinGargoyle,
-    SludgeBelcher,
-    BaronRivendare,
-    DancingSwords,
-    Deathlord,
-    SpectralKnight,
-    Undertaker,
-    WailingSoul,
-    ZombieChow,
-    Feugen,
-    Stalagg,
-    MadScientist,
-    EchoingOoze,
-    ShadeOfNaxxramas,
-    KelThuzad,
-    PilotedShredder,
-    PilotedSkyGolem,
-    SneedsOldShredder,
-    AntiqueHealbot,
-    AnnoyoTron,
-    ArcaneNullifierX21,
-    Blingtron3000,
-    BombLobber,
-    BurlyRockjawTrogg,
-    Mechwarper,
-    Frog,
-    ClockworkGiant,
-    ClockworkGnome,
-    BoomBot,
-    DoctorBoom,
-    TargetDummy,
-    ExplosiveSheep,
-    Puddlestomper,
-    MicroMachine,
-    MechanicalYeti,
-    SpiderTank,
-    GilblinStalker,
-    ShipsCannon,
-    OgreBrute,
-    MogorTheOgre,
-    Toshley,
-    ForceTankMAX,
-    FelReaver,
-    MadderBomber,
-    Gazlowe,
-    MiniMage,
-    SaltyDog,
-    GnomereganInfantry,
-    FlyingMachine,
-    LostTallstrider,
-    HemetNesingwary,
-    Illuminator,
-    MekgineerThermaplugg,
-    StonesplinterTrogg,
-    TroggzorTheEarthinator,
-    Hobgoblin,
-    Cogmaster,
-    GoblinSapper,
-    TinkertownTechnician,
-    Junkbot,
-    Jeeves,
-    Recombobulator,
-    LilExorcist,
-    EnhanceoMechano,
-    FoeReaper4000,
-    KezanMystic,
-    MimironsHead,
-    GnomishExperimenter,
-    HungryDragon,
-    GrimPatron,
-    BlackwingTechnician,
-    EmperorThaurissan,
-    MajordomoExecutus,
-    VolcanicDrake,
-    BlackwingCorruptor,
-    DrakonidCrusher,
-    DragonEgg,
-    Chromaggus,
-    DragonkinSorcerer,
-    RendBlackhand,
-    Nefarian,
-    TournamentMedic,
-    ArgentHorserider,
-    ArgentWatchman,
-    ArmoredWarhorse,
-)
+from hearthbreaker.cards.registry import lazy_package
 
-from hearthbreaker.cards.minions.druid import (
-    KeeperOfTheGrove,
-    DruidOfTheClaw,
-    AncientOfLore,
-    AncientOfWar,
-    IronbarkProtector,
-    Cenarius,
-    AnodizedRoboCub,
-    MechBearCat,
-    DruidOfTheFang,
-    Malorne,
-    GroveTender,
-    DruidOfTheFlame,
-    VolcanicLumberer,
-)
-
-from hearthbreaker.cards.minions.hunter import (
-    TimberWolf,
-    SavannahHighmane,
-    Houndmaster,
-    KingKrush,
-    StarvingBuzzard,
-    TundraRhino,
-    ScavengingHyena,
-    Webspinner,
-    Hound,
-    Huffer,
-    Misha,
-    Leokk,
-    Snake,
-    MetaltoothLeaper,
-    KingOfBeasts,
-    Gahzrilla,
-    SteamwheedleSniper,
-    CoreRager,
-    Acidmaw,
-)
-
-from hearthbreaker.cards.minions.mage import (
-    ManaWyrm,
-    SorcerersApprentice,
-    KirinTorMage,
-    EtherealArcanist,
-    WaterElemental,
-    ArchmageAntonidas,
-    Snowchugger,
-    GoblinBlastmage,
-    SootSpewer,
-    WeeSpellstopper,
-    FlameLeviathan,
-    Flamewaker
-)
-
-from hearthbreaker.cards.minions.paladin import (
-    AldorPeacekeeper,
-    ArgentProtector,
-    GuardianOfKings,
-    TirionFordring,
-    CobaltGuardian,
-    SilverHandRecruit,
-    ShieldedMinibot,
-    Quartermaster,
-    ScarletPurifier,
-    BolvarFordragon,
-    DragonConsort,
-)
-
-from hearthbreaker.cards.minions.priest import (
-    AuchenaiSoulpriest,
-    CabalShadowPriest,
-    Lightspawn,
-    Lightwell,
-    NorthshireCleric,
-    ProphetVelen,
-    TempleEnforcer,
-    DarkCultist,
-    Shrinkmeister,
-    UpgradedRepairBot,
-    Shadowbomber,
-    Shadowboxer,
-    Voljin,
-    TwilightWhelp,
-)
-
-from hearthbreaker.cards.minions.rogue import (
-    AnubarAmbusher,
-    DefiasRingleader,
-    EdwinVanCleef,
-    Kidnapper,
-    MasterOfDisguise,
-    PatientAssassin,
-    SI7Agent,
-    OneeyedCheat,
-    IronSensei,
-    OgreNinja,
-    TradePrinceGallywix,
-    GoblinAutoBarber,
-    DarkIronSkulker,
-    Anubarak,
-)
-
-from hearthbreaker.cards.minions.shaman import (
-    AlAkirTheWindlord,
-    DustDevil,
-    EarthElemental,
-    FireElemental,
-    FlametongueTotem,
-    ManaTideTotem,
-    UnboundElemental,
-    Windspeaker,
-    HealingTotem,
-    SearingTotem,
-    StoneclawTotem,
-    WrathOfAirTotem,
-    SpiritWolf,
-    VitalityTotem,
-    SiltfinSpiritwalker,
-    WhirlingZapomatic,
-    DunemaulShaman,
-    Neptulon,
-    FireguardDestroyer,
-)
-
-from hearthbreaker.cards.minions.warlock import (
-    FlameImp,
-    PitLord,
-    Voidwalker,
-    DreadInfernal,
-    Felguard,
-    Doomguard,
-    Succubus,
-    SummoningPortal,
-    BloodImp,
-    LordJaraxxus,
-    VoidTerror,
-    Voidcaller,
-    AnimaGolem,
-    WorthlessImp,
-    FelCannon,
-    MalGanis,
-    FloatingWatcher,
-    MistressOfPain,
-    ImpGangBoss,
-)
-
-from hearthbreaker.cards.minions.warrior import (
-    ArathiWeaponsmith,
-    Armorsmith,
-    CruelTaskmaster,
-    FrothingBerserker,
-    GrommashHellscream,
-    KorkronElite,
-    WarsongCommander,
-    Warbot,
-    Shieldmaiden,
-    SiegeEngine,
-    IronJuggernaut,
-    ScrewjankClunker,
-    AxeFlinger,
-    AlexstraszasChampion,
-)
+lazy_package(__name__, [
+    ("hearthbreaker.cards.minions.neutral", [
+        "BloodfenRaptor",
+        "IronbeakOwl",
+        "NoviceEngineer",
+        "StonetuskBoar",
+        "WarGolem",
+        "MogushanWarden",
+        "FaerieDragon",
+        "KoboldGeomancer",
+        "ElvenArcher",
+        "ArgentSquire",
+        "SilvermoonGuardian",
+        "TwilightDrake",
+        "MagmaRager",
+        "DireWolfAlpha",
+        "WorgenInfiltrator",
+        "Archmage",
+        "DalaranMage",
+        "Malygos",
+        "AzureDrake",
+        "OgreMagi",
+        "Spellbreaker",
+        "BloodmageThalnos",
+        "LootHoarder",
+        "LeperGnome",
+        "IronforgeRifleman",
+        "GnomishInventor",
+        "GoldshireFootman",
+        "FrostwolfGrunt",
+        "IronfurGrizzly",
+        "LordOfTheArena",
+        "MurlocRaider",
+        "ManaAddict",
+        "OasisSnapjaw",
+        "RecklessRocketeer",
+        "RiverCrocolisk",
+        "MudAlligator",
+        "SenjinShieldmasta",
+        "ScarletCrusader",
+        "Shieldbearer",
+        "SilverbackPatriarch",
+        "JunglePanther",
+        "RavenholdtAssassin",
+        "StormpikeCommando",
+        "StormwindKnight",
+        "StranglethornTiger",
+        "Sunwalker",
+        "ThrallmarFarseer",
+        "WindfuryHarpy",
+        "YoungDragonhawk",
+        "Wolfrider",
+        "BootyBayBodyguard",
+        "BoulderfistOgre",
+        "ChillwindYeti",
+        "HotwindJinn",
+        "CoreHound",
+        "VoodooDoctor",
+        "EarthenRingFarseer",
+        "ArcaneGolem",
+        "PriestessOfElune",
+        "DarkscaleHealer",
+        "ArgentCommander",
+        "BluegillWarrior",
+        "Wisp",
+        "Nightblade",
+        "ShatteredSunCleric",
+        "TheBlackKnight",
+        "AbusiveSergeant",
+        "DarkIronDwarf",
+        "Abomination",
+        "AmaniBerserker",
+        "SilverHandKnight",
+        "FenCreeper",
+        "VentureCoMercenary",
+        "StormwindChampion",
+        "Deathwing",
+        "Alexstrasza",
+        "EmperorCobra",
+        "CrazedAlchemist",
+        "AcidicSwampOoze",
+        "AncientBrewmaster",
+        "YouthfulBrewmaster",
+        "BaronGeddon",
+        "AngryChicken",
+        "RagingWorgen",
+        "TaurenWarrior",
+        "SpitefulSmith",
+        "BloodKnight",
+        "FrostwolfWarlord",
+        "RaidLeader",
+        "DragonlingMechanic",
+        "MurlocTidehunter",
+        "RazorfenHunter",
+        "KnifeJuggler",
+        "CairneBloodhoof",
+        "HarvestGolem",
+        "TheBeast",
+        "SylvanasWindrunner",
+        "StampedingKodo",
+        "FrostElemental",
+        "Demolisher",
+        "Doomsayer",
+        "Gruul",
+        "Hogger",
+        "ImpMaster",
+        "InjuredBlademaster",
+        "MasterSwordsmith",
+        "NatPagle",
+        "Nozdormu",
+        "RagnarosTheFirelord",
+        "ColdlightOracle",
+        "ColdlightSeer",
+        "GrimscaleOracle",
+        "MurlocWarleader",
+        "AncientWatcher",
+        "BigGameHunter",
+        "BloodsailCorsair",
+        "BloodsailRaider",
+        "CaptainGreenskin",
+        "HungryCrab",
+        "MadBomber",
+        "ManaWraith",
+        "MindControlTech",
+        "MurlocTidecaller",
+        "Onyxia",
+        "SouthseaCaptain",
+        "SouthseaDeckhand",
+        "YoungPriestess",
+        "AcolyteOfPain",
+        "CultMaster",
+        "Secretkeeper",
+        "VioletTeacher",
+        "GadgetzanAuctioneer",
+        "IllidanStormrage",
+        "Lightwarden",
+        "FlesheatingGhoul",
+        "QuestingAdventurer",
+        "GurubashiBerserker",
+        "AncientMage",
+        "DefenderOfArgus",
+        "SunfuryProtector",
+        "HarrisonJones",
+        "KingMukla",
+        "LeeroyJenkins",
+        "SeaGiant",
+        "MoltenGiant",
+        "MountainGiant",
+        "DreadCorsair",
+        "CaptainsParrot",
+        "TinkmasterOverspark",
+        "AlarmoBot",
+        "EliteTaurenChieftain",
+        "MillhouseManastorm",
+        "PintSizedSummoner",
+        "OldMurkEye",
+        "Ysera",
+        "GelbinMekkatorque",
+        "LorewalkerCho",
+        "WildPyromancer",
+        "FacelessManipulator",
+        "NerubianEgg",
+        "Maexxna",
+        "HauntedCreeper",
+        "NerubarWeblord",
+        "UnstableGhoul",
+        "Loatheb",
+        "StoneskinGargoyle",
+        "SludgeBelcher",
+        "BaronRivendare",
+        "DancingSwords",
+        "Deathlord",
+        "SpectralKnight",
+        "Undertaker",
+        "WailingSoul",
+        "ZombieChow",
+        "Feugen",
+        "Stalagg",
+        "MadScientist",
+        "EchoingOoze",
+        "ShadeOfNaxxramas",
+        "KelThuzad",
+        "PilotedShredder",
+        "PilotedSkyGolem",
+        "SneedsOldShredder",
+        "AntiqueHealbot",
+        "AnnoyoTron",
+        "ArcaneNullifierX21",
+        "Blingtron3000",
+        "BombLobber",
+        "BurlyRockjawTrogg",
+        "Mechwarper",
+        "Frog",
+        "ClockworkGiant",
+        "ClockworkGnome",
+        "BoomBot",
+        "DoctorBoom",
+        "TargetDummy",
+        "ExplosiveSheep",
+        "Puddlestomper",
+        "MicroMachine",
+        "MechanicalYeti",
+        "SpiderTank",
+        "GilblinStalker",
+        "ShipsCannon",
+        "OgreBrute",
+        "MogorTheOgre",
+        "Toshley",
+        "ForceTankMAX",
+        "FelReaver",
+        "MadderBomber",
+        "Gazlowe",
+        "MiniMage",
+        "SaltyDog",
+        "GnomereganInfantry",
+        "FlyingMachine",
+        "LostTallstrider",
+        "HemetNesingwary",
+        "Illuminator",
+        "MekgineerThermaplugg",
+        "StonesplinterTrogg",
+        "TroggzorTheEarthinator",
+        "Hobgoblin",
+        "Cogmaster",
+        "GoblinSapper",
+        "TinkertownTechnician",
+        "Junkbot",
+        "Jeeves",
+        "Recombobulator",
+        "LilExorcist",
+        "EnhanceoMechano",
+        "FoeReaper4000",
+        "KezanMystic",
+        "MimironsHead",
+        "GnomishExperimenter",
+        "HungryDragon",
+        "GrimPatron",
+        "BlackwingTechnician",
+        "EmperorThaurissan",
+        "MajordomoExecutus",
+        "VolcanicDrake",
+        "BlackwingCorruptor",
+        "DrakonidCrusher",
+        "DragonEgg",
+        "Chromaggus",
+        "DragonkinSorcerer",
+        "RendBlackhand",
+        "Nefarian",
+        "TournamentMedic",
+        "ArgentHorserider",
+        "ArgentWatchman",
+        "ArmoredWarhorse",
+    ]),
+    ("hearthbreaker.cards.minions.druid", [
+        "KeeperOfTheGrove",
+        "DruidOfTheClaw",
+        "AncientOfLore",
+        "AncientOfWar",
+        "IronbarkProtector",
+        "Cenarius",
+        "AnodizedRoboCub",
+        "MechBearCat",
+        "DruidOfTheFang",
+        "Malorne",
+        "GroveTender",
+        "DruidOfTheFlame",
+        "VolcanicLumberer",
+    ]),
+    ("hearthbreaker.cards.minions.hunter", [
+        "TimberWolf",
+        "SavannahHighmane",
+        "Houndmaster",
+        "KingKrush",
+        "StarvingBuzzard",
+        "TundraRhino",
+        "ScavengingHyena",
+        "Webspinner",
+        "Hound",
+        "Huffer",
+        "Misha",
+        "Leokk",
+        "Snake",
+        "MetaltoothLeaper",
+        "KingOfBeasts",
+        "Gahzrilla",
+        "SteamwheedleSniper",
+        "CoreRager",
+        "Acidmaw",
+    ]),
+    ("hearthbreaker.cards.minions.mage", [
+        "ManaWyrm",
+        "SorcerersApprentice",
+        "KirinTorMage",
+        "EtherealArcanist",
+        "WaterElemental",
+        "ArchmageAntonidas",
+        "Snowchugger",
+        "GoblinBlastmage",
+        "SootSpewer",
+        "WeeSpellstopper",
+        "FlameLeviathan",
+        "Flamewaker",
+    ]),
+    ("hearthbreaker.cards.minions.paladin", [
+        "AldorPeacekeeper",
+        "ArgentProtector",
+        "GuardianOfKings",
+        "TirionFordring",
+        "CobaltGuardian",
+        "SilverHandRecruit",
+        "ShieldedMinibot",
+        "Quartermaster",
+        "ScarletPurifier",
+        "BolvarFordragon",
+        "DragonConsort",
+    ]),
+    ("hearthbreaker.cards.minions.priest", [
+        "AuchenaiSoulpriest",
+        "CabalShadowPriest",
+        "Lightspawn",
+        "Lightwell",
+        "NorthshireCleric",
+        "ProphetVelen",
+        "TempleEnforcer",
+        "DarkCultist",
+        "Shrinkmeister",
+        "UpgradedRepairBot",
+        "Shadowbomber",
+        "Shadowboxer",
+        "Voljin",
+        "TwilightWhelp",
+    ]),
+    ("hearthbreaker.cards.minions.rogue", [
+        "AnubarAmbusher",
+        "DefiasRingleader",
+        "EdwinVanCleef",
+        "Kidnapper",
+        "MasterOfDisguise",
+        "PatientAssassin",
+        "SI7Agent",
+        "OneeyedCheat",
+        "IronSensei",
+        "OgreNinja",
+        "TradePrinceGallywix",
+        "GoblinAutoBarber",
+        "DarkIronSkulker",
+        "Anubarak",
+    ]),
+    ("hearthbreaker.cards.minions.shaman", [
+        "AlAkirTheWindlord",
+        "DustDevil",
+        "EarthElemental",
+        "FireElemental",
+        "FlametongueTotem",
+        "ManaTideTotem",
+        "UnboundElemental",
+        "Windspeaker",
+        "HealingTotem",
+        "SearingTotem",
+        "StoneclawTotem",
+        "WrathOfAirTotem",
+        "SpiritWolf",
+        "VitalityTotem",
+        "SiltfinSpiritwalker",
+        "WhirlingZapomatic",
+        "DunemaulShaman",
+        "Neptulon",
+        "FireguardDestroyer",
+    ]),
+    ("hearthbreaker.cards.minions.warlock", [
+        "FlameImp",
+        "PitLord",
+        "Voidwalker",
+        "DreadInfernal",
+        "Felguard",
+        "Doomguard",
+        "Succubus",
+        "SummoningPortal",
+        "BloodImp",
+        "LordJaraxxus",
+        "VoidTerror",
+        "Voidcaller",
+        "AnimaGolem",
+        "WorthlessImp",
+        "FelCannon",
+        "MalGanis",
+        "FloatingWatcher",
+        "MistressOfPain",
+        "ImpGangBoss",
+    ]),
+    ("hearthbreaker.cards.minions.warrior", [
+        "ArathiWeaponsmith",
+        "Armorsmith",
+        "CruelTaskmaster",
+        "FrothingBerserker",
+        "GrommashHellscream",
+        "KorkronElite",
+        "WarsongCommander",
+        "Warbot",
+        "Shieldmaiden",
+        "SiegeEngine",
+        "IronJuggernaut",
+        "ScrewjankClunker",
+        "AxeFlinger",
+        "AlexstraszasChampion",
+    ]),
+])
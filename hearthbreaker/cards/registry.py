@@ -0,0 +1,128 @@
+"""
+Finds card classes without importing every card module up front.
+
+There are several hundred cards spread over a few dozen modules, and most games only ever use a handful of them.  The
+card packages (:mod:`hearthbreaker.cards` and its ``minions``, ``spells`` and ``weapons`` packages) list which module
+each of their classes is in, and only import that module the first time the class is asked for.  Looking up a card by
+its name, as :func:`hearthbreaker.engine.card_lookup` does, uses :mod:`hearthbreaker.cards.manifest`, which records the
+module and class of every card under its ``ref_name``.
+
+The manifest is generated, and has to be regenerated whenever a card is added, renamed or moved::
+
+    python update_card_manifest.py
+"""
+import importlib
+import sys
+import types
+
+
+class LazyPackage(types.ModuleType):
+    """
+    A package whose classes are imported from their modules the first time they are used.
+    """
+
+    def __getattr__(self, name):
+        # Only called for names which haven't been imported yet
+        modules = self.__dict__.get("__lazy__", {})
+        if name not in modules:
+            raise AttributeError("module '{}' has no attribute '{}'".format(self.__name__, name))
+        value = getattr(importlib.import_module(modules[name]), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__all__))
+
+
+def lazy_package(package_name, sources):
+    """
+    Makes a package import its classes when they are first used, rather than when the package is imported.
+
+    Importing everything from the package with ``from package import *`` still imports every class.
+
+    :param str package_name: The name of the package, which must already be imported
+    :param list[tuple[str, list[str]]] sources: The modules to take classes from, each with the names of the classes
+                                                to take from it.  If a name is in more than one module, the last one
+                                                is used, as if they had been imported in order.
+    """
+    package = sys.modules[package_name]
+    modules = {}
+    names = []
+    for module, module_names in sources:
+        for name in module_names:
+            if name not in modules:
+                names.append(name)
+            modules[name] = module
+    package.__lazy__ = modules
+    package.__all__ = names
+    package.__class__ = LazyPackage
+
+
+def card_modules():
+    """
+    Lists every module that cards are defined in, in the order they are imported when building the manifest
+
+    :rtype: list[str]
+    """
+    # Imported here rather than with the module, as they are only needed to generate the manifest
+    import pkgutil
+    import hearthbreaker.cards
+
+    modules = []
+    for package in [hearthbreaker.cards.minions, hearthbreaker.cards.spells, hearthbreaker.cards.weapons]:
+        for name in (package.__lazy__[class_name] for class_name in package.__all__):
+            if name not in modules:
+                modules.append(name)
+        for info in sorted(pkgutil.iter_modules(package.__path__), key=lambda info: info[1]):
+            name = "{}.{}".format(package.__name__, info[1])
+            if name not in modules:
+                modules.append(name)
+    modules.append("hearthbreaker.cards.heroes")
+    return modules
+
+
+def build_manifest():
+    """
+    Imports every card module, and finds the module and class of every card which can be looked up by name.
+
+    As the cards have to be created to find their ``ref_name``, this is slow, and is only done to generate the
+    manifest.
+
+    :return: The ``ref_name``, module and class name of each card, in the order they were found
+    :rtype: list[tuple[str, str, str]]
+    """
+    import collections
+    from hearthbreaker.cards.base import WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard
+
+    modules = card_modules()
+    for module in modules:
+        importlib.import_module(module)
+    cards = collections.OrderedDict()
+    for card_type in [WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard]:
+        for card_class in card_type.__subclasses__():
+            # Leave out cards made elsewhere, such as in tests or from card definition files
+            if card_class.__module__ not in modules:
+                continue
+            cards[card_class().ref_name] = (card_class.__module__, card_class.__name__)
+    return [(ref_name, module, class_name) for ref_name, (module, class_name) in cards.items()]
+
+
+def write_manifest(filename):
+    """
+    Generates the manifest and writes it to a file
+
+    :param str filename: The file to write :mod:`hearthbreaker.cards.manifest` to
+    """
+    import json
+
+    lines = ['"""',
+             "The module and class of every card, by the name it is looked up with.",
+             "",
+             "Generated by update_card_manifest.py.  Do not edit.",
+             '"""',
+             "CARDS = ["]
+    for card in build_manifest():
+        lines.append("    ({}),".format(", ".join(json.dumps(part) for part in card)))
+    lines.append("]")
+    with open(filename, "w") as manifest_file:
+        manifest_file.write("\n".join(lines) + "\n")
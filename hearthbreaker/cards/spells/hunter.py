@@ -179,7 +179,8 @@ class MultiShot(SpellCard):
         targets = copy.copy(game.other_player.minions)
         for i in range(0, 2):
             target = game.random_choice(targets)
-            targets.remove(target)
+            # Minions which are copies of each other compare equal, so the one chosen is removed by identity
+            del targets[[other is target for other in targets].index(True)]
             target.damage(player.effective_spell_damage(3), self)
 
     def can_use(self, player, game):
@@ -251,7 +251,7 @@ class Polymorph(SpellCard):
         super().use(player, game)
         from hearthbreaker.cards.minions.mage import Sheep
         sheep = Sheep()
-        minion = sheep.create_minion(None)
+        minion = sheep.new_minion(None)
         minion.card = sheep
         self.target.replace(minion)
 
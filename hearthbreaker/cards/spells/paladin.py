@@ -294,7 +294,7 @@ class MusterForBattle(SpellCard):
             dude = SilverHandRecruit()
             dude.summon(player, player.game, len(player.minions))
         justice = LightsJustice()
-        hammer = justice.create_weapon(player)
+        hammer = justice.new_weapon(player)
         hammer.card = justice
         hammer.equip(player)
 
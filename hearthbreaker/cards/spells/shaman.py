@@ -92,7 +92,8 @@ class ForkedLightning(SpellCard):
         minions = copy.copy(game.other_player.minions)
         for i in range(0, 2):
             minion = game.random_choice(minions)
-            minions.remove(minion)
+            # Minions which are copies of each other compare equal, so the one chosen is removed by identity
+            del minions[[other is minion for other in minions].index(True)]
             minion.damage(player.effective_spell_damage(3), self)
 
     def can_use(self, player, game):
@@ -120,7 +121,7 @@ class Hex(SpellCard):
         super().use(player, game)
 
         frog = hearthbreaker.cards.minions.neutral.Frog()
-        minion = frog.create_minion(None)
+        minion = frog.new_minion(None)
         minion.card = frog
         self.target.replace(minion)
 
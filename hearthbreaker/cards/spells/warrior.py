@@ -74,7 +74,8 @@ class Cleave(SpellCard):
 
         for i in range(0, 2):
             minion = game.random_choice(minions)
-            minions.remove(minion)
+            # Minions which are copies of each other compare equal, so the one chosen is removed by identity
+            del minions[[other is minion for other in minions].index(True)]
             minion.damage(player.effective_spell_damage(2), self)
 
     def can_use(self, player, game):
@@ -196,7 +197,7 @@ class Upgrade(SpellCard):
             player.weapon.durability += 1
             player.weapon.base_attack += 1
         else:
-            heavy_axe = HeavyAxe().create_weapon(player)
+            heavy_axe = HeavyAxe().new_weapon(player)
             heavy_axe.equip(player)
 
 
@@ -0,0 +1,102 @@
+"""
+Checkpoints allow a game to be wound back to an earlier state in place, rather than being copied.
+
+A search (such as :class:`hearthbreaker.agents.mcts_agent.MCTSAgent`) can take a checkpoint, try out a move on the
+game itself, and then return to the checkpoint with :meth:`hearthbreaker.engine.Game.undo_to`.  This avoids building
+a whole new game for each move that is explored.
+
+Taking a checkpoint records the attributes of every object in the game, along with the contents of every list,
+dictionary and set that they hold.  Moves can then be played as normal, through ``play_card``, ``attack_target``,
+``_start_turn`` and ``_end_turn``, without recording anything.  Undoing puts each recorded object back the way it
+was, so objects keep their identity: a card, minion or player from before the checkpoint can still be used after
+undoing.  Anything created after the checkpoint is simply dropped.
+
+The definitions of cards (their selectors, conditions, actions and events) never change during a game, so they are
+not recorded.  Neither are the agents, which are not part of the game state.
+
+**Example**::
+
+    checkpoint = game.checkpoint()
+    game.play_card(game.current_player.hand[0])
+    game.undo_to(checkpoint)  # The card is back in the player's hand
+"""
+import types
+
+from hearthbreaker.game_objects import Bindable, GameObject, invalidate_stats
+from hearthbreaker.powers import Power
+from hearthbreaker.tags.base import Tag, ActionTag, Status, EventAction
+
+_ATOMIC_TYPES = {int, float, bool, str, type(None), type, types.BuiltinFunctionType}
+
+
+class Checkpoint:
+    """
+    The recorded state of a game, created by :meth:`hearthbreaker.engine.Game.checkpoint`.
+
+    A checkpoint can be returned to any number of times.
+    """
+
+    def __init__(self, game):
+        from hearthbreaker.engine import Deck
+        #: The game that this checkpoint belongs to
+        self.game = game
+        self._random_state = game.random.getstate()
+        self._objects = []
+        self._lists = []
+        self._dicts = []
+        self._sets = []
+        self._record(game, (Bindable, GameObject, Deck, Power, Status, Tag))
+
+    def _record(self, game, state_types):
+        seen = set()
+        pending = [game]
+        while pending:
+            obj = pending.pop()
+            obj_type = type(obj)
+            if obj_type in _ATOMIC_TYPES or id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if obj_type is list:
+                self._lists.append((obj, obj[:]))
+                pending.extend(obj)
+            elif obj_type is tuple:
+                pending.extend(obj)
+            elif obj_type is dict:
+                self._dicts.append((obj, obj.copy()))
+                pending.extend(obj.keys())
+                pending.extend(obj.values())
+            elif obj_type is set:
+                self._sets.append((obj, obj.copy()))
+                pending.extend(obj)
+            elif obj_type is types.MethodType:
+                pending.append(obj.__self__)
+            elif obj_type is EventAction:
+                # Never changed, but it holds on to what is called when the event is triggered
+                pending.append(obj.target)
+                pending.append(obj.func)
+            elif obj_type is types.FunctionType:
+                # Functions bound to events often close over the objects they act on
+                if obj.__closure__:
+                    pending.extend(cell.cell_contents for cell in obj.__closure__)
+            elif isinstance(obj, state_types) and not isinstance(obj, ActionTag):
+                self._objects.append((obj, obj.__dict__.copy()))
+                pending.extend(obj.__dict__.values())
+
+    def restore(self):
+        """
+        Returns the game to the state it was in when this checkpoint was taken
+        """
+        for obj, attributes in self._objects:
+            obj_dict = obj.__dict__
+            obj_dict.clear()
+            obj_dict.update(attributes)
+        for obj, contents in self._lists:
+            obj[:] = contents
+        for obj, contents in self._dicts:
+            obj.clear()
+            obj.update(contents)
+        for obj, contents in self._sets:
+            obj.clear()
+            obj.update(contents)
+        self.game.random.setstate(self._random_state)
+        invalidate_stats()
@@ -1,11 +1,17 @@
+import bisect
 import copy
+import importlib
 import random
 from hearthbreaker.cards.heroes import hero_from_name
+from hearthbreaker.cards.manifest import CARDS
 import hearthbreaker.constants
-from hearthbreaker.game_objects import Bindable, GameException, Minion, Hero, Weapon
+from hearthbreaker.game_objects import Bindable, GameException, Minion, Hero, Weapon, invalidate_stats
 import hearthbreaker.tags
-from hearthbreaker.tags.base import Effect, AuraUntil
+from hearthbreaker.tags.base import Effect, AuraUntil, remove_tag
+from hearthbreaker.tags.card_source import CardIndex
 import hearthbreaker.targeting
+import hearthbreaker.trace
+import hearthbreaker.zobrist
 
 from hearthbreaker.agents.basic_agents import RandomAgent, OpponentAgent
 from hearthbreaker.agents.test_agent import TalkativeAgent
@@ -13,47 +19,75 @@ from hearthbreaker.agents.aggressive_agent import AggressiveAgent
 from hearthbreaker.agents.controlling_agent import ControllingAgent
 
 
+# A card for each name which has been looked up so far, which is never played but copied whenever the card is needed
 card_table = {}
-
-
-def __create_card_table():
-    from hearthbreaker.cards.base import WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard
-
-    def __card_lookup_rec(card_type):
-        subclasses = card_type.__subclasses__()
-        for sc in subclasses:
-            c = sc()
-            card_table[c.ref_name] = sc
-
-    for card_class in [WeaponCard, SpellCard, MinionCard, SecretCard, ChoiceCard, HeroCard]:
-        __card_lookup_rec(card_class)
+# The module and class name of every card, by name
+card_modules = {ref_name: (module, class_name) for ref_name, module, class_name in CARDS}
 
 
 def card_lookup(card_name):
     """
     Given a the name of a card as a string, return an object corresponding to that card
 
+    The module the card is in is imported the first time it is looked up, and a card is created to copy from.  The
+    card returned is a copy of that one, which shares its definition (such as its battlecry) rather than building it
+    again.
+
     :param str card_name: A string representing the name of the card in English
-    :return: An instance of a subclass of Card corresponding to the given card name or None if no Card
+    :return: An instance of a subclass of Card corresponding to the given card name.  A KeyError is raised if no Card
              by that name exists.
     :rtype: hearthbreaker.game_objects.Card
     """
 
-    card = card_table[card_name]
-    if card is not None:
-        return card()
-    return None
+    card = card_table.get(card_name)
+    if card is None:
+        module, class_name = card_modules[card_name]
+        card = getattr(importlib.import_module(module), class_name)()
+        card_table[card_name] = card
+    return card.copy()
 
 
 def get_cards():
     card_list = filter(lambda c: c.collectible,
-                       [card() for card in card_table.values()])
+                       [card_lookup(ref_name) for ref_name, module, class_name in CARDS])
     return card_list
 
 
+# The index of every collectible card, made the first time it is needed
+collectible_index = None
+
+
+def get_collectible_index():
+    """
+    Finds the index of every collectible card, for picking random cards from the whole collection.
+
+    :return: An index of cards which are shared by every game, and must not be changed
+    :rtype: hearthbreaker.tags.card_source.CardIndex
+    """
+    global collectible_index
+    if collectible_index is None:
+        collectible_index = CardIndex(get_cards())
+    return collectible_index
+
+
 class Game(Bindable):
-    def __init__(self, decks, agents):
+    def __init__(self, decks, agents, seed=None):
+        """
+        Creates a new game between two decks.
+
+        :param decks: The decks for the first and second player
+        :param agents: The agents for the first and second player
+        :param int seed: The seed for this game's random number generator.  If None, a seed is drawn from the
+                         :mod:`random` module, so that seeding that module still makes games reproducible.
+        """
         super().__init__()
+        if seed is None:
+            seed = random.getrandbits(64)
+        #: The seed this game's random number generator was created with
+        self.seed = seed
+        #: The random number generator used for every random decision made in this game, by the engine, cards and
+        #: agents alike
+        self.random = random.Random(seed)
         self.delayed_minions = set()
 
         # self.first_player = self._generate_random_between(0, 1)
@@ -81,6 +115,7 @@ class Game(Bindable):
         self.selected_card = None
 
     def remove_dead_minions(self):
+        invalidate_stats()
         self.current_player.minions = [minion for minion in self.current_player.minions if minion.health > 0]
         self.other_player.minions = [minion for minion in self.other_player.minions if minion.health > 0]
 
@@ -135,8 +170,11 @@ class Game(Bindable):
         attacking_minion.stealth = False
         attacking_minion.current_target = None
 
-    def random_draw(self, cards, requirement):
-        filtered_cards = [card for card in filter(requirement, cards)]
+    def random_draw(self, cards, requirement=None):
+        if requirement is None:
+            filtered_cards = cards
+        else:
+            filtered_cards = [card for card in filter(requirement, cards)]
         if len(filtered_cards) > 0:
             return filtered_cards[self._generate_random_between(0, len(filtered_cards) - 1)]
         return None
@@ -148,7 +186,7 @@ class Game(Bindable):
         return self._generate_random_between(minimum, maximum)
 
     def _generate_random_between(self, lowest, highest):
-        return random.randint(lowest, highest)
+        return self.random.randint(lowest, highest)
 
     def check_delayed(self):
         sorted_minions = sorted(self.delayed_minions, key=lambda m: m.born)
@@ -250,6 +288,7 @@ class Game(Bindable):
             self.current_player = self.players[0]
             self.other_player = self.players[1]
             self._turns_passed += 1
+        invalidate_stats()
         # if self._turns_passed >= 50:
         #     self.players[0].hero.dead = True
         #     self.players[1].hero.dead = True
@@ -316,6 +355,9 @@ class Game(Bindable):
     def copy(self):
         copied_game = copy.copy(self)
         copied_game.events = {}
+        copied_game.delayed_minions = set()
+        copied_game.random = random.Random()
+        copied_game.random.setstate(self.random.getstate())
         copied_game._all_cards_played = []
         copied_game.players = [player.copy(copied_game) for player in self.players]
         if self.current_player is self.players[0]:
@@ -329,17 +371,46 @@ class Game(Bindable):
         copied_game.other_player.opponent = copied_game.current_player
         copied_game._has_turn_ended = self._has_turn_ended
 
-        for player in copied_game.players:
-            player.hero.attach(player.hero, player)
-            if player.weapon:
-                player.weapon.attach(player.hero, player)
-            for minion in player.minions:
-                minion.attach(minion, player)
+        for copied_player, player in zip(copied_game.players, self.players):
+            copied_player.attach_copy(player)
 
         for secret in copied_game.other_player.secrets:
             secret.activate(copied_game.other_player)
         return copied_game
 
+    def checkpoint(self):
+        """
+        Records the current state of this game, so that it can be returned to later with :meth:`undo_to`.
+
+        Unlike :meth:`copy`, this doesn't build a new game.  Moves can be tried out on this game itself, and then
+        undone.
+
+        :rtype: hearthbreaker.checkpoint.Checkpoint
+        """
+        from hearthbreaker.checkpoint import Checkpoint
+        return Checkpoint(self)
+
+    def undo_to(self, checkpoint):
+        """
+        Returns this game to the state it was in when a checkpoint was taken.  Every object that was part of the game
+        at that point is put back the way it was, and anything created since is discarded.  The same checkpoint can be
+        returned to as many times as needed.
+
+        :param hearthbreaker.checkpoint.Checkpoint checkpoint: A checkpoint taken by :meth:`checkpoint` on this game
+        """
+        if checkpoint.game is not self:
+            raise GameException("That checkpoint belongs to a different game")
+        checkpoint.restore()
+
+    def state_hash(self):
+        """
+        A 64-bit hash of the position this game is in.  Games which have reached the same position, even through a
+        different order of moves, have the same hash.  See :mod:`hearthbreaker.zobrist` for what is included.
+
+        :rtype: int
+        """
+        return hearthbreaker.zobrist.state_hash(self)
+
     def play_card(self, card):
         if self.game_ended:
             raise GameException("The game has ended")
@@ -370,6 +441,7 @@ class Game(Bindable):
             card._placeholder.index = index
             card._placeholder.card = card
             card._placeholder.player = self.current_player
+            invalidate_stats()
         self.current_player.trigger("card_played", card, card_index)
 
         if not card.cancel:
@@ -403,7 +475,8 @@ class Game(Bindable):
         new_game._turns_passed = d['turn_count']
         new_game.delayed_minions = set()
         new_game.game_ended = False
-        new_game.random_func = random.randint
+        new_game.seed = random.getrandbits(64)
+        new_game.random = random.Random(new_game.seed)
         new_game.events = {}
         new_game.players = [Player.__from_json__(pd, new_game, None) for pd in d["players"]]
         new_game._has_turn_ended = False
@@ -474,42 +547,58 @@ class Player(Bindable):
         return "Player: " + self.name
 
     def copy(self, new_game):
-        copied_player = Player(self.name, self.deck.copy(), self.agent, new_game)
-
+        # Anything derived from the player's minions, weapon and auras (such as spell damage) is left at its starting
+        # value, and recalculated as they are attached to the copied game
+        copied_player = copy.copy(self)
+        copied_player.events = {}
+        copied_player.game = new_game
+        copied_player.deck = self.deck.copy()
         copied_player.hero = self.hero.copy(copied_player)
         copied_player.graveyard = copy.copy(self.graveyard)
         copied_player.minions = [minion.copy(copied_player, new_game) for minion in self.minions]
-        copied_player.hand = [copy.copy(card) for card in self.hand]
-        for card in copied_player.hand:
-            card._attached = False
-            card.attach(card, copied_player)
-        copied_player.spell_damage = self.spell_damage
-        copied_player.mana = self.mana
-        copied_player.max_mana = self.max_mana
-        copied_player.upcoming_overload = self.upcoming_overload
-        copied_player.current_overload = self.current_overload
+        copied_player.hand = [card.copy() for card in self.hand]
+        copied_player.spell_damage = 0
+        copied_player.spell_multiplier = 1
+        copied_player.heal_multiplier = 1
+        copied_player.heal_does_damage = 0
+        copied_player.double_deathrattle = 0
+        copied_player.mana_filters = []
+        copied_player.effects = []
+        copied_player.object_auras = []
+        copied_player.player_auras = []
         copied_player.dead_this_turn = copy.copy(self.dead_this_turn)
         if self.weapon:
             copied_player.weapon = self.weapon.copy(copied_player)
-        for effect in self.effects:
-            effect = copy.copy(effect)
-            copied_player.add_effect(effect)
         copied_player.secrets = []
         for secret in self.secrets:
-            new_secret = type(secret)()
+            new_secret = secret.copy()
             new_secret.player = copied_player
             copied_player.secrets.append(new_secret)
-        for aura in filter(lambda a: isinstance(a, AuraUntil), self.player_auras):
-            aura = copy.deepcopy(aura)
-            aura.owner = copied_player.hero
-            copied_player.add_aura(aura)
-        for aura in filter(lambda a: isinstance(a, AuraUntil), self.object_auras):
-            aura = copy.deepcopy(aura)
-            aura.owner = copied_player.hero
-            copied_player.add_aura(aura)
-        copied_player.effect_count = dict()
         return copied_player
 
+    def attach_copy(self, original):
+        """
+        Attaches the objects of a player created by :meth:`copy`, once both players of the copied game exist.
+
+        Effects which listen to the other player can only be bound after the other player has been copied, so this is
+        left until the copied game is complete.
+
+        :param Player original: The player that this player was copied from
+        """
+        self.hero.attach(self.hero, self)
+        if self.weapon:
+            self.weapon.attach(self.hero, self)
+        for minion in self.minions:
+            minion.attach(minion, self)
+        for card in self.hand:
+            card.attach(card, self)
+        for effect in original.effects:
+            self.add_effect(effect.copy())
+        for aura in filter(lambda a: isinstance(a, AuraUntil), original.player_auras + original.object_auras):
+            aura = aura.copy()
+            aura.owner = self.hero
+            self.add_aura(aura)
+
     def draw(self):
         if self.can_draw():
             card = self.deck.draw(self.game)
@@ -525,7 +614,7 @@ class Player(Bindable):
             self.fatigue += 1
             self.hero.trigger("fatigue_damage", self.fatigue)
             self.hero.damage(self.fatigue, None)
-            print(self, "lost 1 point beacuse of empty deck")
+            hearthbreaker.trace.info(self, "lost 1 point beacuse of empty deck")
             self.hero.activate_delayed()
 
     def can_draw(self):
@@ -565,6 +654,7 @@ class Player(Bindable):
         effect.event.bind(self.hero, remove_effect)
 
     def add_aura(self, aura):
+        invalidate_stats()
         if isinstance(aura.selector, hearthbreaker.tags.selector.PlayerSelector):
             self.player_auras.append(aura)
         else:
@@ -574,14 +664,11 @@ class Player(Bindable):
         aura.apply()
 
     def remove_aura(self, aura):
+        invalidate_stats()
         if isinstance(aura.selector, hearthbreaker.tags.selector.PlayerSelector):
             self.player_auras = [au for au in filter(lambda a: a is not aura, self.player_auras)]
         else:
-            for an_aura in self.object_auras:
-                if an_aura.eq(aura):
-                    self.object_auras.remove(an_aura)
-                    aura = an_aura
-                    break
+            aura = remove_tag(self.object_auras, aura) or aura
         aura.unapply()
 
     def choose_target(self, targets):
@@ -659,21 +746,72 @@ class Deck:
     def __init__(self, cards, hero):
         if len(cards) != 20:
             raise GameException("Deck must have exactly 20 cards in it")
-        self.cards = cards
         self.hero = hero
         for card in cards:
             card.drawn = False
         self.left = 20
+        self._index_cards(cards)
+
+    def _index_cards(self, cards):
+        # The cards of this deck, or None for those which haven't been needed since the deck was copied.  A card is
+        # only made when it is drawn or looked at.
+        self._cards = list(cards)
+        # The cards which are copied to make the cards that haven't been made yet.  Cards don't change while they are
+        # in a deck, so these are shared between copies of the deck.  They are only taken from cards which haven't
+        # been drawn, as a drawn card may since have been changed in its player's hand.
+        self._templates = [None] * len(cards)
+        # The type of each card, for making a card when there is nothing to copy.  This happens for cards which had
+        # been drawn when the deck was copied, and when a deck is restored from a checkpoint made before it was copied.
+        self._types = [type(card) for card in cards]
+        # The positions of the cards which haven't been drawn, in order, so that a card can be drawn without looking
+        # through the whole deck.  Keeping them in order means a game draws the same cards from the same seed.  Cards
+        # can also be marked as drawn directly, so their flags are still checked, and those cards left out when found.
+        self._undrawn = [index for index, card in enumerate(cards) if not card.drawn]
+        # The positions of the cards with each name and cost, for finding a card equal to another one
+        positions = {}
+        for index, card in enumerate(cards):
+            positions.setdefault((card.name, card.mana), []).append(index)
+        self._positions = positions
+
+    @property
+    def cards(self):
+        """
+        The cards in this deck, including the ones which have been drawn.  This makes any cards which haven't been
+        made yet, so :meth:`undrawn` is usually what is wanted.
+
+        :rtype: list[hearthbreaker.game_objects.Card]
+        """
+        for index, card in enumerate(self._cards):
+            if card is None:
+                self._card(index)
+        return self._cards
+
+    def _card(self, index):
+        card = self._cards[index]
+        if card is None:
+            template = self._templates[index]
+            if template is not None:
+                card = template.copy()
+            else:
+                card = self._types[index]()
+            card.drawn = index not in self._undrawn
+            self._cards[index] = card
+        return card
 
     def copy(self):
-        def copy_card(card):
-            new_card = type(card)()
-            new_card.drawn = card.drawn
-            return new_card
+        cards = self._cards
+        templates = self._templates
+        for index, card in enumerate(cards):
+            if card is not None and templates[index] is None and not card.drawn:
+                templates[index] = card.copy()
         new_deck = Deck.__new__(Deck)
-        new_deck.cards = [copy_card(card) for card in self.cards]
+        new_deck._cards = [None] * len(cards)
+        new_deck._templates = templates
+        new_deck._types = self._types
         new_deck.hero = self.hero
         new_deck.left = self.left
+        new_deck._undrawn = list(self._undrawn)
+        new_deck._positions = self._positions
         return new_deck
 
     def can_draw(self):
@@ -682,23 +820,79 @@ class Deck:
     def draw(self, game):
         if not self.can_draw():
             raise GameException("Cannot draw more than 20 cards")
-        card = game.random_draw(self.cards, lambda c: not c.drawn)
+        cards = self._cards
+        undrawn = [index for index in self._undrawn if cards[index] is None or not cards[index].drawn]
+        index = undrawn.pop(game.random_amount(0, len(undrawn) - 1))
+        self._undrawn = undrawn
+        card = self._card(index)
         card.drawn = True
         self.left -= 1
         return card
 
+    def undrawn(self):
+        """
+        Lists the cards which are still in the deck
+
+        :return: The cards which haven't been drawn, in the order they are in the deck
+        :rtype: list[hearthbreaker.game_objects.Card]
+        """
+        undrawn = []
+        for index in self._undrawn:
+            card = self._card(index)
+            if not card.drawn:
+                undrawn.append(card)
+        return undrawn
+
+    def undrawn_names(self):
+        """
+        Lists the names of the cards which are still in the deck, without making the cards
+
+        :rtype: list[str]
+        """
+        names = []
+        for index in self._undrawn:
+            card = self._cards[index]
+            if card is None:
+                card = self._templates[index] or self._card(index)
+            if not card.drawn:
+                names.append(card.name)
+        return names
+
+    def take(self, card):
+        """
+        Takes a card out of the deck without drawing it, as if it had been drawn
+
+        :param hearthbreaker.game_objects.Card card: A card in this deck which hasn't been drawn
+        """
+        for index in self._positions.get((card.name, card.mana), ()):
+            if self._cards[index] is card and index in self._undrawn:
+                self._undrawn.remove(index)
+                break
+        card.drawn = True
+        self.left -= 1
+
     def put_back(self, card):
         if not card:
             raise TypeError("Expected a card, not None")
-        for deck_card in self.cards:
-            if deck_card == card:
-                if not card.drawn:
-                    raise GameException("Tried to put back a card that hadn't been used yet")
-                deck_card.drawn = False
-                self.left += 1
-                return
+        positions = self._positions.get((card.name, card.mana))
+        if positions:
+            if not card.drawn:
+                raise GameException("Tried to put back a card that hadn't been used yet")
+            deck_card = self._card(positions[0])
+            deck_card.drawn = False
+            if positions[0] not in self._undrawn:
+                bisect.insort(self._undrawn, positions[0])
+            self.left += 1
+            return
         card.drawn = False
-        self.cards.append(card)
+        index = len(self._cards)
+        # These are shared between copies of the deck, so are replaced rather than changed
+        self._positions = dict(self._positions)
+        self._positions[(card.name, card.mana)] = [index]
+        self._templates = self._templates + [None]
+        self._types = self._types + [type(card)]
+        self._cards.append(card)
+        self._undrawn.append(index)
         self.left += 1
 
     def __to_json__(self):
@@ -723,11 +917,8 @@ class Deck:
             if entry["used"]:
                 left -= 1
         deck = Deck.__new__(Deck)
-        deck.cards = cards
         deck.used = used
         deck.left = left
         deck.hero = hero
+        deck._index_cards(cards)
         return deck
-
-
-__create_card_table()
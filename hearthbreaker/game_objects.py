@@ -1,14 +1,15 @@
 import abc
 import copy
-from functools import reduce
+import os
 import hearthbreaker.constants
 
-from hearthbreaker.tags.base import Aura, AuraUntil, Effect, Buff, BuffUntil, Deathrattle
+from hearthbreaker.tags.base import Aura, AuraUntil, Effect, Buff, BuffUntil, Deathrattle, copy_tags, remove_tag
 from hearthbreaker.tags.event import TurnEnded
 from hearthbreaker.tags.selector import CurrentPlayer
 from hearthbreaker.tags.status import Stealth, ChangeAttack, ChangeHealth, SetAttack, Charge, Taunt, DivineShield, \
     Windfury, NoSpellTarget, SpellDamage, MinimumHealth, CanAttack
 import hearthbreaker.targeting
+import hearthbreaker.trace
 # from hearthbreaker.game_objects import Hero
 
 
@@ -21,6 +22,27 @@ class GameException(Exception):
         super().__init__(message)
 
 
+#: The :class:`hearthbreaker.profiler.EventProfiler` which is running, if any.  Set by the profiler itself.
+event_profiler = None
+
+# Counts the changes to buffs, auras and minions, across every game, so that a stat kept from before one of them is
+# known to be out of date (see GameObject.calculate_stat)
+_stat_epoch = 0
+
+#: When set (or when the HEARTHBREAKER_CHECK_STATS environment variable is), every stat taken from the cache is worked
+#: out again, and an AssertionError raised if the two differ
+check_stat_cache = bool(os.environ.get("HEARTHBREAKER_CHECK_STATS"))
+
+
+def invalidate_stats():
+    """
+    Marks every kept stat as out of date.  Called whenever a buff or aura is added or removed, a minion enters, leaves
+    or moves on the board or dies, or the turn changes.
+    """
+    global _stat_epoch
+    _stat_epoch += 1
+
+
 class Bindable:
     """
     A class which inherits from Bindable has an event structure added to it.
@@ -74,6 +96,9 @@ class Bindable:
     Any class which subclasses this class must be sure to call :meth:`__init__`
     """
 
+    # How many triggers of this object's events are calling their handlers
+    _dispatching = 0
+
     def __init__(self):
         """
         Set up a new :class:`Bindable`.  Must be called by any subclasses.
@@ -87,13 +112,10 @@ class Bindable:
         :param string event: The event to bind a function to
         :param function function: The function to bind.  The parameters are not checked until it is called, so
                                   ensure its signature matches the parameters called from :meth:`trigger`
+        :return: A handler which can be passed to :meth:`unbind_handler` to undo just this binding
         :see: :class:`Bindable`
         """
-
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append((function, False))
+        return self._add_handler(event, (function, False))
 
     def bind_once(self, event, function):
         """
@@ -103,13 +125,10 @@ class Bindable:
         :param string event: The event to bind a function to
         :param function function: The function to bind.  The parameters are not checked until it is called, so
                                   ensure its signature matches the parameters called from :meth:`trigger`
+        :return: A handler which can be passed to :meth:`unbind_handler` to undo just this binding
         :see: :class:`Bindable`
         """
-
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append((function, True))
+        return self._add_handler(event, (function, True))
 
     def trigger(self, event, *args):
         """
@@ -121,14 +140,34 @@ class Bindable:
         :param list args: The arguments to pass to the bound function
         :see: :class:`Bindable`
         """
-        if event in self.events:
-            for handler in copy.copy(self.events[event]):
+        profiler = event_profiler
+        if profiler is not None:
+            self._profiled_trigger(profiler, event, args)
+        elif event in self.events:
+            # While the handlers are being called, any list of them which is bound to or unbound from is replaced
+            # rather than changed (see _changeable_handlers), so functions bound or unbound from here on take effect
+            # next time
+            self._dispatching += 1
+            try:
+                for handler in self.events[event]:
+                    if handler[1]:
+                        self.unbind_handler(event, handler)
+                    handler[0](*args)
+            finally:
+                self._dispatching -= 1
+
+    def _profiled_trigger(self, profiler, event, args):
+        # As trigger, but timing each handler (see hearthbreaker.profiler)
+        profiler.event_started()
+        self._dispatching += 1
+        try:
+            for handler in self.events.get(event, ()):
                 if handler[1]:
-                    self.events[event].remove(handler)
-                    # tidy up the events dict so we don't have entries for events with no handlers
-                    if len(self.events[event]) is 0:
-                        del(self.events[event])
-                handler[0](*args)
+                    self.unbind_handler(event, handler)
+                profiler.call_handler(handler[0], args)
+        finally:
+            self._dispatching -= 1
+            profiler.event_finished(event)
 
     def unbind(self, event, function):
         """
@@ -139,10 +178,48 @@ class Bindable:
         :param string event: The event to unbind the function from
         :param function function: The function to unbind.
         """
-        if event in self.events:
-            self.events[event] = [handler for handler in self.events[event] if not handler[0] == function]
-            if len(self.events[event]) is 0:
-                del (self.events[event])
+        handlers = self._changeable_handlers(event)
+        if handlers:
+            for index in range(len(handlers) - 1, -1, -1):
+                if handlers[index][0] == function:
+                    del handlers[index]
+            self._tidy_handlers(event, handlers)
+
+    def unbind_handler(self, event, handler):
+        """
+        Undo a single binding, leaving any other bindings of the same function in place.
+
+        :param string event: The event to unbind the handler from
+        :param handler: The handler returned by :meth:`bind` or :meth:`bind_once`
+        """
+        handlers = self._changeable_handlers(event)
+        if handlers:
+            for index, other in enumerate(handlers):
+                if other is handler:
+                    del handlers[index]
+                    break
+            self._tidy_handlers(event, handlers)
+
+    def _add_handler(self, event, handler):
+        handlers = self._changeable_handlers(event)
+        if handlers is None:
+            self.events[event] = [handler]
+        else:
+            handlers.append(handler)
+        return handler
+
+    def _changeable_handlers(self, event):
+        # The list of handlers for an event, ready to be changed.  While a trigger is going through this object's
+        # handlers, the list is copied first, so that the one being gone through stays as it was.
+        handlers = self.events.get(event)
+        if handlers is not None and self._dispatching:
+            handlers = self.events[event] = list(handlers)
+        return handlers
+
+    def _tidy_handlers(self, event, handlers):
+        # tidy up the events dict so we don't have entries for events with no handlers
+        if not handlers:
+            del self.events[event]
 
 
 class GameObject:
@@ -169,6 +246,15 @@ class GameObject:
         #: The player associated with this Game Object
         self.player = None
         self._attached = False
+        # The stats which can be kept, with the epoch they were worked out in
+        self._stat_cache = {}
+
+    def __copy__(self):
+        new = type(self).__new__(type(self))
+        new.__dict__ = self.__dict__.copy()
+        # The copy may come to belong to someone else, so it works out its own stats
+        new._stat_cache = {}
+        return new
 
     def attach(self, obj, player):
         if not self._attached:
@@ -187,21 +273,43 @@ class GameObject:
     def calculate_stat(self, stat_class, starting_value=0):
         """
         Calculates the amount of a particular stat this :class:`GameObject` has at current time.
-        """
 
-        # Add together all the attack amounts from buffs
-        stat = reduce(lambda a, b: b.update(self, a), [buff.status for buff in self.buffs
-                                                       if isinstance(buff.status, stat_class) and
-                                                       (not buff.condition or buff.condition.evaluate(self, self))],
-                      starting_value)
-        stat = reduce(lambda a, b: b.update(self, a), [aura.status
-                                                       for player in self.player.game.players
-                                                       for aura in player.object_auras
-                                                       if aura.match(self) and isinstance(aura.status, stat_class)],
-                      stat)
+        If every buff and aura which could change the stat is fixed (see :meth:`hearthbreaker.tags.base.Aura.fixed`),
+        the stat is kept until a buff, aura or minion changes (see :func:`invalidate_stats`).  Otherwise it is worked
+        out every time.
+        """
+        # Kept by the type of stat, along with the starting value and epoch it was worked out for
+        cached = self._stat_cache.get(stat_class)
+        if cached is not None and cached[0] == _stat_epoch and cached[1] == starting_value:
+            if check_stat_cache:
+                fresh = self._calculate_stat(stat_class, starting_value)[0]
+                assert cached[2] == fresh, "Stale {} of {} {}: kept {}, but it is {}".format(
+                    stat_class.__name__, type(self).__name__, getattr(self, "card", None), cached[2], fresh)
+            return cached[2]
+        stat, fixed = self._calculate_stat(stat_class, starting_value)
+        if fixed:
+            self._stat_cache[stat_class] = (_stat_epoch, starting_value, stat)
+        return stat
+
+    def _calculate_stat(self, stat_class, starting_value):
+        # Add together all the amounts from buffs, and then from auras.  The type of status is checked first, as it is
+        # much cheaper than checking whether an aura applies to this object.  Any aura of the right type counts towards
+        # whether the stat is fixed, even if it doesn't match yet.
+        stat = starting_value
+        fixed = True
+        for buff in self.buffs:
+            if isinstance(buff.status, stat_class):
+                fixed = fixed and buff.fixed()
+                if not buff.condition or buff.condition.evaluate(self, self):
+                    stat = buff.status.update(self, stat)
+        for player in self.player.game.players:
+            for aura in player.object_auras:
+                if isinstance(aura.status, stat_class):
+                    fixed = fixed and aura.fixed()
+                    if aura.match(self):
+                        stat = aura.status.update(self, stat)
 
-        # print(">>>Stat:", stat)
-        return max(0, stat)
+        return max(0, stat), fixed
 
     def __to_json__(self):
         jsn = {}
@@ -320,28 +428,25 @@ class GameObject:
         self.player.add_aura(aura)
 
     def remove_aura(self, aura):
-        for an_aura in self.auras:
-            if an_aura.eq(aura):
-                self.auras.remove(an_aura)
-                break
+        remove_tag(self.auras, aura)
         self.player.remove_aura(aura)
 
     def add_buff(self, buff):
         if not isinstance(buff, Buff):
             raise TypeError("Expected a buff to be added")
+        invalidate_stats()
         self.buffs.append(buff)
         buff.set_owner(self)
         buff.apply()
 
     def remove_buff(self, buff):
-        for a_buff in self.buffs:
-            if a_buff.eq(buff):
-                self.buffs.remove(a_buff)
-                break
+        invalidate_stats()
+        remove_tag(self.buffs, buff)
         buff.unapply()
 
     def unattach(self):
         if self._attached:
+            invalidate_stats()
             for effect in reversed(self.effects):
                 effect.unapply()
             self.effects = []
@@ -415,6 +520,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
                 if isinstance(buff.status, Stealth):
                     buff.unapply()
             self.buffs = [buff for buff in self.buffs if not isinstance(buff.status, Stealth)]
+            invalidate_stats()
 
     # Add function that gets all targets to attack
 
@@ -427,7 +533,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
             if enemy.can_be_attacked() and enemy.health>0:
                 targets.append(enemy)
             if isinstance(enemy, Hero):
-                print("=\n==\n===\n====\n===== ERROR\n====\n===\n==\n=")
+                hearthbreaker.trace.error("=\n==\n===\n====\n===== ERROR\n====\n===\n==\n=")
         
         if found_taunt:
             targets = [target for target in targets if target.taunt]
@@ -742,6 +848,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         self.auras = []
         self.buffs = []
         self.enrage = []
+        invalidate_stats()
         if self.calculate_max_health() < self.health or health_full:
             self.health = self.calculate_max_health()
         self.trigger("silenced")
@@ -755,6 +862,7 @@ class Character(Bindable, GameObject, metaclass=abc.ABCMeta):
         """
         self.delayed_trigger("died", by)
         self.dead = True
+        invalidate_stats()
 
     def can_attack(self):
         """
@@ -819,9 +927,26 @@ class Weapon(Bindable, GameObject):
         self.card = None
 
     def copy(self, new_owner):
-        new_weapon = Weapon(self.base_attack, self.durability, copy.deepcopy(self.deathrattle),
-                            copy.deepcopy(self.effects), copy.deepcopy(self.auras), copy.deepcopy(self.buffs))
+        new_weapon = Weapon(self.base_attack, self.durability, self.deathrattle,
+                            copy_tags(self.effects), copy_tags(self.auras), copy_tags(self.buffs))
         new_weapon.player = new_owner
+        if self.card:
+            new_weapon.card = self.card.copy()
+        return new_weapon
+
+    def copy_template(self):
+        """
+        Copies a weapon which hasn't been equipped, such as the one a card keeps to make its weapons from (see
+        :meth:`hearthbreaker.cards.base.WeaponCard.new_weapon`).  The copy has its own copies of the tags, which share
+        their definitions with this weapon's.
+
+        :rtype: Weapon
+        """
+        new_weapon = copy.copy(self)
+        new_weapon.events = {}
+        new_weapon.effects = copy_tags(self.effects)
+        new_weapon.auras = copy_tags(self.auras)
+        new_weapon.buffs = copy_tags(self.buffs)
         return new_weapon
 
     def destroy(self):
@@ -866,7 +991,7 @@ class Weapon(Bindable, GameObject):
     def __from_json__(wd, player):
         from hearthbreaker.engine import card_lookup
         weapon_card = card_lookup(wd['name'])
-        weapon = weapon_card.create_weapon(player)
+        weapon = weapon_card.new_weapon(player)
         weapon.base_attack = wd['attack']
         weapon.durability = wd['durability']
         weapon.card = weapon_card
@@ -929,30 +1054,23 @@ class Minion(Character):
         return hash((self.card.name, self.card.mana, self.base_health, self.base_attack))
 
     def add_to_board(self, index):
-        aura_affects = {}
-        for player in self.game.players:
-            for aura in player.object_auras:
-                aura_affects[aura] = set()
-                for minion in self.player.minions:
-                    if aura.match(minion):
-                        aura_affects[aura].add(minion)
+        # The auras this minion brings are applied when it is attached, so only those already in play are updated
+        auras = [aura for player in self.game.players for aura in player.object_auras if not aura.status.passive]
         self.game.minion_counter += 1
         self.player.minions.insert(index, self)
         self.born = self.game.minion_counter
         for minion in self.player.minions[index + 1:]:
             minion.index += 1
         self.index = index
+        invalidate_stats()
         self.health += self.calculate_max_health() - self.base_health - self.health_delta
         self.attach(self, self.player)
-        for player in self.game.players:
-            for aura in player.object_auras:
-                for minion in self.player.minions:
-                    if aura in aura_affects:
-                        is_in = minion in aura_affects[aura]
-                        if not is_in and aura.match(minion):
-                            aura.status.act(aura.owner, minion)
-                        elif is_in and not aura.match(minion):
-                            aura.status.unact(aura.owner, minion)
+        # Most auras match a minion whatever else is on the board, so only this one needs checking
+        for aura in auras:
+            if aura.depends_on_board():
+                aura.update_affected(self.player.minions)
+            else:
+                aura.add_affected(self, aura.owner)
         self.trigger("added_to_board", self, index)
 
     def calculate_attack(self):
@@ -975,25 +1093,20 @@ class Minion(Character):
 
     def remove_from_board(self):
         if not self.removed:
-            aura_affects = {}
-            for aura in self.player.object_auras:
-                aura_affects[aura] = set()
-                for minion in self.player.minions:
-                    if aura.match(minion):
-                        aura_affects[aura].add(minion)
             for minion in self.player.minions:
                 if minion.index > self.index:
                     minion.index -= 1
-            self.player.minions.remove(self)
+            # Minions which are copies of each other compare equal, so this one is found by identity
+            del self.player.minions[[minion is self for minion in self.player.minions].index(True)]
             self.player.trigger("minion_removed", self)
             self.removed = True
+            invalidate_stats()
+            for aura in self.player.opponent.object_auras:
+                aura.remove_affected(self)
             for aura in self.player.object_auras:
-                for minion in self.player.minions:
-                    is_in = minion in aura_affects[aura]
-                    if not is_in and aura.match(minion):
-                        aura.status.act(aura.owner, minion)
-                    elif is_in and not aura.match(minion):
-                        aura.status.unact(aura.owner, minion)
+                aura.remove_affected(self)
+                if aura.depends_on_board():
+                    aura.update_affected(self.player.minions)
 
     def replace(self, new_minion):
         """
@@ -1011,10 +1124,11 @@ class Minion(Character):
         if self.index >= len(self.player.minions):
             raise ValueError("Attempting to replace minion with invalid index")
         self.player.minions[self.index] = new_minion
+        invalidate_stats()
         new_minion.attach(new_minion, self.player)
         for aura in self.player.object_auras:
-            if aura.match(new_minion):
-                aura.status.act(self, new_minion)
+            aura.remove_affected(self)
+            aura.add_affected(new_minion, self)
         new_minion.health += new_minion.calculate_max_health() - new_minion.base_health
         self.removed = True
         self.replaced_by = new_minion
@@ -1026,6 +1140,7 @@ class Minion(Character):
         if self.divine_shield:
             self.buffs = [buff for buff in self.buffs if not isinstance(buff.status, DivineShield)]
             self.divine_shield = 0
+            invalidate_stats()
         else:
             super().damage(amount, attacker)
 
@@ -1077,21 +1192,20 @@ class Minion(Character):
         return "Minion: {0} ({1} health) ({2} attack)    ...at index {3}".format(self.card.__str__(), self.health, self.calculate_attack(), self.index)
 
     def copy(self, new_owner, new_game=None):
+        # Deathrattles hold no state of their own, so only the list holding them needs to be copied
         new_minion = Minion(self.base_attack, self.base_health,
-                            effects=copy.deepcopy(self.effects),
-                            auras=copy.deepcopy(self.auras),
-                            buffs=copy.deepcopy(self.buffs),
-                            deathrattle=copy.deepcopy(self.deathrattle),
-                            enrage=copy.deepcopy(self.enrage), key=self.key)
+                            effects=copy_tags(self.effects),
+                            auras=copy_tags(self.auras),
+                            buffs=copy_tags(self.buffs),
+                            deathrattle=list(self.deathrattle),
+                            enrage=copy_tags(self.enrage), key=self.key)
         new_minion.health = self.base_health - (self.calculate_max_health() - self.health)
         new_minion.enraged = self.enraged
-        new_minion.immune = self.immune
         new_minion.index = self.index
         new_minion.attacks_performed = self.attacks_performed
         new_minion.exhausted = self.exhausted
         new_minion.born = self.born
-        card_type = type(self.card)
-        new_minion.card = card_type()
+        new_minion.card = self.card.copy()
         new_minion.player = new_owner
         if new_game:
             new_minion.game = new_game
@@ -1100,6 +1214,26 @@ class Minion(Character):
 
         return new_minion
 
+    def copy_template(self):
+        """
+        Copies a minion which hasn't been put in a game, such as the one a card keeps to make its minions from (see
+        :meth:`hearthbreaker.cards.base.MinionCard.new_minion`).  The copy has its own key, and its own copies of the
+        tags, which share their definitions with this minion's.
+
+        :rtype: Minion
+        """
+        new_minion = copy.copy(self)
+        new_minion.events = {}
+        new_minion.effects = copy_tags(self.effects)
+        new_minion.auras = copy_tags(self.auras)
+        new_minion.buffs = copy_tags(self.buffs)
+        new_minion.enrage = copy_tags(self.enrage)
+        new_minion.deathrattle = list(self.deathrattle)
+        new_minion.delayed = []
+        new_minion.key = Minion.auto_key
+        Minion.auto_key += 1
+        return new_minion
+
     @staticmethod
     def __from_json__(md, player, game):
         from hearthbreaker.engine import card_lookup
@@ -1178,16 +1312,16 @@ class Hero(Character):
         return super().calculate_stat(stat_class, starting_value)
 
     def copy(self, new_owner):
-        new_hero = Hero(self.base_health, self.character_class, self.power, new_owner)
+        new_hero = Hero(self.base_health, self.character_class, copy.copy(self.power), new_owner)
         new_hero.health = self.health
         new_hero.armor = self.armor
         new_hero.used_windfury = False
         new_hero.attacks_performed = self.attacks_performed
 
-        new_hero.effects = copy.deepcopy(self.effects)
-        new_hero.auras = copy.deepcopy(self.auras)
-        new_hero.buffs = copy.deepcopy(self.buffs)
-        new_hero.card = type(self.card)()
+        new_hero.effects = copy_tags(self.effects)
+        new_hero.auras = copy_tags(self.auras)
+        new_hero.buffs = copy_tags(self.buffs)
+        new_hero.card = self.card.copy()
 
         return new_hero
 
@@ -1238,8 +1372,8 @@ class Hero(Character):
         new_hero.power.hero = new_hero
         new_hero.attach(new_hero, self.player)
         for aura in self.player.object_auras:
-            if aura.match(new_hero):
-                aura.status.act(self, new_hero)
+            aura.remove_affected(self)
+            aura.add_affected(new_hero, self)
 
     @staticmethod
     def is_hero():
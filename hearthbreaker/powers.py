@@ -92,7 +92,7 @@ class RoguePower(Power):
         super().use()
         from hearthbreaker.cards.weapons.rogue import WickedKnife
         wicked_knife = WickedKnife()
-        knife = wicked_knife.create_weapon(self.hero.player)
+        knife = wicked_knife.new_weapon(self.hero.player)
         knife.card = wicked_knife
         knife.equip(self.hero.player)
 
@@ -0,0 +1,160 @@
+"""
+Profiling of the events triggered during a game.
+
+Almost everything cards do happens in response to an event, such as ``character_damaged`` or ``minion_played``, so a
+deck that is slow to simulate usually has a few cards whose handlers are called very often, or take a long time when
+they are.  An :class:`EventProfiler` records, for each event name, how often it was triggered and how long its handlers
+took, and for each handler how often it was called and how long it took.  Handlers are grouped by where they came from:
+the card whose effect, aura or secret bound them, or else the name of the function.
+
+The profiler only looks at events while it is running.  :meth:`hearthbreaker.game_objects.Bindable.trigger` calls it
+to time each event and each of its handlers, and costs almost nothing more otherwise.  Only one profiler can be running
+at a time.
+
+**Example**::
+
+    from hearthbreaker.profiler import EventProfiler
+
+    with EventProfiler() as profiler:
+        game.start()
+    print(profiler.table())
+    json.dumps(profiler, default=lambda o: o.__to_json__())
+"""
+import time
+
+import hearthbreaker.game_objects
+from hearthbreaker.tags.base import EventAction
+
+
+def handler_origin(function):
+    """
+    Describes where a function bound to an event came from
+
+    :param function function: The bound function
+    :return: The name of the card and the kind of tag which bound the function, such as "Knife Juggler: Effect", or
+             the name of the function if it didn't come from a card
+    :rtype: str
+    """
+    # Events with a condition bind an action of their own, which calls the function that they were given
+    if isinstance(function, EventAction):
+        return handler_origin(function.func)
+    source = getattr(function, "__self__", None)
+    owner = getattr(source, "owner", None)
+    card = getattr(owner, "card", None)
+    if card is not None:
+        return "{}: {}".format(card.name, type(source).__name__)
+    if source is not None and hasattr(source, "is_card") and source.is_card():
+        return "{}: {}".format(source.name, function.__name__)
+    return getattr(function, "__qualname__", repr(function))
+
+
+class EventProfiler:
+    """
+    Records the time taken by each event triggered while it is running.
+
+    For events, the total time includes any events triggered by their handlers, while the self time leaves them out.
+    The time of a handler includes everything it does.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Creates a profiler, which isn't running yet
+
+        :param function clock: The function giving the current time in seconds
+        """
+        self.clock = clock
+        #: The statistics for each event name, as lists of the number of triggers, the total and the self time
+        self.events = {}
+        #: The statistics for each handler origin, as lists of the number of calls and the total time
+        self.handlers = {}
+        # The start time, and the time spent in nested events, of each event being triggered
+        self._running = []
+
+    def start(self):
+        """
+        Starts recording events, adding to anything recorded before
+        """
+        if hearthbreaker.game_objects.event_profiler not in (None, self):
+            raise RuntimeError("Another profiler is already running")
+        hearthbreaker.game_objects.event_profiler = self
+
+    def stop(self):
+        """
+        Stops recording events
+        """
+        if hearthbreaker.game_objects.event_profiler is self:
+            hearthbreaker.game_objects.event_profiler = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def event_started(self):
+        """
+        Called by :meth:`hearthbreaker.game_objects.Bindable.trigger` when an event is triggered, before any of its
+        handlers are called
+        """
+        # The time the event started, and the time spent in the events triggered by its handlers so far
+        self._running.append([self.clock(), 0.0])
+
+    def call_handler(self, function, args):
+        """
+        Called by :meth:`hearthbreaker.game_objects.Bindable.trigger` to call each function bound to an event, timing
+        it.
+
+        :param function function: The bound function
+        :param tuple args: The arguments to pass to it
+        """
+        clock = self.clock
+        start = clock()
+        try:
+            function(*args)
+        finally:
+            stats = self.handlers.setdefault(handler_origin(function), [0, 0.0])
+            stats[0] += 1
+            stats[1] += clock() - start
+
+    def event_finished(self, event):
+        """
+        Called by :meth:`hearthbreaker.game_objects.Bindable.trigger` once the handlers of an event are done, even if
+        one of them raised an exception
+
+        :param str event: The name of the event
+        """
+        start, nested = self._running.pop()
+        elapsed = self.clock() - start
+        if self._running:
+            self._running[-1][1] += elapsed
+        stats = self.events.setdefault(event, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - nested
+
+    def table(self, limit=None):
+        """
+        Lays out what has been recorded as a table, with the slowest events and handlers first
+
+        :param int limit: The most rows to show for events and for handlers, or None for all of them
+        :rtype: str
+        """
+        lines = ["{:<40}{:>10}{:>12}{:>12}".format("event", "calls", "total ms", "self ms")]
+        events = sorted(self.events.items(), key=lambda item: item[1][2], reverse=True)
+        for name, (calls, total, own) in events[:limit]:
+            lines.append("{:<40}{:>10}{:>12.2f}{:>12.2f}".format(name, calls, total * 1000, own * 1000))
+        lines.append("")
+        lines.append("{:<52}{:>10}{:>12}".format("handler", "calls", "total ms"))
+        handlers = sorted(self.handlers.items(), key=lambda item: item[1][1], reverse=True)
+        for origin, (calls, total) in handlers[:limit]:
+            lines.append("{:<52}{:>10}{:>12.2f}".format(origin, calls, total * 1000))
+        return "\n".join(lines)
+
+    def __to_json__(self):
+        return {
+            'events': {name: {'calls': calls, 'total': total, 'self': own}
+                       for name, (calls, total, own) in self.events.items()},
+            'handlers': {origin: {'calls': calls, 'total': total}
+                         for origin, (calls, total) in self.handlers.items()},
+        }
@@ -0,0 +1,260 @@
+"""
+Batch simulation of games across a pool of worker processes.
+
+:func:`run_many` plays the same match-up many times, fanning the games out over a
+:class:`concurrent.futures.ProcessPoolExecutor`.  Each worker ships back a compact :class:`GameResult` per game, and
+the results are added to a :class:`BatchResult` as they come back, which reports win rates along with their
+confidence intervals, and how many games were drawn.
+
+Every game gets its own seed, derived from the seed of the batch, so a batch can be repeated exactly, and any single
+game from it can be played again with :func:`rerun_game` (given ``keep_results``, so that its seed is kept).
+
+**Example**::
+
+    from hearthbreaker.agents.basic_agents import RandomAgent
+    from hearthbreaker.simulate import run_many
+
+    results = run_many([deck1, deck2], [RandomAgent, RandomAgent], 10000, workers=8)
+    low, high = results.confidence_interval(0)
+    print("Player one won {:.1%} ({:.1%} - {:.1%})".format(results.win_rate(0), low, high))
+"""
+import collections
+import concurrent.futures
+import math
+import os
+import random
+
+from hearthbreaker.engine import Game, Deck, card_lookup
+
+
+#: The outcome of a single game.  ``seed`` is the seed the game was played with, ``winner`` is the index (0 or 1) of
+#: the winning player, or None if the game was drawn, ``turns`` the number of turns the game took and ``health`` a
+#: tuple with the final health of each player's hero.
+GameResult = collections.namedtuple("GameResult", ["index", "seed", "winner", "turns", "health"])
+
+
+class BatchResult:
+    """
+    The aggregated outcome of a batch of games played by :func:`run_many`
+    """
+
+    def __init__(self, keep_results=True):
+        """
+        :param bool keep_results: Whether to keep the :class:`GameResult` for each game, or only the totals
+        """
+        #: The number of games played
+        self.games = 0
+        #: The number of games won by each player
+        self.wins = [0, 0]
+        #: The number of games in which both heroes died
+        self.draws = 0
+        #: The total number of turns played across all games
+        self.total_turns = 0
+        #: The :class:`GameResult` for each game, in the order they were added, or None if they aren't kept
+        self.results = [] if keep_results else None
+
+    def add(self, result):
+        """
+        Adds the outcome of a single game to this batch
+
+        :param GameResult result: The result to add
+        """
+        self.games += 1
+        if result.winner is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner] += 1
+        self.total_turns += result.turns
+        if self.results is not None:
+            self.results.append(result)
+
+    def win_rate(self, player_index):
+        """
+        The fraction of games won by a player.  Drawn games count as games the player didn't win, so the win rates of
+        the two players add up to less than one when there are draws (see :meth:`draw_rate`).
+
+        :param int player_index: The index of the player (0 or 1)
+        :rtype: float
+        """
+        if self.games == 0:
+            return 0.0
+        return self.wins[player_index] / self.games
+
+    def draw_rate(self):
+        """
+        The fraction of games which were drawn
+
+        :rtype: float
+        """
+        if self.games == 0:
+            return 0.0
+        return self.draws / self.games
+
+    def confidence_interval(self, player_index, z=1.96):
+        """
+        The Wilson score interval for a player's win rate, as given by :meth:`win_rate`.
+
+        :param int player_index: The index of the player (0 or 1)
+        :param float z: The standard score for the desired confidence level.  The default gives a 95% interval.
+        :return: The lower and upper bounds of the interval
+        :rtype: (float, float)
+        """
+        return wilson_interval(self.wins[player_index], self.games, z)
+
+    def average_turns(self):
+        """
+        The mean number of turns a game in this batch took
+
+        :rtype: float
+        """
+        if self.games == 0:
+            return 0.0
+        return self.total_turns / self.games
+
+    def __str__(self):  # pragma: no cover
+        lines = ["{} games, {:.1f} turns on average".format(self.games, self.average_turns())]
+        for index in range(2):
+            low, high = self.confidence_interval(index)
+            lines.append("Player {}: {} wins ({:.1%}, 95% CI {:.1%} - {:.1%})".format(
+                index + 1, self.wins[index], self.win_rate(index), low, high))
+        lines.append("Draws: {} ({:.1%})".format(self.draws, self.draw_rate()))
+        return "\n".join(lines)
+
+
+def wilson_interval(successes, trials, z=1.96):
+    """
+    Computes the Wilson score interval for a binomial proportion
+
+    :param int successes: The number of successful trials
+    :param int trials: The total number of trials
+    :param float z: The standard score for the desired confidence level
+    :return: The lower and upper bounds of the interval
+    :rtype: (float, float)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    proportion = successes / trials
+    denominator = 1 + z * z / trials
+    centre = proportion + z * z / (2 * trials)
+    spread = z * math.sqrt(proportion * (1 - proportion) / trials + z * z / (4 * trials * trials))
+    return max(0.0, (centre - spread) / denominator), min(1.0, (centre + spread) / denominator)
+
+
+def _deck_spec(deck):
+    # Decks are rebuilt from the names of their cards in each game, so that a worker never has to pickle a card, the
+    # event handlers bound to it, or a card class made at run time (such as those from
+    # hearthbreaker.cards.definitions.load_cards).
+    return type(deck.hero), [card.ref_name for card in deck.cards]
+
+
+def _build_deck(spec):
+    hero_class, card_names = spec
+    return Deck([card_lookup(name) for name in card_names], hero_class())
+
+
+def _play_game(deck_specs, agent_factories, seed):
+    game = Game([_build_deck(spec) for spec in deck_specs], [factory() for factory in agent_factories], seed)
+    game.start()
+    return game
+
+
+def _winner(game):
+    dead = [player.hero.dead for player in game.players]
+    if dead[0] == dead[1]:
+        return None
+    return 1 if dead[0] else 0
+
+
+def _iter_chunks(seeds, n_games, chunk_size):
+    # The seeds are drawn as each chunk is needed, but always in the order of the games, so they are the same however
+    # the games are shared out
+    for start in range(0, n_games, chunk_size):
+        yield [(index, seeds.getrandbits(64)) for index in range(start, min(start + chunk_size, n_games))]
+
+
+def _play_chunk(deck_specs, agent_factories, games):
+    results = []
+    for index, seed in games:
+        game = _play_game(deck_specs, agent_factories, seed)
+        winner = _winner(game)
+        results.append(GameResult(index, seed, winner, game._turns_passed,
+                                  tuple(player.hero.health for player in game.players)))
+    return results
+
+
+def _add_chunks(batch, futures):
+    for future in futures:
+        for result in future.result():
+            batch.add(result)
+
+
+def rerun_game(decks, agent_factories, seed):
+    """
+    Plays a single game again, exactly as it was played in a batch.
+
+    :param decks: The two decks that were passed to :func:`run_many`
+    :param agent_factories: The agent factories that were passed to :func:`run_many`
+    :param int seed: The seed from the game's :class:`GameResult`
+    :return: The finished game, for inspection
+    :rtype: hearthbreaker.engine.Game
+    """
+    return _play_game([_deck_spec(deck) for deck in decks], agent_factories, seed)
+
+
+def run_many(decks, agent_factories, n_games, workers=None, chunk_size=None, seed=None, keep_results=False):
+    """
+    Plays many games between two decks, spreading them across worker processes.
+
+    Games are handed to the workers in chunks, so that the cost of communicating with a worker is shared by several
+    games.  Only a few chunks are waiting for a worker at any time, and each is added to the totals as it comes back,
+    so a batch of any size runs in the same memory.  Each agent is created fresh for every game, so agents may keep
+    state between turns.
+
+    :param decks: The two :class:`hearthbreaker.engine.Deck` objects to play against each other.  They are only used
+                  as templates, and are not modified.  Their cards are looked up again by name with
+                  :func:`hearthbreaker.engine.card_lookup` in the worker.  Cards registered at run time (such as
+                  those from :func:`hearthbreaker.cards.definitions.register_cards`) are only known to workers which
+                  are forked from this process, which is how they are started on Linux.  Where workers are spawned
+                  instead, as on Windows and OS X, use ``workers=1`` for decks with such cards.
+    :param agent_factories: A pair of callables (typically agent classes), each of which returns a new agent.  When
+                            using more than one worker, they must be picklable, so lambdas cannot be used.
+    :param int n_games: How many games to play
+    :param int workers: The number of worker processes to use.  Defaults to the number of CPUs.  If 1, the games
+                        are played in this process.
+    :param int chunk_size: How many games to send to a worker at a time.  By default, each worker receives about
+                           four chunks.
+    :param int seed: The seed that the seed of each game is derived from.  If None, it is drawn from the
+                     :mod:`random` module.
+    :param bool keep_results: Whether to keep the :class:`GameResult` of every game, sorted by the number of the
+                              game, in :attr:`BatchResult.results`.  Otherwise only the totals are kept.
+    :rtype: BatchResult
+    """
+    if len(decks) != 2 or len(agent_factories) != 2:
+        raise ValueError("Exactly two decks and two agent factories are needed")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, min(1000, math.ceil(n_games / (workers * 4))))
+    deck_specs = [_deck_spec(deck) for deck in decks]
+    seeds = random.Random(seed if seed is not None else random.getrandbits(64))
+    chunks = _iter_chunks(seeds, n_games, chunk_size)
+
+    batch = BatchResult(keep_results)
+    if workers == 1:
+        for chunk in chunks:
+            for result in _play_chunk(deck_specs, agent_factories, chunk):
+                batch.add(result)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                # Enough chunks are queued to keep every worker busy, and no more
+                if len(pending) >= workers * 2:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    _add_chunks(batch, done)
+                pending.add(executor.submit(_play_chunk, deck_specs, agent_factories, chunk))
+            _add_chunks(batch, concurrent.futures.as_completed(pending))
+
+    if keep_results:
+        batch.results.sort(key=lambda result: result.index)
+    return batch
@@ -68,7 +68,7 @@ class GiveAura(Action):
 
     def act(self, actor, target, other=None):
         for aura in self.auras:
-            target.add_aura(aura)
+            target.add_aura(aura.copy())
 
     def __to_json__(self):
         return {
@@ -96,6 +96,8 @@ class GiveEffect(Action):
 
     def act(self, actor, target, other=None):
         for effect in self.effects:
+            # The selectors are specialized for this target, so the effect is copied in full rather than shared
+            effect = copy.deepcopy(effect)
             for tag in effect.tags:
                 for action in tag.actions:
                     if hasattr(action, "selector"):
@@ -206,7 +208,7 @@ class Transform(Action):
         if target.is_card():
             target.replace(card)
         elif target.is_minion():
-            minion = card.create_minion(target.player)
+            minion = card.new_minion(target.player)
             minion.card = card
             target.replace(minion)
         elif target.is_hero():
@@ -302,8 +304,7 @@ class Discard(Action, metaclass=Amount):
                     actor.player.trigger("card_discarded", card)
                     card.unattach()
                 else:
-                    card.drawn = True
-                    actor.player.deck.left -= 1
+                    actor.player.deck.take(card)
                     actor.player.trigger("card_discarded", card)
 
     def __to_json__(self):
@@ -406,8 +407,7 @@ class RemoveFromDeck(Action):
         card = self.card.get_card(target, target, actor)
         target.game.selected_card = card
         if card:
-            card.drawn = True
-            target.deck.left -= 1
+            target.deck.take(card)
 
     def __to_json__(self):
         return {
@@ -577,7 +577,7 @@ class Equip(Action):
     def act(self, actor, target, other=None):
         card = self.weapon.get_card(target, target, actor)
         target.game.selected_card = card
-        weapon = card.create_weapon(target)
+        weapon = card.new_weapon(target)
         weapon.card = card
         weapon.equip(target)
 
@@ -826,8 +826,8 @@ class Joust(Action):
         self.lose_action = lose_action
 
     def act(self, actor, target, other=None):
-        my_card = actor.game.random_draw(actor.player.deck.cards, lambda c: not c.drawn)
-        their_card = actor.game.random_draw(actor.player.opponent.deck.cards, lambda c: not c.drawn and c.is_minion())
+        my_card = actor.game.random_draw(actor.player.deck.undrawn())
+        their_card = actor.game.random_draw(actor.player.opponent.deck.undrawn(), lambda c: c.is_minion())
 
         if my_card and (not their_card or my_card.mana > their_card.mana):
             self.win_action.act(actor, target, other)
@@ -1,10 +1,54 @@
 import abc
 import copy
+import importlib
 import json
-import string
+import re
+import sys
 
 
-class JSONObject(metaclass=abc.ABCMeta):
+class JSONType(abc.ABCMeta):
+    """
+    The type of the objects which are read from JSON by name, such as actions, selectors and conditions.
+
+    Each kind of object (a class which defines ``json_types``) has a table of the classes which can be read as that
+    kind, by their name in JSON.  Classes are added to the table as they are defined, so ``from_json`` only has to look
+    the name up.  A class's name in JSON is its ``json_name``, if it has one.  Otherwise, it is the name of the class in
+    lower case with underscores between the words, leaving off the ``json_suffix`` of its kind (for example,
+    ``"minion"`` for ``MinionSelector``).
+    """
+
+    def __init__(cls, name, bases, dct):
+        super().__init__(name, bases, dct)
+        types = getattr(cls, "json_types", None)
+        if types is None or "json_types" in dct:
+            return
+        json_name = dct.get("json_name")
+        if json_name is None:
+            suffix = getattr(cls, "json_suffix", "")
+            if suffix and name.endswith(suffix):
+                name = name[:-len(suffix)]
+            json_name = re.sub("(?<!^)(?=[A-Z])", "_", name).lower()
+        types[json_name] = cls
+
+    def json_class(cls, name):
+        """
+        Finds the class of this kind with the given name in JSON
+
+        :param str name: The name of the class in JSON
+        :rtype: type
+        """
+        try:
+            return cls.json_types[name]
+        except KeyError:
+            # The classes are only added once the module they are defined in has been imported
+            importlib.import_module(cls.json_module)
+            return cls.json_types[name]
+
+
+class JSONObject(metaclass=JSONType):
+    #: False for classes whose JSON changes after they have been created, such as a status which keeps the amount it
+    #: last acted with.  The key of an object holding one of these can't be kept, and is worked out each time.
+    key_fixed = True
 
     @abc.abstractmethod
     def __to_json__(self):
@@ -23,18 +67,74 @@ class JSONObject(metaclass=abc.ABCMeta):
         return self
 
     def eq(self, other):
-        return str(self) == str(other)
+        return self is other or self.key() == other.key()
+
+    def key(self):
+        """
+        A key which is the same for any two objects that describe the same thing, such as two copies of a buff.
+
+        The key is the JSON form of the object.  Most objects aren't changed once they have been created (copies are
+        made instead, as with :meth:`to_instance`), so it is only worked out the first time it is needed, unless the
+        object or anything it holds isn't :attr:`key_fixed`.  Keys are interned, so comparing two equal keys takes no
+        longer than comparing two different ones.
+
+        :rtype: str
+        """
+        key = self.__dict__.get("_key")
+        if key is None:
+            fixed = [self.key_fixed]
+
+            def to_json(obj):
+                if not getattr(obj, "key_fixed", True):
+                    fixed[0] = False
+                return obj.__to_json__()
+
+            key = sys.intern(json.dumps(self.__to_json__(), default=to_json, sort_keys=True))
+            if fixed[0]:
+                self._key = key
+        return key
 
     def __str__(self):
         return json.dumps(self.__to_json__(), default=lambda o: o.__to_json__(), sort_keys=True)
 
+    def __copy__(self):
+        new = type(self).__new__(type(self))
+        new.__dict__ = self.__dict__.copy()
+        # The copy is often changed straight away, as by to_instance, so it works out its own key
+        new.__dict__.pop("_key", None)
+        return new
+
+    def __deepcopy__(self, memo):
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        for attribute, value in self.__dict__.items():
+            # Deep copies are often changed straight away too, as by GiveEffect
+            if attribute != "_key":
+                new.__dict__[attribute] = copy.deepcopy(value, memo)
+        return new
+
 
 class Tag(JSONObject):
+    def copy(self):
+        """
+        Creates a copy of this tag, ready to be given to a new owner.
+
+        Everything which describes what a tag does (its selectors, conditions, actions and events) is left unchanged
+        once the tag has been created, so it is shared between the copies.  Only the state which belongs to the owner
+        of the tag is duplicated, which makes this much cheaper than a deep copy.  Tags which have no such state are
+        shared outright.
+
+        :rtype: Tag
+        """
+        return self
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         new = cls.__new__(cls)
         memo[id(self)] = new
         for attribute, value in self.__dict__.items():
+            if attribute == "_key":
+                continue
             if attribute != "owner":
                 setattr(new, attribute, copy.deepcopy(value, memo))
             else:
@@ -42,6 +142,40 @@ class Tag(JSONObject):
         return new
 
 
+def copy_tags(tags):
+    """
+    Copies a list of tags for a new owner, using :meth:`Tag.copy`
+
+    :param list tags: The tags to copy
+    :rtype: list
+    """
+    if not tags:
+        return []
+    return [tag.copy() for tag in tags]
+
+
+def remove_tag(tags, tag):
+    """
+    Removes a tag from a list.  If the tag itself isn't in the list, the first tag which is equal to it (see
+    :meth:`JSONObject.eq`) is removed instead.
+
+    :param list tags: The tags to remove the tag from
+    :param Tag tag: The tag to remove
+    :return: The tag which was removed, or None if there was no such tag
+    :rtype: Tag
+    """
+    for index, other in enumerate(tags):
+        if other is tag:
+            del tags[index]
+            return other
+    key = tag.key()
+    for index, other in enumerate(tags):
+        if other.key() == key:
+            del tags[index]
+            return other
+    return None
+
+
 class Aura(Tag):
     def __init__(self, status, selector, condition=None, expires=False):
         self.owner = None
@@ -49,25 +183,105 @@ class Aura(Tag):
         self.selector = selector
         self.condition = condition
         self.expires = expires
+        #: The characters that the status has been applied to, unless it is passive
+        self.affected = []
 
     def set_owner(self, owner):
         self.owner = owner
 
     def apply(self):
+        self.affected = []
         if not self.condition or self.condition.evaluate(self.owner, self.owner):
             targets = self.selector.get_targets(self.owner)
             for target in targets:
                 self.status.act(self.owner, target)
+            if not self.status.passive:
+                self.affected = targets
 
     def unapply(self):
         targets = self.selector.get_targets(self.owner)
         for target in targets:
             self.status.unact(self.owner, target)
+        self.affected = []
 
     def match(self, obj):
         return (not self.condition or self.condition.evaluate(self.owner, self.owner)) and \
             self.selector.match(self.owner, obj)
 
+    def fixed(self):
+        """
+        Checks whether what this aura matches, and what it does to a stat, only changes when the buffs, auras or minions
+        in the game do, so that stats worked out under it can be kept until then
+        (see :meth:`hearthbreaker.game_objects.GameObject.calculate_stat`).
+
+        :rtype: bool
+        """
+        # What an aura does is never changed once it has been made, so the answer is kept, as with the key
+        fixed = self.__dict__.get("_fixed")
+        if fixed is None:
+            fixed = self._fixed = (not self.condition or self.condition.fixed()) and self.selector.fixed() and \
+                self.status.fixed()
+        return fixed
+
+    def depends_on_board(self):
+        """
+        Checks whether a minion entering or leaving the board can change which other minions this aura matches, as
+        with an aura on adjacent minions.  Other auras only need to check the minion which came or went.
+
+        :rtype: bool
+        """
+        depends = self.__dict__.get("_depends_on_board")
+        if depends is None:
+            depends = self._depends_on_board = (self.condition is not None and self.condition.depends_on_board()) or \
+                self.selector.depends_on_board()
+        return depends
+
+    def update_affected(self, minions):
+        """
+        Applies the status to those of a player's minions which have come under this aura since it was last applied,
+        and removes it from those which have left it.  Called when a minion enters or leaves the board, for auras which
+        :meth:`depends_on_board`.
+
+        :param list minions: The minions of one player
+        """
+        if self.status.passive:
+            return
+        # Characters are compared by identity, as copies of the same minion compare equal
+        affected_ids = {id(character) for character in self.affected}
+        minion_ids = {id(minion) for minion in minions}
+        affected = [character for character in self.affected if id(character) not in minion_ids]
+        for minion in minions:
+            is_in = id(minion) in affected_ids
+            matches = self.match(minion)
+            if not is_in and matches:
+                self.status.act(self.owner, minion)
+            elif is_in and not matches:
+                self.status.unact(self.owner, minion)
+            if matches:
+                affected.append(minion)
+        self.affected = affected
+
+    def add_affected(self, character, actor):
+        """
+        Applies the status to a character which has just come onto the board or taken the place of another, if it
+        comes under this aura
+
+        :param character: The :class:`hearthbreaker.game_objects.Character` which has been put in place
+        :param actor: The :class:`hearthbreaker.game_objects.Character` acting on it: the one which was replaced, or
+                      the owner of this aura
+        """
+        if not self.status.passive and self.match(character):
+            self.status.act(actor, character)
+            self.affected.append(character)
+
+    def remove_affected(self, character):
+        """
+        Forgets a character which has left the board, without removing the status from it
+
+        :param character: The :class:`hearthbreaker.game_objects.Character` which has left
+        """
+        self.affected = [other for other in self.affected if other is not character]
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -90,6 +304,13 @@ class Aura(Tag):
             condition = Condition.from_json(**condition)
         return Aura(status, selector, condition, expires)
 
+    def copy(self):
+        new_aura = copy.copy(self)
+        new_aura.owner = None
+        new_aura.status = self.status.copy()
+        new_aura.affected = []
+        return new_aura
+
 
 class Buff(Tag):
     def __init__(self, status, condition=None):
@@ -107,6 +328,18 @@ class Buff(Tag):
     def unapply(self):
         self.status.unact(self.owner, self.owner)
 
+    def fixed(self):
+        """
+        Checks whether what this buff does to a stat only changes when the buffs, auras or minions in the game do, as
+        for :meth:`Aura.fixed`.
+
+        :rtype: bool
+        """
+        fixed = self.__dict__.get("_fixed")
+        if fixed is None:
+            fixed = self._fixed = (not self.condition or self.condition.fixed()) and self.status.fixed()
+        return fixed
+
     def is_minion(self):
         return False
 
@@ -115,6 +348,12 @@ class Buff(Tag):
         new_instance.status = self.status.to_instance(target)
         return new_instance
 
+    def copy(self):
+        new_buff = copy.copy(self)
+        new_buff.owner = None
+        new_buff.status = self.status.copy()
+        return new_buff
+
     def __to_json__(self):
         if self.condition:
             return {
@@ -194,7 +433,11 @@ class AuraUntil(Aura):
         return AuraUntil(status, selector, until, expires)
 
 
-class Player(metaclass=abc.ABCMeta):
+class Player(metaclass=JSONType):
+    json_types = {}
+    json_module = "hearthbreaker.tags.selector"
+    json_suffix = "Player"
+
     @abc.abstractmethod
     def get_players(self, target):
         pass
@@ -205,44 +448,30 @@ class Player(metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name):
-        from hearthbreaker.tags.selector import FriendlyPlayer, EnemyPlayer, BothPlayer, PlayerOne, \
-            PlayerTwo, CurrentPlayer, OtherPlayer
-        if name == "friendly":
-            return FriendlyPlayer()
-        elif name == "enemy":
-            return EnemyPlayer()
-        elif name == "both":
-            return BothPlayer()
-        elif name == "player_one":
-            return PlayerOne()
-        elif name == "player_two":
-            return PlayerTwo()
-        elif name == "current_player":
-            return CurrentPlayer()
-        elif name == "other_player":
-            return OtherPlayer()
+        return Player.json_class(name)()
 
 
 class Picker(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.selector"
+    json_suffix = "Picker"
 
     @abc.abstractmethod
     def pick(self, source, targets):
         pass
 
     @staticmethod
-    def from_json(name, count=0):
-        from hearthbreaker.tags.selector import UserPicker, AllPicker, RandomPicker
-        if name == "user":
-            return UserPicker()
-        elif name == "all":
-            return AllPicker()
-        elif name == "random":
-            return RandomPicker(count)
-        else:
-            raise TypeError("What are you even doing?")
+    def from_json(name, **kwargs):
+        cls = Picker.json_class(name)
+        obj = cls.__new__(cls)
+        return obj.__from_json__(**kwargs)
 
 
 class Selector(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.selector"
+    json_suffix = "Selector"
+
     @abc.abstractmethod
     def get_targets(self, source, target=None):
         pass
@@ -254,17 +483,36 @@ class Selector(JSONObject, metaclass=abc.ABCMeta):
     def match(self, source, obj):
         pass
 
+    def fixed(self):
+        """
+        Checks whether what this selector matches only changes when the buffs, auras or minions in the game do, or when
+        the turn changes.  Selectors with a condition are only as fixed as it is.
+
+        :rtype: bool
+        """
+        condition = getattr(self, "condition", None)
+        return not condition or condition.fixed()
+
+    def depends_on_board(self):
+        """
+        Checks whether other minions entering or leaving the board, or moving along it, can change whether this
+        selector matches a minion.  Selectors with a condition depend on the board as much as it does.
+
+        :rtype: bool
+        """
+        condition = getattr(self, "condition", None)
+        return condition is not None and condition.depends_on_board()
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "") + "Selector"
-        cls = getattr(selector_mod, cls_name)
+        cls = Selector.json_class(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Action(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.action"
 
     @abc.abstractmethod
     def act(self, actor, target, other=None):
@@ -272,15 +520,37 @@ class Action(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.action as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Action.json_class(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
 class Status(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.status"
+
+    #: True for statuses whose act and unact do nothing, as their effect is worked out each time a stat is calculated.
+    #: Auras with such a status have nothing to do when characters come under them or leave them.
+    passive = False
+
+    def copy(self):
+        """
+        Creates a copy of this status for a new aura or buff.  Most statuses keep nothing about the characters they
+        act on, so they are shared outright, as with :meth:`Tag.copy`.  Those that do override this to make a copy.
+
+        :rtype: Status
+        """
+        return self
+
+    def fixed(self):
+        """
+        Checks whether this status always changes a stat by the same amount.  Statuses whose amount is worked out from
+        the game each time are not.
+
+        :rtype: bool
+        """
+        return not isinstance(getattr(self, "amount", None), Function)
+
     @abc.abstractmethod
     def act(self, actor, target):
         pass
@@ -291,15 +561,12 @@ class Status(JSONObject, metaclass=abc.ABCMeta):
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.status as status_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(status_mod, cls_name)
+        cls = Status.json_class(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
 
-class Amount(abc.ABCMeta):
+class Amount(JSONType):
     def __init__(cls, name, bases, dct):
         super(Amount, cls).__init__(name, bases, dct)
         base_init = cls.__init__
@@ -350,12 +617,37 @@ class Amount(abc.ABCMeta):
         cls.to_instance = to_instance
 
 
+class EventAction:
+    """
+    What an :class:`Event` binds in place of the function it is given, so that it can check its condition first.
+
+    Events are shared between every copy of the tags they belong to, so they keep nothing about what they have been
+    bound to.  Instead, an action is made each time one is bound, and another equal to it is made to unbind it again.
+    """
+
+    def __init__(self, event, target, func):
+        self.event = event
+        self.target = target
+        self.func = func
+
+    def __call__(self, *args):
+        self.event.__action__(self.target, self.func, *args)
+
+    def __eq__(self, other):
+        return type(other) is EventAction and self.event is other.event and self.target is other.target and \
+            self.func == other.func
+
+    def __hash__(self):
+        return hash((id(self.event), id(self.target)))
+
+
 class Event(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.event"
+
     def __init__(self, event_name, condition=None):
         self.event_name = event_name
         self.condition = condition
-        self.__func__ = None
-        self.__target__ = None
 
     @abc.abstractmethod
     def bind(self, target, func):
@@ -365,16 +657,13 @@ class Event(JSONObject, metaclass=abc.ABCMeta):
     def unbind(self, target, func):
         pass
 
-    def __action__(self, *args):
-        if self.condition.evaluate(self.__target__, *args):
-            self.__func__(*args)
+    def __action__(self, target, func, *args):
+        if self.condition.evaluate(target, *args):
+            func(*args)
 
     @staticmethod
     def from_json(event_name, **kwargs):
-        import hearthbreaker.tags.event as event_mod
-
-        cls_name = string.capwords(event_name, '_').replace("_", "")
-        cls = getattr(event_mod, cls_name)
+        cls = Event.json_class(event_name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -411,15 +700,13 @@ class Event(JSONObject, metaclass=abc.ABCMeta):
 class MinionEvent(Event):
     def bind(self, target, func):
         if self.condition:
-            self.__target__ = target
-            self.__func__ = func
-            target.bind(self.event_name, self.__action__)
+            target.bind(self.event_name, EventAction(self, target, func))
         else:
             target.bind(self.event_name, func)
 
     def unbind(self, target, func):
         if self.condition:
-            target.unbind(self.event_name, self.__action__)
+            target.unbind(self.event_name, EventAction(self, target, func))
         else:
             target.unbind(self.event_name, func)
 
@@ -432,16 +719,14 @@ class PlayerEvent(Event):
     def bind(self, target, func):
         for player in self.player.get_players(target.player):
             if self.condition:
-                self.__target__ = target
-                self.__func__ = func
-                player.bind(self.event_name, self.__action__)
+                player.bind(self.event_name, EventAction(self, target, func))
             else:
                 player.bind(self.event_name, func)
 
     def unbind(self, target, func):
         for player in self.player.get_players(target.player):
             if self.condition:
-                player.unbind(self.event_name, self.__action__)
+                player.unbind(self.event_name, EventAction(self, target, func))
             else:
                 player.unbind(self.event_name, func)
 
@@ -489,6 +774,12 @@ class Effect(Tag):
             if not tag.do(self.owner, focus, other):
                 break
 
+    def copy(self):
+        new_effect = copy.copy(self)
+        new_effect.owner = None
+        new_effect.other = None
+        return new_effect
+
     def __to_json__(self):
         return {
             'event': self.event,
@@ -503,16 +794,48 @@ class Effect(Tag):
 
 
 class Condition(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.condition"
+
     @abc.abstractmethod
     def evaluate(self, target, *args):
         pass
 
+    def card_key(self, target):
+        """
+        Finds the key of the cards this condition is true for in a :class:`hearthbreaker.tags.card_source.CardIndex`, so
+        that they can be looked up instead of checking every card.
+
+        :param target: The object this condition is being evaluated for
+        :return: The attribute checked and the value it must have, such as ``("mana", 2)``, or None if this condition
+                 can't be looked up
+        :rtype: tuple
+        """
+        return None
+
+    def fixed(self):
+        """
+        Checks whether this condition only depends on what the objects it is evaluated for are, where they are on the
+        board, and whose turn it is, and not on things like their health or the cards in a hand.  Stats worked out with
+        such conditions can be kept until the buffs, auras or minions in the game change
+        (see :meth:`hearthbreaker.game_objects.GameObject.calculate_stat`).
+
+        :rtype: bool
+        """
+        return False
+
+    def depends_on_board(self):
+        """
+        Checks whether this condition can change for an object when other minions enter or leave the board, or move
+        along it, as adjacency does.  Only conditions which are known to depend on the object alone say they don't.
+
+        :rtype: bool
+        """
+        return True
+
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.condition as action_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(action_mod, cls_name)
+        cls = Condition.json_class(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -639,16 +962,15 @@ class Choice(ActionTag):
 
 
 class Function(JSONObject, metaclass=abc.ABCMeta):
+    json_types = {}
+    json_module = "hearthbreaker.tags.selector"
 
     def do(self, target, *args):
         pass
 
     @staticmethod
     def from_json(name, **kwargs):
-        import hearthbreaker.tags.selector as selector_mod
-
-        cls_name = string.capwords(name, '_').replace("_", "")
-        cls = getattr(selector_mod, cls_name)
+        cls = Function.json_class(name)
         obj = cls.__new__(cls)
         return obj.__from_json__(**kwargs)
 
@@ -1,10 +1,64 @@
 import abc
-from itertools import chain
 
 from hearthbreaker.tags.base import CardQuery, Player, Condition, Selector
 from hearthbreaker.tags.selector import FriendlyPlayer
 
 
+class CardIndex:
+    """
+    An unchanging list of cards, indexed by the attributes that conditions check most often: the type of card, its
+    class, mana cost and rarity, and the type of minion.
+    """
+
+    def __init__(self, cards):
+        """
+        Indexes a list of cards
+
+        :param list[hearthbreaker.game_objects.Card] cards: The cards to index, which must not be changed afterwards
+        """
+        #: The cards which were indexed, in order
+        self.cards = tuple(cards)
+        index = {}
+        for position, card in enumerate(self.cards):
+            for key in self.keys(card):
+                index.setdefault(key, []).append(position)
+        # The positions of the cards with each key, in order, and as a set to check against
+        self._positions = {key: tuple(positions) for key, positions in index.items()}
+        self._position_sets = {key: frozenset(positions) for key, positions in index.items()}
+
+    @staticmethod
+    def keys(card):
+        """
+        Lists the keys a card is indexed under, as returned by :meth:`hearthbreaker.tags.base.Condition.card_key`
+
+        :param hearthbreaker.game_objects.Card card: The card to find the keys for
+        :rtype: list[tuple]
+        """
+        keys = [("type", card_type) for card_type in ["minion", "spell", "secret", "weapon"]
+                if getattr(card, "is_" + card_type)()]
+        keys.extend([("character_class", card.character_class), ("mana", card.mana), ("rarity", card.rarity)])
+        if card.is_minion():
+            keys.append(("minion_type", card.minion_type))
+        return keys
+
+    def find(self, keys):
+        """
+        Finds the cards which have all of the given keys
+
+        :param list[tuple] keys: The keys the cards must have
+        :return: The cards found, in the order they were indexed
+        :rtype: list[hearthbreaker.game_objects.Card]
+        """
+        if not keys:
+            return list(self.cards)
+        keys = sorted(keys, key=lambda key: len(self._positions.get(key, ())))
+        positions = self._positions.get(keys[0], ())
+        for key in keys[1:]:
+            position_set = self._position_sets.get(key, frozenset())
+            positions = [position for position in positions if position in position_set]
+        return [self.cards[position] for position in positions]
+
+
 class CardSource(CardQuery, metaclass=abc.ABCMeta):
 
     def __init__(self, conditions):
@@ -69,9 +123,9 @@ class DeckSource(CardSource):
     def get_list(self, target, player, owner):
         players = self.player.get_players(target)
         if len(players) == 1:
-            return filter(lambda c: not c.drawn, players[0].deck.cards)
+            return players[0].deck.undrawn()
         else:
-            return filter(lambda c: not c.drawn, chain(players[0].deck.cards, players[1].deck.cards))
+            return players[0].deck.undrawn() + players[1].deck.undrawn()
 
     def __to_json__(self):
         return {
@@ -149,9 +203,17 @@ class CollectionSource(CardSource):
     def __init__(self, conditions):
         self.conditions = conditions
 
+    def get_card(self, target, player, owner):
+        # The cards in the index are shared, so a copy of the card picked is made
+        card = super().get_card(target, player, owner)
+        if card is not None:
+            return card.copy()
+        return None
+
     def get_list(self, target, player, owner):
-        from hearthbreaker.engine import get_cards
-        return get_cards()
+        from hearthbreaker.engine import get_collectible_index
+        keys = [condition.card_key(target) for condition in self.conditions]
+        return get_collectible_index().find([key for key in keys if key is not None])
 
     def __to_json__(self):
         return {
@@ -1,4 +1,5 @@
 import hearthbreaker
+from hearthbreaker import trace
 from hearthbreaker.constants import MINION_TYPE
 from hearthbreaker.tags.base import Condition, Amount
 
@@ -17,6 +18,15 @@ class IsSecret(Condition):
     def evaluate(self, target, obj, *args):
         return obj.is_secret()
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "type", "secret"
+
     def __to_json__(self):
         return {
             'name': 'is_secret'
@@ -27,6 +37,15 @@ class IsSpell(Condition):
     def evaluate(self, target, obj, *args):
         return obj.is_spell()
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "type", "spell"
+
     def __to_json__(self):
         return {
             'name': 'is_spell'
@@ -71,6 +90,9 @@ class ManaCost(Condition, metaclass=Amount):
     def evaluate(self, target, obj, *args):
         return obj.mana == self.get_amount(target, target)
 
+    def card_key(self, target):
+        return "mana", self.get_amount(target, target)
+
     def __to_json__(self):
         return {
             'name': 'mana_cost',
@@ -84,6 +106,15 @@ class IsMinion(Condition):
     def evaluate(self, target, minion, *args):
         return minion.is_minion()
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "type", "minion"
+
     def __to_json__(self):
         return {
             "name": 'is_minion'
@@ -104,6 +135,15 @@ class IsWeapon(Condition):
     def evaluate(self, target, weapon, *args):
         return weapon.is_weapon()
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "type", "weapon"
+
     def __to_json__(self):
         return {
             "name": 'is_weapon'
@@ -124,6 +164,12 @@ class MinionIsTarget(Condition):
     def evaluate(self, target, minion, *args):
         return minion is target
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'minion_is_target'
@@ -134,6 +180,12 @@ class MinionIsNotTarget(Condition):
     def evaluate(self, target, minion, *args):
         return minion is not target
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'minion_is_not_target'
@@ -144,6 +196,12 @@ class CardIsNotTarget(Condition):
     def evaluate(self, target, card, *args):
         return target.card is not card
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'card_is_not_target'
@@ -158,6 +216,12 @@ class Not(Condition):
     def evaluate(self, target, *args):
         return not self.condition.evaluate(target, *args)
 
+    def fixed(self):
+        return self.condition.fixed()
+
+    def depends_on_board(self):
+        return self.condition.depends_on_board()
+
     def __to_json__(self):
         return {
             'name': 'not',
@@ -180,6 +244,12 @@ class And(Condition):
                 return False
         return True
 
+    def fixed(self):
+        return all(condition.fixed() for condition in self.conditions)
+
+    def depends_on_board(self):
+        return any(condition.depends_on_board() for condition in self.conditions)
+
     def __to_json__(self):
         return {
             'name': 'and',
@@ -202,13 +272,22 @@ class IsType(Condition):
             if not minion.is_card():
                 if self.include_self or target is not minion:
                     if not minion.card:
-                        print(minion)
+                        trace.error(minion)
                     return minion.card.minion_type == self.minion_type
                 return False
             else:
                 return minion.minion_type == self.minion_type
         return False
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "minion_type", self.minion_type
+
     def __to_json__(self):
         return {
             'name': 'is_type',
@@ -229,6 +308,9 @@ class IsClass(Condition, metaclass=Amount):
     def evaluate(self, target, card, *args):
         return card.character_class == self.get_amount(target, card, *args)
 
+    def card_key(self, target):
+        return "character_class", self.get_amount(target, target)
+
     def __to_json__(self):
         return {
             'name': 'is_class'
@@ -294,6 +376,15 @@ class IsRarity(Condition):
         else:
             return minion.card.rarity == self.rarity
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
+    def card_key(self, target):
+        return "rarity", self.rarity
+
 
 class MinionCountIs(Condition):
     def __init__(self, count):
@@ -302,6 +393,9 @@ class MinionCountIs(Condition):
     def evaluate(self, target, *args):
         return len(target.player.minions) == self.count
 
+    def fixed(self):
+        return True
+
     def __to_json__(self):
         return {
             'name': 'minion_count_is',
@@ -316,6 +410,9 @@ class OpponentMinionCountIsGreaterThan(Condition):
     def evaluate(self, target, *args):
         return len(target.player.opponent.minions) > self.count
 
+    def fixed(self):
+        return True
+
     def __to_json__(self):
         return {
             'name': 'opponent_minion_count_is_greater_than',
@@ -350,6 +447,9 @@ class Adjacent(Condition):
         return minion.player is target.player and \
             (minion.index == target.index - 1) or (minion.index == target.index + 1)
 
+    def fixed(self):
+        return True
+
 
 class TargetAdjacent(Condition):
     def __to_json__(self):
@@ -478,6 +578,12 @@ class HasCardName(Condition):
             return minion.name == self.card_name
         return minion.card.name == self.card_name
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'has_card_name',
@@ -489,6 +595,12 @@ class OwnersTurn(Condition):
     def evaluate(self, target, minion, *args):
         return minion.player is minion.player.game.current_player
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'owners_turn'
@@ -499,6 +611,12 @@ class IsHero(Condition):
     def evaluate(self, target, character, *args):
         return character.is_hero()
 
+    def fixed(self):
+        return True
+
+    def depends_on_board(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'is_hero'
@@ -1,4 +1,4 @@
-from hearthbreaker.tags.base import MinionEvent, PlayerEvent
+from hearthbreaker.tags.base import MinionEvent, PlayerEvent, EventAction
 from hearthbreaker.tags.condition import MinionIsNotTarget, CardIsNotTarget
 from hearthbreaker.tags.selector import FriendlyPlayer
 
@@ -9,20 +9,18 @@ class SpellCast(PlayerEvent):
 
     def bind(self, target, func):
         for player in self.player.get_players(target.player):
-            self.__target__ = target
-            self.__func__ = func
-            player.bind("card_played", self.__action__)
+            player.bind("card_played", EventAction(self, target, func))
 
     def unbind(self, target, func):
         for player in self.player.get_players(target.player):
-            player.unbind("card_played", self.__action__)
+            player.unbind("card_played", EventAction(self, target, func))
 
-    def __action__(self, card, index):
+    def __action__(self, target, func, card, index):
         if card.is_spell():
             if self.condition:
-                super().__action__(card, index)
+                super().__action__(target, func, card, index)
             else:
-                self.__func__(card, index)
+                func(card, index)
 
 
 class CardPlayed(PlayerEvent):
@@ -59,6 +59,8 @@ class PlayerTwo(Player):
 
 
 class CurrentPlayer(Player):
+    json_name = "current_player"
+
     def match(self, source, obj):
         return obj.player is source.player.game.current_player
 
@@ -70,6 +72,8 @@ class CurrentPlayer(Player):
 
 
 class OtherPlayer(Player):
+    json_name = "other_player"
+
     def match(self, source, obj):
         return obj.player is source.player.game.other_player
 
@@ -111,6 +115,10 @@ class RandomPicker(Picker):
     def __init__(self, count=1):
         self.count = count
 
+    def __from_json__(self, count=0):
+        self.__init__(count)
+        return self
+
     def pick(self, source, targets):
         for i in range(self.count):
             if len(targets) > 0:
@@ -178,6 +186,9 @@ class LastDrawnSelector(CardSelector):
     def match(self, source, obj):
         return obj in self.get_targets(source, obj)
 
+    def fixed(self):
+        return False
+
     def __to_json__(self):
         return {
             'name': 'last_drawn',
@@ -1,7 +1,11 @@
+import copy
+
 from hearthbreaker.tags.base import Status, Amount
 
 
 class ChangeAttack(Status, metaclass=Amount):
+    passive = True
+
     def __init__(self):
         super().__init__()
 
@@ -21,9 +25,16 @@ class ChangeAttack(Status, metaclass=Amount):
 
 
 class ChangeHealth(Status, metaclass=Amount):
+    # The amount is replaced by the one worked out each time the status acts
+    key_fixed = False
+
     def __init__(self):
         super().__init__()
 
+    def copy(self):
+        # The amount is worked out again each time the status acts, and kept to be undone later
+        return copy.copy(self)
+
     def act(self, actor, target):
         self.amount = self.get_amount(actor, target)
         if self.amount > 0:
@@ -51,6 +62,8 @@ class ChangeHealth(Status, metaclass=Amount):
 
 
 class MinimumHealth(Status):
+    passive = True
+
     def __init__(self, min_health):
         self.min_health = min_health
 
@@ -107,6 +120,8 @@ class DoubleAttack(ChangeAttack):
 
 
 class ManaChange(Status, metaclass=Amount):
+    passive = True
+
     def __init__(self, minimum=0):
         super().__init__()
         self.minimum = minimum
@@ -133,6 +148,8 @@ class ManaChange(Status, metaclass=Amount):
 
 
 class Charge(Status):
+    passive = True
+
     def act(self, actor, target):
         pass
 
@@ -214,6 +231,8 @@ class Immune(Status):
 
 
 class Windfury(Status):
+    passive = True
+
     def act(self, actor, target):
         pass
 
@@ -246,6 +265,8 @@ class MegaWindfury(Windfury):
 
 
 class CanAttack(Status):
+    passive = True
+
     def __init__(self):
         super().__init__()
 
@@ -372,6 +393,9 @@ class AttackEqualsHealth(Status):
     def __copy__(self):
         return AttackEqualsHealth()
 
+    def copy(self):
+        return AttackEqualsHealth()
+
     def __to_json__(self):
         return {
             'name': 'attack_equals_health'
@@ -0,0 +1,101 @@
+"""
+Tracing of what the agents and the engine are doing.
+
+The agents and the engine describe what they do through :func:`error`, :func:`info` and :func:`debug`, which take the
+same arguments as :func:`print`.  By default nothing is traced, and each of these calls returns straight away, which
+matters in searches that play out thousands of turns for every move.  Where even building the arguments would cost
+something, check :func:`enabled` first.
+
+Tracing is turned on by giving a sink, which is called with each message as a string, and the most detailed level to
+pass to it.  :func:`verbose` sends everything to standard output, as the agents always used to.
+
+**Example**::
+
+    from hearthbreaker import trace
+
+    trace.verbose()                                 # print everything
+    trace.set_sink(messages.append, trace.INFO)     # keep a message or so per turn
+    trace.quiet()                                   # back to the default
+"""
+import sys
+
+#: Something has gone wrong inside the simulation
+ERROR = 1
+#: A message or so per turn: the moves an agent made, or the state of the game
+INFO = 2
+#: The reasoning inside a turn: each attack, target or option considered
+DEBUG = 3
+
+_sink = None
+_level = 0
+
+
+def set_sink(sink, level=DEBUG):
+    """
+    Sends the messages up to level to sink
+
+    :param sink: A function called with each message, or None to turn tracing off
+    :param int level: The most detailed level of message to pass on, one of ERROR, INFO and DEBUG
+    """
+    global _sink, _level
+    _sink = sink
+    _level = level if sink is not None else 0
+
+
+def verbose(level=DEBUG):
+    """
+    Writes the messages up to level to standard output
+
+    :param int level: The most detailed level of message to write
+    """
+    set_sink(_write_stdout, level)
+
+
+def quiet():
+    """
+    Turns tracing off, which is the default
+    """
+    set_sink(None)
+
+
+def enabled(level):
+    """
+    Whether messages at level are being traced
+
+    :param int level: One of ERROR, INFO and DEBUG
+    :rtype: bool
+    """
+    return level <= _level
+
+
+def _write_stdout(message):
+    # Looked up on every call, so that redirecting sys.stdout redirects the trace as well
+    sys.stdout.write(message)
+
+
+def _emit(values, sep=" ", end="\n"):
+    _sink(sep.join(str(value) for value in values) + end)
+
+
+def error(*values, **kwargs):
+    """
+    Traces a message about something that has gone wrong.  Takes the same arguments as :func:`print`.
+    """
+    if ERROR <= _level:
+        _emit(values, **kwargs)
+
+
+def info(*values, **kwargs):
+    """
+    Traces a message about a turn.  Takes the same arguments as :func:`print`.
+    """
+    if INFO <= _level:
+        _emit(values, **kwargs)
+
+
+def debug(*values, **kwargs):
+    """
+    Traces a message about the reasoning inside a turn.  Takes the same arguments as :func:`print`.
+    """
+    if DEBUG <= _level:
+        _emit(values, **kwargs)
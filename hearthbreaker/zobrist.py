@@ -0,0 +1,132 @@
+"""
+Zobrist hashing of game positions.
+
+A position is broken down into features, such as "player one has a 3/2 Bloodfen Raptor in the second board slot" or
+"player two has a second Fireball in hand".  Each feature is given a fixed 64-bit key, and the hash of a position is
+the exclusive or of the keys of all of its features.  Two games that have reached the same position through a
+different order of moves therefore have the same hash, however their objects were created.
+
+Keys are derived from a digest of the feature itself, rather than drawn from a random number generator, so hashes are
+the same in every process.  They are worked out the first time a feature is seen, and then remembered.
+
+The hash covers what the players can see and act on: heroes, weapons, minions and their current stats, the effects,
+auras, buffs and deathrattles on each of them, hands, secrets, mana and the cards left in each deck.  Tags are hashed by
+their keys (see :meth:`hearthbreaker.tags.base.JSONObject.key`), so that two minions with the same stats but different
+buffs give different hashes, and the search doesn't take one for the other.  It does not cover the random number
+generator, or the order of the cards left in the decks.  A second hash, the board hash, leaves out the hands and decks
+as well, so it is the same for positions which only differ in the cards that have been drawn.
+
+The hash is worked out from the position each time it is asked for, rather than kept up to date, as the game changes
+its objects directly in too many places for each change to be caught.
+"""
+import hashlib
+
+_keys = {}
+
+# The zones which the board hash leaves out, as what they hold depends on the cards drawn
+_DRAWN_ZONES = ("hand", "deck")
+
+
+def feature_key(feature):
+    """
+    The 64-bit key for a single feature of a position
+
+    :param tuple feature: A tuple of strings, numbers and booleans describing the feature
+    :rtype: int
+    """
+    key = _keys.get(feature)
+    if key is None:
+        # Flags are stored as both booleans and numbers, which compare equal, so they must give the same digest too
+        normalized = tuple(int(value) if isinstance(value, bool) else value for value in feature)
+        digest = hashlib.sha1(repr(normalized).encode("utf-8")).digest()
+        key = _keys[feature] = int.from_bytes(digest[:8], "little")
+    return key
+
+
+def tag_keys(tags):
+    """
+    Describes a list of tags by their keys, for a feature.  The keys are sorted, as the order the tags were added in
+    doesn't matter to the position.
+
+    :param list tags: The tags to describe
+    :rtype: tuple
+    """
+    if not tags:
+        return ()
+    return tuple(sorted(tag.key() for tag in tags))
+
+
+def _counted(zone, player_index, names):
+    # Identical features would cancel each other out, so repeated cards are numbered
+    counts = {}
+    for name in names:
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        yield zone, player_index, name, count
+
+
+def game_features(game):
+    """
+    Lists the features of the position a game is in.
+
+    :param hearthbreaker.engine.Game game: The game to describe
+    :return: A generator of feature tuples
+    """
+    yield "turn", game._turns_passed, game.players.index(game.current_player)
+    for index, player in enumerate(game.players):
+        yield ("player", index, player.mana, player.max_mana, player.upcoming_overload, player.current_overload,
+               player.fatigue, player.spell_damage, tag_keys(player.effects), tag_keys(player.player_auras),
+               tag_keys(player.object_auras))
+        hero = player.hero
+        yield ("hero", index, hero.card.name, hero.health, hero.calculate_max_health(), hero.armor,
+               hero.calculate_attack(), hero.attacks_performed, hero.frozen, hero.immune, hero.dead, hero.power.used,
+               tag_keys(hero.buffs))
+        if player.weapon:
+            weapon = player.weapon
+            yield ("weapon", index, weapon.card.name if weapon.card else None, weapon.base_attack,
+                   weapon.durability, tag_keys(weapon.buffs))
+        # Minions are placed by where they stand in the list, as it may have been filtered without renumbering them
+        for slot, minion in enumerate(player.minions):
+            yield ("minion", index, slot, minion.card.name, minion.health, minion.calculate_max_health(),
+                   minion.calculate_attack(), minion.taunt, minion.divine_shield, minion.stealth, minion.frozen,
+                   minion.immune, minion.windfury(), minion.charge(), minion.exhausted, minion.attacks_performed,
+                   minion.can_be_targeted_by_spells, tag_keys(minion.deathrattle), tag_keys(minion.effects),
+                   tag_keys(minion.buffs), tag_keys(minion.auras))
+        for feature in _counted("hand", index, ((card.name, card.mana_cost()) for card in player.hand)):
+            yield feature
+        for feature in _counted("secret", index, (secret.name for secret in player.secrets)):
+            yield feature
+        for feature in _counted("deck", index, player.deck.undrawn_names()):
+            yield feature
+
+
+def state_hash(game):
+    """
+    The Zobrist hash of the position a game is in
+
+    :param hearthbreaker.engine.Game game: The game to hash
+    :rtype: int
+    """
+    value = 0
+    for feature in game_features(game):
+        value ^= feature_key(feature)
+    return value
+
+
+def state_hashes(game):
+    """
+    The Zobrist hash of the position a game is in, as :func:`state_hash` works it out, along with its board hash, which
+    leaves out the cards in each hand and deck
+
+    :param hearthbreaker.engine.Game game: The game to hash
+    :return: The hash and the board hash
+    :rtype: tuple
+    """
+    value = 0
+    board = 0
+    for feature in game_features(game):
+        key = feature_key(feature)
+        value ^= key
+        if feature[0] not in _DRAWN_ZONES:
+            board ^= key
+    return value, board
@@ -0,0 +1,54 @@
+"""
+Measures how long it takes to import :mod:`hearthbreaker.engine`, and then to look up the cards for a deck with
+:func:`hearthbreaker.engine.card_lookup`.
+
+Card modules are only imported when a card in them is first looked up, so the import itself should stay fast however
+many cards there are, and looking up a deck only pays for the modules its cards are in.  Each measurement is made in a
+new interpreter, so that nothing has been imported already.
+
+usage: python import_benchmark.py [--runs RUNS] [deck]
+
+With no deck given, ``example.hsdeck`` in this directory is used.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MEASURE = """
+import time
+start = time.perf_counter()
+import hearthbreaker.engine
+imported = time.perf_counter()
+from benchmark_decks import load_deck
+for name in load_deck({deck!r}):
+    hearthbreaker.engine.card_lookup(name)
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def measure(deck_file):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.check_output([sys.executable, "-c", MEASURE.format(deck=deck_file)], cwd=directory)
+    return [float(seconds) for seconds in output.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the time taken to import the engine and look up a deck")
+    parser.add_argument("deck", nargs="?", help="The deck to look up.  Defaults to example.hsdeck.")
+    parser.add_argument("--runs", type=int, default=20, help="How many times to measure")
+    args = parser.parse_args()
+
+    deck_file = os.path.abspath(args.deck or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                          "example.hsdeck"))
+    # The first run also compiles anything which has changed, which isn't what is being measured
+    measure(deck_file)
+    import_times, lookup_times = zip(*[measure(deck_file) for run in range(args.runs)])
+    for name, times in [("import", import_times), ("deck lookup", lookup_times)]:
+        print("{:<12} median {:7.1f} ms, min {:7.1f} ms".format(name, statistics.median(times) * 1000,
+                                                                min(times) * 1000))
+
+
+if __name__ == "__main__":
+    main()
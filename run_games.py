@@ -1,4 +1,5 @@
 import json
+from hearthbreaker import trace
 from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingAgent, OpponentAgent
 from hearthbreaker.agents.test_agent import TalkativeAgent
 from hearthbreaker.agents.aggressive_agent import AggressiveAgent
@@ -76,4 +77,5 @@ def do_stuff():
 
 
 if __name__ == "__main__":
+    trace.verbose()
     do_stuff()
@@ -0,0 +1,129 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+import hearthbreaker.cards.definitions
+from hearthbreaker.cards import SiltfinSpiritwalker, FieryWarAxe, StonetuskBoar
+from hearthbreaker.cards.definitions import load_cards, load_definitions, register_cards
+import hearthbreaker.engine
+from hearthbreaker.engine import card_lookup
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
+from tests.testing_utils import generate_game_for
+
+
+def tags_json(tags):
+    return json.dumps(tags, default=lambda o: o.__to_json__(), sort_keys=True)
+
+
+class TestCardDefinitions(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def write_definitions(self, card_defs):
+        filename = os.path.join(self.cache_dir, "cards.json")
+        with open(filename, "w") as definition_file:
+            json.dump(card_defs, definition_file)
+        return filename
+
+    def test_load(self):
+        cards = load_cards("card_defs.json", self.cache_dir)
+        self.assertEqual(455, len(cards))
+
+        card = cards["Siltfin Spiritwalker"]()
+        self.assertEqual("SiltfinSpiritwalker", type(card).__name__)
+        self.assertEqual(4, card.mana)
+        self.assertEqual(1, card.overload)
+        self.assertEqual(CHARACTER_CLASS.SHAMAN, card.character_class)
+        self.assertEqual(CARD_RARITY.EPIC, card.rarity)
+        self.assertEqual(MINION_TYPE.MURLOC, card.minion_type)
+        minion = card.create_minion(None)
+        expected = SiltfinSpiritwalker().create_minion(None)
+        self.assertEqual(2, minion.base_attack)
+        self.assertEqual(5, minion.base_health)
+        self.assertEqual(tags_json(expected.effects), tags_json(minion.effects))
+
+        card = cards["Fiery War Axe"]()
+        self.assertTrue(card.is_weapon())
+        weapon = card.create_weapon(None)
+        expected = FieryWarAxe().create_weapon(None)
+        self.assertEqual(expected.base_attack, weapon.base_attack)
+        self.assertEqual(expected.durability, weapon.durability)
+
+    def test_tags_belong_to_their_owner(self):
+        cards = load_cards("card_defs.json", self.cache_dir)
+        card = cards["Siltfin Spiritwalker"]()
+        first = card.create_minion(None)
+        second = card.create_minion(None)
+        self.assertIsNot(first.effects, second.effects)
+        self.assertIsNot(first.effects[0], second.effects[0])
+
+        card = cards["Abusive Sergeant"]()
+        self.assertIs(card.battlecry, cards["Abusive Sergeant"]().battlecry)
+
+    def test_cache(self):
+        first = load_definitions("card_defs.json", self.cache_dir)
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+        with mock.patch.object(hearthbreaker.cards.definitions, "compile_definitions") as compile_definitions:
+            second = load_definitions("card_defs.json", self.cache_dir)
+            self.assertFalse(compile_definitions.called)
+        self.assertEqual([definition.ref_name for definition in first],
+                         [definition.ref_name for definition in second])
+        self.assertEqual([tags_json(definition.object_tags) for definition in first],
+                         [tags_json(definition.object_tags) for definition in second])
+
+    def test_cache_follows_contents(self):
+        card_def = {
+            "name": "Data Boar",
+            "type": "minion",
+            "mana": 1,
+            "attack": 1,
+            "health": 1,
+            "rarity": "Free",
+            "character_class": "",
+            "minion_type": "Beast",
+            "collectible": False,
+        }
+        filename = self.write_definitions([card_def])
+        self.assertEqual(1, load_cards(filename, self.cache_dir)["Data Boar"]().mana)
+
+        card_def["mana"] = 2
+        self.write_definitions([card_def])
+        self.assertEqual(2, load_cards(filename, self.cache_dir)["Data Boar"]().mana)
+
+        # An unreadable cache is compiled again
+        for cache_file in os.listdir(self.cache_dir):
+            if cache_file.endswith(".pickle"):
+                with open(os.path.join(self.cache_dir, cache_file), "wb") as cached:
+                    cached.write(b"not a pickle")
+        self.assertEqual(2, load_cards(filename, self.cache_dir)["Data Boar"]().mana)
+
+    def test_register(self):
+        card_def = {
+            "name": "Data Boar",
+            "type": "minion",
+            "mana": 1,
+            "attack": 2,
+            "health": 1,
+            "rarity": "Free",
+            "character_class": "",
+            "collectible": False,
+            "impl": {"buffs": [{"status": {"name": "charge"}}]}
+        }
+        register_cards(load_cards(self.write_definitions([card_def]), self.cache_dir))
+        try:
+            game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+            card = card_lookup("Data Boar")
+            self.assertEqual("Data Boar", card.name)
+            minion = card.summon(game.players[0], game, 0)
+            self.assertEqual(2, minion.calculate_attack())
+            self.assertTrue(minion.charge())
+        finally:
+            del hearthbreaker.engine.card_table["Data Boar"]
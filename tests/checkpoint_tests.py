@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.agents.mcts_agent import uct, GameState
+from hearthbreaker.cards import StonetuskBoar, KoboldGeomancer, AbusiveSergeant, BloodfenRaptor, ChillwindYeti
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.engine import Game, Deck
+from hearthbreaker.game_objects import GameException
+
+
+def create_game(seed):
+    cards = []
+    for card_type in [StonetuskBoar, KoboldGeomancer, AbusiveSergeant, BloodfenRaptor, ChillwindYeti]:
+        cards.extend(card_type() for i in range(4))
+    other_cards = [card.copy() for card in cards]
+    game = Game([Deck(cards, Jaina()), Deck(other_cards, Malfurion())], [RandomAgent(), RandomAgent()], seed)
+    game.pre_game()
+    return game
+
+
+def describe(game):
+    description = [game._turns_passed, game.current_player is game.players[0]]
+    for player in game.players:
+        description.append((player.mana, player.max_mana, player.spell_damage, player.deck.left, player.hero.health,
+                            [card.name for card in player.hand],
+                            [(minion.card.name, minion.health, minion.calculate_attack()) for minion in player.minions],
+                            sorted((event, len(handlers)) for event, handlers in player.events.items())))
+    return description
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_undo(self):
+        game = create_game(1857)
+        for turn in range(6):
+            game.play_single_turn()
+
+        before = describe(game)
+        hand = list(game.current_player.hand)
+        minions = list(game.other_player.minions)
+        self.assertNotEqual([], minions)
+        checkpoint = game.checkpoint()
+
+        # A checkpoint can be returned to more than once
+        for attempt in range(2):
+            for turn in range(4):
+                game.play_single_turn()
+            self.assertNotEqual(before, describe(game))
+            game.undo_to(checkpoint)
+            self.assertEqual(before, describe(game))
+
+        # The objects in the game are the very same ones, rather than copies
+        for card, restored_card in zip(hand, game.current_player.hand):
+            self.assertIs(card, restored_card)
+        for minion, restored_minion in zip(minions, game.other_player.minions):
+            self.assertIs(minion, restored_minion)
+            self.assertIs(game.other_player, restored_minion.player)
+
+        # After undoing, the game carries on exactly as a game that was never wound back
+        unchanged_game = create_game(1857)
+        for turn in range(10):
+            unchanged_game.play_single_turn()
+        for turn in range(4):
+            game.play_single_turn()
+        self.assertEqual(describe(unchanged_game), describe(game))
+
+    def test_undo_other_game(self):
+        game = create_game(1857)
+        other_game = create_game(1857)
+        self.assertRaises(GameException, other_game.undo_to, game.checkpoint())
+
+    def test_search_leaves_game_unchanged(self):
+        game = create_game(1857)
+        for turn in range(6):
+            game.play_single_turn()
+        game._start_turn()
+
+        before = describe(game)
+        cards, attacks = uct(GameState(game), 10)
+        self.assertEqual(before, describe(game))
+        for card in cards:
+            self.assertIn(card, game.current_player.hand)
@@ -4,7 +4,10 @@ import unittest
 
 from hearthbreaker.agents.basic_agents import DoNothingAgent, PredictableAgent
 from hearthbreaker.cards.base import MinionCard
-from hearthbreaker.constants import MINION_TYPE, CARD_RARITY
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.constants import MINION_TYPE, CARD_RARITY, CHARACTER_CLASS
+from hearthbreaker.engine import Game, Deck
+from hearthbreaker.game_objects import Minion
 from hearthbreaker.tags.status import ChangeAttack
 from tests.agents.testing_agents import CardTestingAgent, OneCardPlayingAgent, PlayAndAttackAgent, \
     EnemyMinionSpellTestingAgent, HeroPowerAndCardPlayingAgent
@@ -91,6 +94,123 @@ class TestGameCopying(unittest.TestCase):
             game.play_single_turn()
 
 
+# Kept apart from TestGameCopying, which is also run against games copied through serialization
+class TestCopySharing(unittest.TestCase):
+    def test_copies_share_definitions(self):
+        cards = [KoboldGeomancer() for i in range(10)] + [AbusiveSergeant() for i in range(10)]
+        game = Game([Deck(cards, Jaina()), Deck([StonetuskBoar() for i in range(20)], Malfurion())],
+                    [OneCardPlayingAgent(), DoNothingAgent()], 1857)
+        game.pre_game()
+        while not game.players[0].minions or game.players[0].minions[0].card.name != "Kobold Geomancer":
+            game.play_single_turn()
+
+        new_game = game.copy()
+        player = game.players[0]
+        copied_player = new_game.players[0]
+
+        # Derived stats are recalculated in the copy, not counted twice
+        self.assertEqual(1, player.spell_damage)
+        self.assertEqual(1, copied_player.spell_damage)
+
+        # Each copy has its own tags, belonging to its own objects
+        minion = player.minions[0]
+        copied_minion = copied_player.minions[0]
+        self.assertIsNot(minion.buffs[0], copied_minion.buffs[0])
+        self.assertIs(minion.buffs[0].status, copied_minion.buffs[0].status)
+        self.assertIs(minion, minion.buffs[0].owner)
+        self.assertIs(copied_minion, copied_minion.buffs[0].owner)
+        self.assertIs(player.hero, player.hero.power.hero)
+        self.assertIs(copied_player.hero, copied_player.hero.power.hero)
+
+        # But the definition of each card still in the deck is shared.  Cards which have been drawn may have changed
+        # since, so they are made again.
+        for card, copied_card in zip(player.deck.cards, copied_player.deck.cards):
+            self.assertIsNot(card, copied_card)
+            self.assertEqual(card, copied_card)
+            if not card.drawn:
+                self.assertIs(card.battlecry, copied_card.battlecry)
+
+        index = [card.drawn for card in player.deck.cards].index(False)
+        copied_player.deck.cards[index].drawn = True
+        self.assertFalse(player.deck.cards[index].drawn)
+
+    def test_copies_share_events(self):
+        game = Game([Deck([StonetuskBoar() for i in range(20)], Jaina()),
+                     Deck([StonetuskBoar() for i in range(20)], Malfurion())],
+                    [DoNothingAgent(), DoNothingAgent()], 1857)
+        game.pre_game()
+        KnifeJuggler().summon(game.players[0], game, 0)
+        FrothingBerserker().summon(game.players[0], game, 1)
+        ChillwindYeti().summon(game.players[1], game, 0)
+        new_game = game.copy()
+
+        # Events keep nothing about what they are bound to, so the copies of an effect use the same one
+        juggler = game.players[0].minions[0]
+        copied_juggler = new_game.players[0].minions[0]
+        self.assertIsNot(juggler.effects[0], copied_juggler.effects[0])
+        self.assertIs(juggler.effects[0].event, copied_juggler.effects[0].event)
+        self.assertIs(game.players[0].minions[1].effects[0].event, new_game.players[0].minions[1].effects[0].event)
+
+        # But each copy still acts on its own game
+        StonetuskBoar().summon(new_game.players[0], new_game, 1)
+        self.assertEqual(5, game.players[1].minions[0].health)
+        self.assertEqual(4, new_game.players[1].minions[0].health)
+        juggler.silence()
+        StonetuskBoar().summon(new_game.players[0], new_game, 1)
+        self.assertEqual(3, new_game.players[1].minions[0].health)
+
+    def test_cards_share_tags(self):
+        game = Game([Deck([StonetuskBoar() for i in range(20)], Jaina()),
+                     Deck([StonetuskBoar() for i in range(20)], Malfurion())],
+                    [DoNothingAgent(), DoNothingAgent()], 1857)
+        game.pre_game()
+        KnifeJuggler.shared_minion = True
+        FieryWarAxe.shared_weapon = True
+        try:
+            first = KnifeJuggler().summon(game.players[0], game, 0)
+            second = KnifeJuggler().summon(game.players[0], game, 1)
+
+            # The tags of a kind of minion which is shared are only built once, and each minion has its own copy
+            self.assertIsNot(first.effects[0], second.effects[0])
+            self.assertIs(first.effects[0].tags[0], second.effects[0].tags[0])
+            self.assertIs(first, first.effects[0].owner)
+            self.assertIs(second, second.effects[0].owner)
+            self.assertNotEqual(first.key, second.key)
+            yeti = ChillwindYeti().summon(game.players[1], game, 0)
+            StonetuskBoar().summon(game.players[0], game, 2)
+            self.assertEqual(3, yeti.health)
+
+            first_axe = FieryWarAxe().new_weapon(game.players[0])
+            second_axe = FieryWarAxe().new_weapon(game.players[0])
+            self.assertIsNot(first_axe, second_axe)
+            self.assertIsNot(first_axe.events, second_axe.events)
+
+            # A card given a different create_minion uses it from then on
+            old_create_minion = KnifeJuggler.create_minion
+            try:
+                KnifeJuggler.create_minion = lambda self, player: Minion(1, 1)
+                self.assertEqual([], KnifeJuggler().summon(game.players[1], game, 1).effects)
+            finally:
+                KnifeJuggler.create_minion = old_create_minion
+            self.assertEqual(1, len(KnifeJuggler().summon(game.players[1], game, 2).effects))
+        finally:
+            del KnifeJuggler.shared_minion
+            del FieryWarAxe.shared_weapon
+
+        # Other cards make a new minion each time, since it may depend on the card
+        class SizedCard(MinionCard):
+            def __init__(self, size):
+                super().__init__("Sized Minion", size, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON, False)
+                self.size = size
+
+            def create_minion(self, player):
+                return Minion(self.size, self.size)
+
+        self.assertIsNot(first.effects[0].tags[0], KnifeJuggler().summon(game.players[0], game, 3).effects[0].tags[0])
+        self.assertEqual(2, SizedCard(2).summon(game.players[1], game, 3).health)
+        self.assertEqual(5, SizedCard(5).summon(game.players[1], game, 4).health)
+
+
 class TestMinionCopying(unittest.TestCase, TestUtilities):
     def setUp(self):
         random.seed(1857)
@@ -1,7 +1,8 @@
+import copy
 import random
 import unittest
 
-from hearthbreaker.agents.basic_agents import DoNothingAgent, PredictableAgent
+from hearthbreaker.agents.basic_agents import DoNothingAgent, PredictableAgent, RandomAgent
 from hearthbreaker.cards.base import SecretCard
 from hearthbreaker.cards.heroes import Malfurion, Jaina
 from hearthbreaker.cards.minions.rogue import AnubarAmbusher
@@ -9,7 +10,12 @@ from hearthbreaker.engine import Game, Deck, card_lookup
 from tests.agents.testing_agents import CardTestingAgent, OneCardPlayingAgent, PlayAndAttackAgent
 from tests.testing_utils import generate_game_for, mock
 from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, SylvanasWindrunner
-from hearthbreaker.game_objects import Bindable
+from hearthbreaker.game_objects import Bindable, GameException, invalidate_stats
+from hearthbreaker.tags.action import Duplicate
+from hearthbreaker.tags.base import Aura, Buff, remove_tag
+from hearthbreaker.tags.condition import IsDamaged
+from hearthbreaker.tags.selector import CardSelector, ConstantSelector, Count, MinionSelector, SelfSelector
+from hearthbreaker.tags.status import ChangeAttack, ChangeHealth, ManaChange
 
 
 class TestGame(unittest.TestCase):
@@ -167,6 +173,278 @@ class TestGame(unittest.TestCase):
 
         self.assertEqual(1, len(game.current_player.minions))
 
+    def test_seeded_games(self):
+        def create_game(seed):
+            decks = [Deck([card_lookup("Stonetusk Boar") for i in range(20)], Malfurion()),
+                     Deck([card_lookup("Novice Engineer") for i in range(20)], Jaina())]
+            return Game(decks, [RandomAgent(), RandomAgent()], seed)
+
+        game1 = create_game(1234)
+        game2 = create_game(1234)
+        game1.pre_game()
+        game2.pre_game()
+        random.seed(99)  # The global generator plays no part in a seeded game
+        for turn in range(0, 6):
+            game1.play_single_turn()
+            game2.play_single_turn()
+        self.assertEqual(1234, game1.seed)
+        self.assertEqual([len(player.minions) for player in game1.players],
+                         [len(player.minions) for player in game2.players])
+        self.assertEqual([player.hero.health for player in game1.players],
+                         [player.hero.health for player in game2.players])
+
+        # A copy carries on with the same random numbers as the original
+        copied_game = game1.copy()
+        self.assertEqual([game1.random_amount(0, 1000) for i in range(10)],
+                         [copied_game.random_amount(0, 1000) for i in range(10)])
+
+
+class TestDeck(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_draw(self):
+        names = ["Stonetusk Boar", "Novice Engineer", "Abomination", "Arcane Intellect", "Naturalize"]
+        cards = [card_lookup(names[i % 5]) for i in range(20)]
+        deck = Deck(cards, Malfurion())
+        game = Game([deck, Deck([StonetuskBoar() for i in range(20)], Jaina())], [DoNothingAgent(), DoNothingAgent()],
+                    1857)
+        copied_deck = deck.copy()
+        generator = random.Random(1857)
+
+        # The same cards are drawn as when the undrawn cards are picked from in order
+        for i in range(5):
+            undrawn = [card for card in cards if not card.drawn]
+            self.assertEqual(undrawn, deck.undrawn())
+            self.assertIs(undrawn[generator.randint(0, len(undrawn) - 1)], deck.draw(game))
+        self.assertEqual(15, deck.left)
+        self.assertEqual(20, len(copied_deck.undrawn()))
+
+        undrawn = deck.undrawn()
+        deck.take(undrawn[2])
+        undrawn[4].drawn = True
+        self.assertEqual(undrawn[:2] + undrawn[3:4] + undrawn[5:], deck.undrawn())
+        self.assertEqual(14, deck.left)
+
+        drawn = [card for card in cards if card.drawn]
+        deck.put_back(drawn[0])
+        self.assertEqual(15, deck.left)
+        self.assertEqual([card for card in cards if not card.drawn], deck.undrawn())
+        self.assertRaises(GameException, deck.put_back, deck.undrawn()[0])
+
+        # A card which wasn't in the deck is added to the end
+        sylvanas = SylvanasWindrunner()
+        deck.put_back(sylvanas)
+        self.assertIs(sylvanas, deck.undrawn()[-1])
+        self.assertEqual(20, len(copied_deck.cards))
+
+    def test_copy(self):
+        cards = [card_lookup(["Abusive Sergeant", "Novice Engineer"][i % 2]) for i in range(20)]
+        deck = Deck(cards, Malfurion())
+        game = Game([deck, Deck([StonetuskBoar() for i in range(20)], Jaina())], [DoNothingAgent(), DoNothingAgent()],
+                    1857)
+        drawn = deck.draw(game)
+        copied_deck = deck.copy()
+
+        # The cards of the copy are only made when they are needed
+        self.assertEqual([None] * 20, copied_deck._cards)
+        self.assertEqual([card.name for card in deck.undrawn()], copied_deck.undrawn_names())
+        self.assertEqual([None] * 20, copied_deck._cards)
+        copied_card = copied_deck.draw(game)
+        self.assertEqual(1, len([card for card in copied_deck._cards if card is not None]))
+        self.assertFalse(any(card is copied_card for card in cards))
+
+        # They are copies of the original cards, which aren't changed by the copy
+        copied_cards = copied_deck.cards
+        self.assertEqual(cards, copied_cards)
+        for card, copied_card in zip(cards, copied_cards):
+            self.assertIsNot(card, copied_card)
+            if card is not drawn:
+                self.assertIs(card.battlecry, copied_card.battlecry)
+        self.assertEqual(2, len([card for card in copied_cards if card.drawn]))
+        self.assertEqual([drawn], [card for card in deck.cards if card.drawn])
+        self.assertEqual(cards, deck.cards)
+
+    def test_copy_changed_card(self):
+        cards = [card_lookup(["Abusive Sergeant", "Novice Engineer"][i % 2]) for i in range(20)]
+        game = Game([Deck(cards, Malfurion()), Deck([StonetuskBoar() for i in range(20)], Jaina())],
+                    [DoNothingAgent(), DoNothingAgent()], 1857)
+        game.pre_game()
+        player = game.players[0]
+        card = player.hand[0]
+        mana = card.mana_cost()
+        card.add_buff(Buff(ManaChange(-1)))
+        self.assertEqual(mana - 1, card.mana_cost())
+
+        # A card which was changed after it was drawn goes back into the copied deck as it was before it was drawn
+        copied_player = game.copy().players[0]
+        copied_card = copied_player.hand[0]
+        copied_player.hand.remove(copied_card)
+        copied_player.deck.put_back(copied_card)
+        for deck_card in copied_player.deck.cards:
+            if deck_card.name == card.name:
+                self.assertEqual([], deck_card.buffs)
+                deck_card.player = copied_player
+                self.assertEqual(mana, deck_card.mana_cost())
+
+
+def game_for_tags():
+    decks = [Deck([card_lookup("Stonetusk Boar") for i in range(20)], Malfurion()),
+             Deck([card_lookup("Stonetusk Boar") for i in range(20)], Jaina())]
+    game = Game(decks, [DoNothingAgent(), DoNothingAgent()], 1857)
+    game.pre_game()
+    return game
+
+
+class TestAuras(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_affected(self):
+        game = game_for_tags()
+        player = game.players[0]
+        card_lookup("Stormwind Champion").summon(player, game, 0)
+        card_lookup("Dire Wolf Alpha").summon(player, game, 1)
+        champion_aura, health_aura = player.minions[0].auras
+        wolf_aura = player.minions[1].auras[0]
+        self.assertEqual([], champion_aura.affected)
+        self.assertIs(player.minions[1], health_aura.affected[0])
+
+        # Minions which are copies of each other are still told apart, and only the minion which came is checked
+        with mock.patch.object(Aura, "update_affected") as update_affected:
+            for index in range(2):
+                card_lookup("Unbound Elemental").summon(player, game, 2)
+        update_affected.assert_not_called()
+        self.assertEqual([5, 5], [minion.health for minion in player.minions[2:]])
+        self.assertEqual(3, len(health_aura.affected))
+        self.assertTrue(any(minion is player.minions[3] for minion in health_aura.affected))
+        # The Dire Wolf's aura is worked out when attack is calculated, so there is nothing to keep track of
+        self.assertEqual([], wolf_aura.affected)
+        self.assertEqual([3, 4, 3], [minion.calculate_attack() for minion in player.minions[1:]])
+
+        checkpoint = game.checkpoint()
+        player.minions[2].die(None)
+        game.check_delayed()
+        self.assertEqual(2, len(health_aura.affected))
+        self.assertEqual([3, 4], [minion.calculate_attack() for minion in player.minions[1:]])
+        player.minions[0].silence()
+        self.assertEqual([], health_aura.affected)
+        self.assertEqual([2, 4], [minion.health for minion in player.minions[1:]])
+
+        game.undo_to(checkpoint)
+        self.assertEqual(3, len(health_aura.affected))
+        self.assertEqual([5, 5], [minion.health for minion in player.minions[2:]])
+
+    def test_adjacent_affected(self):
+        game = game_for_tags()
+        player = game.players[0]
+        card_lookup("Wee Spellstopper").summon(player, game, 0)
+        card_lookup("Wisp").summon(player, game, 1)
+        aura = player.minions[0].auras[0]
+        self.assertEqual([player.minions[1]], aura.affected)
+
+        # A minion put down next to the Spellstopper moves the Wisp out of reach of its aura
+        card_lookup("Bloodfen Raptor").summon(player, game, 1)
+        self.assertEqual(1, len(aura.affected))
+        self.assertIs(player.minions[1], aura.affected[0])
+        self.assertFalse(player.minions[1].can_be_targeted_by_spells)
+        self.assertTrue(player.minions[2].can_be_targeted_by_spells)
+
+        # And moves it back when it goes
+        player.minions[1].die(None)
+        game.check_delayed()
+        self.assertIs(player.minions[1], aura.affected[0])
+        self.assertFalse(player.minions[1].can_be_targeted_by_spells)
+
+
+class TestStatCache(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_kept_stats(self):
+        decks = [Deck([card_lookup("Dire Wolf Alpha") for i in range(20)], Malfurion()),
+                 Deck([card_lookup("Amani Berserker") for i in range(20)], Jaina())]
+        game = Game(decks, [RandomAgent(), RandomAgent()], 1857)
+        game.pre_game()
+
+        # Every stat taken from the cache is checked against working it out again
+        with mock.patch("hearthbreaker.game_objects.check_stat_cache", True):
+            for turn in range(0, 12):
+                game.play_single_turn()
+                for player in game.players:
+                    for minion in player.minions:
+                        minion.calculate_attack()
+                        minion.calculate_attack()
+
+            minion = game.players[0].minions[0]
+            attack = minion.calculate_attack()
+            # Changing the buffs without going through add_buff leaves the kept attack behind
+            minion.buffs.append(Buff(ChangeAttack(2)))
+            self.assertRaises(AssertionError, minion.calculate_attack)
+            invalidate_stats()
+            self.assertEqual(attack + 2, minion.calculate_attack())
+
+    def test_changing_stats(self):
+        game = game_for_tags()
+        player = game.players[0]
+        minion = StonetuskBoar().summon(player, game, 0)
+
+        # Stats which depend on more than the buffs, auras and minions in the game are not kept
+        with mock.patch("hearthbreaker.game_objects.check_stat_cache", True):
+            minion.add_buff(Buff(ChangeAttack(2), IsDamaged()))
+            self.assertEqual(1, minion.calculate_attack())
+            minion.health = 0
+            self.assertEqual(3, minion.calculate_attack())
+
+            minion.add_buff(Buff(ChangeAttack(Count(CardSelector()))))
+            attack = minion.calculate_attack()
+            player.draw()
+            self.assertEqual(attack + 1, minion.calculate_attack())
+
+
+class TestTags(unittest.TestCase):
+    def test_keys(self):
+        buff = Buff(ChangeAttack(2))
+        self.assertTrue(buff.eq(Buff(ChangeAttack(2))))
+        self.assertIs(buff.key(), Buff(ChangeAttack(2)).key())
+        self.assertFalse(buff.eq(Buff(ChangeAttack(3))))
+
+        # A copy which is changed gets a key of its own
+        counted = ChangeAttack(Count(MinionSelector()))
+        instance = counted.to_instance(game_for_tags().players[0].hero)
+        self.assertNotEqual(counted.key(), instance.key())
+        self.assertEqual(ChangeAttack(0).key(), instance.key())
+
+    def test_changed_keys(self):
+        game = game_for_tags()
+        minion = card_lookup("Stonetusk Boar").summon(game.players[0], game, 0)
+        status = ChangeHealth(Count(MinionSelector()))
+        buff = Buff(status)
+        before = buff.key()
+        self.assertEqual(status.key(), status.key())
+        # The status keeps the amount it acted with, so neither it nor the buff holding it can keep its key
+        status.act(minion, minion)
+        self.assertEqual(ChangeHealth(0).key(), status.key())
+        self.assertNotEqual(before, buff.key())
+        self.assertEqual(Buff(ChangeHealth(0)).key(), buff.key())
+
+        # A deep copy whose selector is replaced, as GiveEffect does, doesn't keep the key of the original
+        duplicate = Duplicate(SelfSelector())
+        duplicate.key()
+        duplicate_copy = copy.deepcopy(duplicate)
+        duplicate_copy.selector = ConstantSelector([1])
+        self.assertNotEqual(duplicate.key(), duplicate_copy.key())
+
+    def test_remove_tag(self):
+        buffs = [Buff(ChangeAttack(2)), Buff(ChangeAttack(2)), Buff(ChangeAttack(3))]
+        first, second = buffs[:2]
+        self.assertIs(second, remove_tag(buffs, second))
+        self.assertIs(first, buffs[0])
+        # When the tag itself isn't there, an equal one is removed in its place
+        self.assertIs(first, remove_tag(buffs, Buff(ChangeAttack(2))))
+        self.assertIsNone(remove_tag(buffs, Buff(ChangeAttack(2))))
+        self.assertEqual(1, len(buffs))
+
 
 class TestBinding(unittest.TestCase):
     def test_bind(self):
@@ -191,3 +469,49 @@ class TestBinding(unittest.TestCase):
         binder.trigger("test")
         event.assert_called_once_with(1, 5, 6)
         self.assertEqual(event2.call_count, 2)
+
+    def test_unbind_handler(self):
+        event = mock.Mock()
+        binder = Bindable()
+        handler = binder.bind("test", event)
+        binder.bind("test", event)
+        binder.unbind_handler("test", handler)
+        binder.trigger("test", 1)
+        event.assert_called_once_with(1)
+        binder.unbind("test", event)
+        self.assertEqual({}, binder.events)
+
+    def test_bind_while_triggering(self):
+        event = mock.Mock()
+        binder = Bindable()
+
+        # Changes made by the functions being called take effect from the next trigger
+        def rebind():
+            binder.unbind("test", rebind)
+            binder.bind("test", event)
+
+        binder.bind("test", rebind)
+        binder.bind("test", event)
+        binder.trigger("test")
+        self.assertEqual(1, event.call_count)
+        binder.trigger("test")
+        self.assertEqual(3, event.call_count)
+
+    def test_handlers_copied_while_triggering(self):
+        binder = Bindable()
+        handlers = []
+
+        # The list of handlers is only replaced while it is being gone through
+        def bind_another():
+            handlers.append(binder.events["test"])
+            binder.bind("test", len)
+            handlers.append(binder.events["test"])
+
+        binder.bind("test", bind_another)
+        binder.trigger("test")
+        self.assertIsNot(handlers[0], handlers[1])
+        self.assertEqual(0, binder._dispatching)
+        listed = binder.events["test"]
+        binder.unbind("test", len)
+        binder.bind("test", len)
+        self.assertIs(listed, binder.events["test"])
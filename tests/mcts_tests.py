@@ -0,0 +1,166 @@
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.agents.mcts_agent import MCTSAgent, Node, GameState, uct, parallel_uct, get_inner_tree, \
+    evaluate_position
+from hearthbreaker.cards import StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.engine import Game, Deck
+from tests.testing_utils import mock
+
+
+def create_game(agent):
+    cards = []
+    for card_type in [StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre]:
+        cards.extend(card_type() for i in range(4))
+    other_cards = [card.copy() for card in cards]
+    game = Game([Deck(cards, Jaina()), Deck(other_cards, Malfurion())], [agent, DoNothingAgent()], 1857)
+    game.pre_game()
+    game._start_turn()
+    return game
+
+
+def create_lethal_game():
+    game = create_game(DoNothingAgent())
+    game.current_player.hand = []
+    BloodfenRaptor().summon(game.current_player, game, 0)
+    game.current_player.minions[0].exhausted = False
+    game.other_player.hero.health = 3
+    # Unless the opponent is finished off now, they will most likely win on their turn
+    game.current_player.hero.health = 5
+    for index in range(3):
+        BoulderfistOgre().summon(game.other_player, game, index)
+    return game
+
+
+class TestMCTS(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_finds_lethal(self):
+        game = create_lethal_game()
+        cards, attacks = uct(GameState(game), 20)
+        self.assertEqual(1, len(attacks))
+        self.assertTrue(attacks[0][1].is_hero())
+
+    def test_rollout_depth(self):
+        game = create_lethal_game()
+        self.assertLess(evaluate_position(game, game.current_player), 0.5)
+        self.assertGreater(evaluate_position(game, game.other_player), 0.5)
+        game.other_player.hero.dead = True
+        self.assertEqual(1, evaluate_position(game, game.current_player))
+        game.other_player.hero.dead = False
+
+        # Rollouts which are cut short are scored by the evaluator, but a win is still a win
+        scores = []
+
+        def evaluator(game, player):
+            scores.append(player)
+            return 0.5
+
+        cards, attacks = uct(GameState(game, evaluator), 20, rollout_depth=0)
+        self.assertEqual(1, len(attacks))
+        self.assertTrue(attacks[0][1].is_hero())
+        self.assertNotEqual([], scores)
+
+    def test_parallel_search(self):
+        game = create_lethal_game()
+        cards, attacks = parallel_uct(GameState(game), 20, 2)
+        self.assertEqual(1, len(attacks))
+        self.assertTrue(attacks[0][1].is_hero())
+        self.assertEqual(3, game.other_player.hero.health)
+
+        # Without processes to fork, the searches take turns instead
+        with mock.patch("multiprocessing.get_context", side_effect=ValueError):
+            cards, attacks = parallel_uct(GameState(game), 20, 2)
+        self.assertEqual(1, len(attacks))
+        self.assertTrue(attacks[0][1].is_hero())
+
+    def test_parallel_search_few_iterations(self):
+        game = create_lethal_game()
+        first_move = next(GameState(game).iter_moves())
+        # No more searches are run than there are iterations to share between them
+        self.assertEqual(first_move, parallel_uct(GameState(game), 1, 4))
+        self.assertEqual(first_move, parallel_uct(GameState(game), 0, 4))
+
+    def test_widening(self):
+        game = create_game(DoNothingAgent())
+        for turn in range(8):
+            game.play_single_turn()
+        game._start_turn()
+        moves = GameState(game).get_moves()
+        self.assertEqual(len(moves), len(set((tuple(cards), tuple(attacks)) for cards, attacks in moves)))
+
+        # A node starts with one move to try, and is given more as it is visited
+        node = Node(state=GameState(game))
+        self.assertIsNone(node.moves)
+        node.widen(GameState(game))
+        self.assertEqual(1, len(node.untriedMoves))
+        node.visits = 9
+        node.widen(GameState(game))
+        self.assertEqual(6, len(node.untriedMoves))
+        self.assertEqual(moves[:6], node.untriedMoves)
+
+        # Untried moves are taken in a random order, each of them once
+        rng = random.Random(1857)
+        taken = [node.pop_untried_move(rng) for i in range(6)]
+        self.assertEqual([], node.untriedMoves)
+        self.assertCountEqual(moves[:6], taken)
+        self.assertNotEqual(moves[:6], taken)
+
+    def test_attack_symmetry(self):
+        game = create_game(DoNothingAgent())
+        for index in range(2):
+            BloodfenRaptor().summon(game.current_player, game, index)
+            game.current_player.minions[index].exhausted = False
+        RiverCrocolisk().summon(game.other_player, game, 0)
+
+        # Which of the two Raptors attacks makes no difference, so the only choices are how many go face
+        sequences = get_inner_tree(game)
+        self.assertEqual(4, len(sequences))
+        goes_face = [tuple(sorted(target.is_hero() for minion, target in sequence)) for sequence in sequences]
+        self.assertEqual([(False,), (False, True), (True,), (True, True)], sorted(goes_face))
+
+    def test_reuse_tree(self):
+        agent = MCTSAgent(10)
+        game = create_game(agent)
+        previous = Node(state=GameState(game))
+        reached = Node(parent=previous, state=GameState(game))
+        previous.childNodes.append(reached)
+
+        # The node for the board the game has becomes the new root, even with other cards drawn
+        pass_move = ((), [])
+        missing_card = ((BoulderfistOgre(),), [])
+        for move in (pass_move, missing_card):
+            reached.childNodes.append(Node(move=move, parent=reached, state=GameState(game)))
+        reached.moves = GameState(game).iter_moves()
+        reached.untriedMoves = [next(reached.moves)]
+        reached.seed = 1857
+        game.current_player.hand = [card for card in game.current_player.hand if card.name != "Boulderfist Ogre"]
+        game.current_player.draw()
+        agent.tree = previous
+        self.assertIs(reached, agent.find_root(game))
+        self.assertIsNone(reached.parentNode)
+        self.assertIsNone(agent.tree)
+        self.assertEqual(1, agent.reused)
+        self.assertEqual(game.state_hash(), reached.stateHash)
+
+        # What came of the cards drawn in the last search is forgotten, and moves which can't be made are dropped
+        self.assertIsNone(reached.moves)
+        self.assertEqual([], reached.untriedMoves)
+        self.assertIsNone(reached.seed)
+        self.assertEqual([pass_move], [c.move for c in reached.childNodes])
+        self.assertIsNone(reached.childNodes[0].stateHash)
+        self.assertIs(reached.childNodes[0], reached.find_child(0, pass_move))
+
+        # If the opponent did something that wasn't explored, the search starts again
+        agent.tree = previous
+        game.current_player.hero.health -= 1
+        self.assertIsNot(reached, agent.find_root(game))
+        self.assertEqual(1, agent.reused)
+
+        # The agent keeps the node for the move it makes
+        agent.do_turn(game.current_player)
+        self.assertIsNotNone(agent.tree)
+        self.assertIs(game.current_player, agent.tree.playerJustMoved)
@@ -0,0 +1,70 @@
+import json
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.cards import KnifeJuggler, StonetuskBoar
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.engine import Game, Deck
+from hearthbreaker.game_objects import Bindable
+from hearthbreaker.profiler import EventProfiler
+
+
+class TestEventProfiler(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_times(self):
+        # Each reading of the clock is a second later than the one before
+        readings = iter(range(100))
+        profiler = EventProfiler(lambda: next(readings))
+        binder = Bindable()
+        binder.bind("outer", lambda: binder.trigger("inner"))
+        binder.bind("inner", lambda: None)
+        binder.bind_once("inner", lambda: None)
+
+        with profiler:
+            binder.trigger("outer")
+            binder.trigger("inner")
+        binder.trigger("outer")
+        # The time inner took is left out of the self time of outer, but not of its total
+        self.assertEqual([2, 8, 8], profiler.events["inner"])
+        self.assertEqual([1, 9, 4], profiler.events["outer"])
+        self.assertEqual([4, 10], profiler.handlers["TestEventProfiler.test_times.<locals>.<lambda>"])
+
+    def test_errors(self):
+        profiler = EventProfiler()
+        binder = Bindable()
+
+        def fail():
+            raise ValueError()
+        binder.bind("outer", lambda: binder.trigger("inner"))
+        binder.bind_once("inner", fail)
+
+        with profiler:
+            self.assertRaises(ValueError, binder.trigger, "outer")
+            binder.trigger("outer")
+        # The events are recorded even when a handler fails, and a handler bound once is still only called once
+        self.assertEqual(2, profiler.events["outer"][0])
+        self.assertEqual(2, profiler.events["inner"][0])
+        self.assertEqual(1, profiler.handlers["TestEventProfiler.test_errors.<locals>.fail"][0])
+
+    def test_origins(self):
+        game = Game([Deck([StonetuskBoar() for i in range(20)], Jaina()),
+                     Deck([StonetuskBoar() for i in range(20)], Malfurion())],
+                    [DoNothingAgent(), DoNothingAgent()], 1857)
+        game.pre_game()
+        game._start_turn()
+        KnifeJuggler().summon(game.current_player, game, 0)
+
+        with EventProfiler() as profiler:
+            StonetuskBoar().summon(game.current_player, game, 1)
+        self.assertEqual(1, profiler.handlers["Knife Juggler: Effect"][0])
+        self.assertEqual(1, profiler.events["minion_summoned"][0])
+        self.assertIn("Knife Juggler: Effect", profiler.table())
+        results = json.loads(json.dumps(profiler, default=lambda o: o.__to_json__()))
+        self.assertEqual(1, results["handlers"]["Knife Juggler: Effect"]["calls"])
+
+        # Only one profiler can run at a time
+        with profiler:
+            self.assertRaises(RuntimeError, EventProfiler().start)
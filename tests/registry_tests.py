@@ -0,0 +1,124 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+import hearthbreaker.cards
+from hearthbreaker.cards import StonetuskBoar
+from hearthbreaker.cards.manifest import CARDS
+from hearthbreaker.cards.registry import build_manifest
+from hearthbreaker.constants import MINION_TYPE
+from hearthbreaker.engine import card_lookup, get_cards, get_collectible_index
+from hearthbreaker.tags.action import Damage
+from hearthbreaker.tags.base import Action, Buff, Condition, Picker, Player, Selector
+from hearthbreaker.tags.card_source import CollectionSource
+from hearthbreaker.tags.condition import AttackLessThanOrEqualTo, IsMinion, IsType, ManaCost
+from hearthbreaker.tags.event import MinionDied
+from hearthbreaker.tags.selector import BothPlayer, Count, CurrentPlayer, MinionSelector, PlayerOne, RandomPicker, \
+    UserPicker
+from hearthbreaker.tags.status import ManaChange
+from tests.testing_utils import generate_game_for
+
+
+class TestCardRegistry(unittest.TestCase):
+    def test_manifest_is_current(self):
+        # If this fails, run update_card_manifest.py
+        self.assertEqual(sorted(build_manifest()), sorted(CARDS))
+
+    def test_lookup(self):
+        for ref_name, module, class_name in CARDS:
+            card = card_lookup(ref_name)
+            self.assertEqual(ref_name, card.ref_name)
+            self.assertEqual(module, type(card).__module__)
+        self.assertRaises(KeyError, card_lookup, "Not A Card")
+
+    def test_lookup_copies(self):
+        first = card_lookup("Abusive Sergeant")
+        second = card_lookup("Abusive Sergeant")
+        self.assertIsNot(first, second)
+        # The definition of the card is shared, but what happens to one card doesn't happen to the other
+        self.assertIs(first.battlecry, second.battlecry)
+        first.buffs.append(Buff(ManaChange(-1)))
+        first.drawn = False
+        self.assertEqual([], second.buffs)
+        self.assertTrue(second.drawn)
+        self.assertEqual([], card_lookup("Abusive Sergeant").buffs)
+
+    def test_packages(self):
+        self.assertIs(hearthbreaker.cards.spells.mage.Fireball, hearthbreaker.cards.Fireball)
+        self.assertIs(hearthbreaker.cards.spells.druid.Moonfire, hearthbreaker.cards.Moonfire)
+        self.assertIn("Fireball", dir(hearthbreaker.cards))
+        self.assertRaises(AttributeError, getattr, hearthbreaker.cards, "NotACard")
+        names = {}
+        exec("from hearthbreaker.cards import *", names)
+        self.assertEqual(set(hearthbreaker.cards.__all__), set(names) - {"__builtins__"})
+
+    def test_lazy_import(self):
+        # Checked in a new interpreter, as other tests will have imported the cards already
+        code = "import sys, hearthbreaker.engine\n" \
+               "hearthbreaker.engine.card_lookup('Fireball')\n" \
+               "print(sorted(name for name in sys.modules if name.startswith('hearthbreaker.cards.')))"
+        directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        modules = subprocess.check_output([sys.executable, "-c", code], cwd=directory, universal_newlines=True)
+        self.assertIn("hearthbreaker.cards.spells.mage", modules)
+        self.assertNotIn("hearthbreaker.cards.spells.druid", modules)
+        self.assertNotIn("hearthbreaker.cards.minions.neutral", modules)
+
+
+class TestCardIndex(unittest.TestCase):
+    def test_find(self):
+        index = get_collectible_index()
+        conditions = [ManaCost(2), IsMinion(), IsType(MINION_TYPE.MURLOC)]
+        expected = [card for card in get_cards() if all(condition.evaluate(None, card) for condition in conditions)]
+        self.assertNotEqual([], expected)
+        found = index.find([condition.card_key(None) for condition in conditions])
+        self.assertEqual([card.ref_name for card in expected], [card.ref_name for card in found])
+        self.assertEqual(list(index.cards), index.find([]))
+        self.assertEqual([], index.find([("mana", 2), ("mana", 3)]))
+        self.assertEqual([], index.find([("mana", 100)]))
+
+    def test_collection_source(self):
+        random.seed(1857)
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingAgent, DoNothingAgent)
+        source = CollectionSource([IsType(MINION_TYPE.MURLOC)])
+        card = source.get_card(game.players[0].hero, game.players[0], game.players[0].hero)
+        self.assertEqual(MINION_TYPE.MURLOC, card.minion_type)
+        # The cards in the index are never given out, as they are shared
+        self.assertFalse(any(indexed is card for indexed in get_collectible_index().cards))
+        self.assertIsNone(CollectionSource([ManaCost(100)]).get_card(game.players[0].hero, game.players[0],
+                                                                     game.players[0].hero))
+
+
+class TestTagRegistry(unittest.TestCase):
+    def test_lookup(self):
+        self.assertIs(MinionSelector, Selector.json_class("minion"))
+        self.assertIs(AttackLessThanOrEqualTo, Condition.json_class("attack_less_than_or_equal_to"))
+        self.assertIs(CurrentPlayer, Player.json_class("current_player"))
+        self.assertIsInstance(Player.from_json("player_one"), PlayerOne)
+        self.assertEqual(3, Picker.from_json("random", count=3).count)
+        self.assertIsInstance(Picker.from_json("user"), UserPicker)
+        self.assertRaises(KeyError, Action.json_class, "not_an_action")
+
+    def test_round_trip(self):
+        tags = [Damage(2), MinionSelector(IsType(MINION_TYPE.MURLOC), BothPlayer(), RandomPicker(2)), ManaChange(-1),
+                MinionDied(IsMinion()), Count(MinionSelector())]
+        for tag in tags:
+            read = type(tag).from_json(**json.loads(str(tag)))
+            self.assertIs(type(tag), type(read))
+            self.assertEqual(str(tag), str(read))
+
+    def test_new_classes(self):
+        class TestSpecialThing(Condition):
+            def evaluate(self, target, *args):
+                return True
+
+            def __to_json__(self):
+                return {'name': 'test_special_thing'}
+
+        try:
+            self.assertIsInstance(Condition.from_json("test_special_thing"), TestSpecialThing)
+        finally:
+            del Condition.json_types["test_special_thing"]
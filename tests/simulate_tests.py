@@ -0,0 +1,129 @@
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.cards import StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre
+from hearthbreaker.cards.definitions import load_cards, register_cards
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+import hearthbreaker.engine
+from hearthbreaker.engine import Deck, card_lookup
+from hearthbreaker.simulate import run_many, rerun_game, wilson_interval, GameResult, BatchResult
+
+
+def create_deck(hero):
+    cards = []
+    for card_type in [StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre]:
+        cards.extend(card_type() for i in range(4))
+    return Deck(cards, hero)
+
+
+class TestSimulate(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_run_in_process(self):
+        results = run_many([create_deck(Jaina()), create_deck(Malfurion())], [RandomAgent, RandomAgent], 4, workers=1,
+                           keep_results=True)
+
+        self.assertEqual(4, results.games)
+        self.assertEqual(4, sum(results.wins) + results.draws)
+        self.assertEqual([0, 1, 2, 3], [result.index for result in results.results])
+        for result in results.results:
+            if result.winner is None:
+                self.assertTrue(all(health <= 0 for health in result.health))
+                continue
+            self.assertIn(result.winner, [0, 1])
+            self.assertGreater(result.turns, 0)
+            self.assertGreater(result.health[result.winner], 0)
+            self.assertLessEqual(result.health[1 - result.winner], 0)
+
+    def test_run_in_pool(self):
+        decks = [create_deck(Jaina()), create_deck(Malfurion())]
+        results = run_many(decks, [RandomAgent, RandomAgent], 6, workers=2, chunk_size=2, keep_results=True)
+
+        self.assertEqual(6, results.games)
+        self.assertEqual(6, sum(results.wins) + results.draws)
+        self.assertEqual(list(range(6)), [result.index for result in results.results])
+
+        # More chunks than are kept waiting for the workers, and only the totals kept
+        totals = run_many(decks, [RandomAgent, RandomAgent], 10, workers=2, chunk_size=1)
+        self.assertEqual(10, totals.games)
+        self.assertEqual(10, sum(totals.wins) + totals.draws)
+        self.assertIsNone(totals.results)
+
+        # The decks passed in are only templates
+        for deck in decks:
+            self.assertEqual(20, deck.left)
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "Only forked workers know run time cards")
+    def test_run_cards_made_at_run_time(self):
+        card_def = {
+            "name": "Data Boar",
+            "type": "minion",
+            "mana": 1,
+            "attack": 1,
+            "health": 1,
+            "rarity": "Free",
+            "character_class": "",
+            "collectible": False,
+            "impl": {"buffs": [{"status": {"name": "charge"}}]}
+        }
+        cache_dir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(cache_dir, "cards.json")
+            with open(filename, "w") as definition_file:
+                json.dump([card_def], definition_file)
+            register_cards(load_cards(filename, cache_dir))
+            decks = [Deck([card_lookup("Data Boar") for i in range(20)], Jaina()),
+                     Deck([card_lookup("Data Boar") for i in range(20)], Malfurion())]
+            # Card classes made at run time can't be pickled, so only the names of the cards are sent to the workers
+            results = run_many(decks, [RandomAgent, RandomAgent], 4, workers=2, chunk_size=2)
+            self.assertEqual(4, results.games)
+        finally:
+            del hearthbreaker.engine.card_table["Data Boar"]
+            shutil.rmtree(cache_dir)
+
+    def test_seeded_runs_repeat(self):
+        decks = [create_deck(Jaina()), create_deck(Malfurion())]
+        first = run_many(decks, [RandomAgent, RandomAgent], 6, workers=1, seed=42, keep_results=True)
+        second = run_many(decks, [RandomAgent, RandomAgent], 6, workers=2, chunk_size=2, seed=42, keep_results=True)
+
+        self.assertEqual(first.results, second.results)
+        self.assertEqual(6, len(set(result.seed for result in first.results)))
+
+        result = first.results[3]
+        game = rerun_game(decks, [RandomAgent, RandomAgent], result.seed)
+        self.assertEqual(result.turns, game._turns_passed)
+        self.assertEqual(result.health, tuple(player.hero.health for player in game.players))
+
+    def test_aggregation(self):
+        results = BatchResult()
+        results.add(GameResult(0, 11, 0, 10, (5, 0)))
+        results.add(GameResult(1, 12, 1, 20, (0, 3)))
+        results.add(GameResult(2, 13, 0, 12, (1, -2)))
+        results.add(GameResult(3, 14, None, 14, (-1, 0)))
+
+        self.assertEqual([2, 1], results.wins)
+        self.assertEqual(1, results.draws)
+        # A draw isn't a win for either player
+        self.assertAlmostEqual(2 / 4, results.win_rate(0))
+        self.assertAlmostEqual(1 / 4, results.win_rate(1))
+        self.assertAlmostEqual(1 / 4, results.draw_rate())
+        self.assertEqual(14, results.average_turns())
+        low, high = results.confidence_interval(0)
+        self.assertLess(low, 2 / 4)
+        self.assertGreater(high, 2 / 4)
+
+    def test_wilson_interval(self):
+        self.assertEqual((0.0, 1.0), wilson_interval(0, 0))
+        low, high = wilson_interval(500, 1000)
+        self.assertAlmostEqual(0.469, low, places=3)
+        self.assertAlmostEqual(0.531, high, places=3)
+        low, high = wilson_interval(0, 10)
+        self.assertEqual(0.0, low)
+        self.assertLess(high, 0.35)
@@ -25,11 +25,9 @@ class StackedDeck(Deck):
         super().__init__(cards, hero)
 
     def draw(self, random_func):
-        for card_index in range(0, len(self.cards)):
-            if not self.cards[card_index].drawn:
-                self.cards[card_index].drawn = True
-                self.left -= 1
-                return self.cards[card_index]
+        for card in self.undrawn():
+            self.take(card)
+            return card
 
 
 def generate_game_for(card1, card2, first_agent_type, second_agent_type, run_pre_game=True):
@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from hearthbreaker import trace
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.cards import StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.engine import Game, Deck
+
+
+def create_game():
+    cards = []
+    for card_type in [StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, BoulderfistOgre]:
+        cards.extend(card_type() for i in range(4))
+    other_cards = [card.copy() for card in cards]
+    game = Game([Deck(cards, Jaina()), Deck(other_cards, Malfurion())], [RandomAgent(), RandomAgent()], 1857)
+    game.pre_game()
+    return game
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def tearDown(self):
+        trace.quiet()
+
+    def test_levels(self):
+        messages = []
+        self.assertFalse(trace.enabled(trace.ERROR))
+        trace.error("lost")
+        self.assertEqual([], messages)
+
+        trace.set_sink(messages.append, trace.INFO)
+        self.assertTrue(trace.enabled(trace.INFO))
+        self.assertFalse(trace.enabled(trace.DEBUG))
+        trace.error("Something", "went wrong")
+        trace.info("Cards:", "\n\t", end="")
+        trace.info(1, 2, 3, sep=", ")
+        trace.debug("Choosing a target")
+        self.assertEqual(["Something went wrong\n", "Cards: \n\t", "1, 2, 3\n"], messages)
+
+        trace.quiet()
+        trace.error("Something went wrong")
+        self.assertEqual(3, len(messages))
+
+    def test_agents(self):
+        messages = []
+        game = create_game()
+        trace.set_sink(messages.append, trace.ERROR)
+        game.play_single_turn()
+        self.assertEqual([], messages)
+
+        trace.set_sink(messages.append, trace.INFO)
+        game.play_single_turn()
+        self.assertIn("Cards played:", messages[0])
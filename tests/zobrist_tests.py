@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingAgent
+from hearthbreaker.agents.mcts_agent import get_inner_tree
+from hearthbreaker.cards import StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, Fireball
+from hearthbreaker.cards.heroes import Jaina, Malfurion
+from hearthbreaker.engine import Game, Deck
+from hearthbreaker.tags.base import Buff
+from hearthbreaker.tags.condition import IsDamaged, MinionCountIs
+from hearthbreaker.tags.status import ChangeAttack
+from hearthbreaker.zobrist import feature_key, state_hashes
+
+
+def create_game():
+    cards = []
+    for card_type in [StonetuskBoar, BloodfenRaptor, RiverCrocolisk, ChillwindYeti, Fireball]:
+        cards.extend(card_type() for i in range(4))
+    other_cards = [card.copy() for card in cards]
+    game = Game([Deck(cards, Jaina()), Deck(other_cards, Malfurion())], [DoNothingAgent(), DoNothingAgent()], 1857)
+    game.pre_game()
+    return game
+
+
+class TestStateHash(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_keys_are_fixed(self):
+        self.assertEqual(feature_key(("hand", 0, ("Fireball", 4), 0)), feature_key(("hand", 0, ("Fireball", 4), 0)))
+        self.assertNotEqual(feature_key(("hand", 0, ("Fireball", 4), 0)),
+                            feature_key(("hand", 0, ("Fireball", 4), 1)))
+        self.assertEqual(feature_key(("turn", 0, 0)), feature_key(("turn", 0, False)))
+        self.assertLess(feature_key(("turn", 0, 0)), 2 ** 64)
+
+    def test_same_position(self):
+        game = create_game()
+        copied_game = game.copy()
+        self.assertEqual(game.state_hash(), copied_game.state_hash())
+
+        # The order of the cards in hand makes no difference, but the cards themselves do
+        copied_game.players[1].hand.reverse()
+        self.assertEqual(game.state_hash(), copied_game.state_hash())
+        copied_game.players[1].hand.pop()
+        self.assertNotEqual(game.state_hash(), copied_game.state_hash())
+
+        # The board hash leaves out the cards in hand and in the deck
+        self.assertEqual(game.state_hash(), state_hashes(game)[0])
+        self.assertEqual(state_hashes(game)[1], state_hashes(copied_game)[1])
+        copied_game.players[1].hero.health -= 1
+        self.assertNotEqual(state_hashes(game)[1], state_hashes(copied_game)[1])
+
+    def test_changes(self):
+        game = create_game()
+        original = game.state_hash()
+        game.players[1].hero.health -= 3
+        damaged = game.state_hash()
+        self.assertNotEqual(original, damaged)
+        game.players[1].hero.health += 3
+        self.assertEqual(original, game.state_hash())
+
+        StonetuskBoar().summon(game.players[0], game, 0)
+        self.assertNotEqual(original, game.state_hash())
+
+    def test_tags(self):
+        game = create_game()
+        StonetuskBoar().summon(game.players[0], game, 0)
+        copied_game = game.copy()
+
+        # Buffs which make no difference yet still tell the positions apart
+        game.players[0].minions[0].add_buff(Buff(ChangeAttack(2), IsDamaged()))
+        copied_game.players[0].minions[0].add_buff(Buff(ChangeAttack(2), MinionCountIs(7)))
+        self.assertEqual(1, game.players[0].minions[0].calculate_attack())
+        self.assertEqual(1, copied_game.players[0].minions[0].calculate_attack())
+        self.assertNotEqual(game.state_hash(), copied_game.state_hash())
+
+    def test_transpositions(self):
+        game = create_game()
+        RiverCrocolisk().summon(game.players[0], game, 0)
+        BloodfenRaptor().summon(game.players[0], game, 1)
+        for minion in game.players[0].minions:
+            minion.exhausted = False
+        ChillwindYeti().summon(game.players[1], game, 0)
+
+        first = game.copy()
+        first.attack_target(first.players[0].minions[0], first.players[1].hero)
+        first.attack_target(first.players[0].minions[1], first.players[1].minions[0])
+        second = game.copy()
+        second.attack_target(second.players[0].minions[1], second.players[1].minions[0])
+        second.attack_target(second.players[0].minions[0], second.players[1].hero)
+        self.assertEqual(first.state_hash(), second.state_hash())
+
+        # The search only lists one order of the same attacks
+        sequences = get_inner_tree(game)
+        hero_then_yeti = [sequence for sequence in sequences
+                          if len(sequence) == 2 and sequence[0][1].is_hero() != sequence[1][1].is_hero()]
+        self.assertEqual(2, len(hero_then_yeti))
@@ -0,0 +1,13 @@
+"""
+Regenerates :mod:`hearthbreaker.cards.manifest`, which :func:`hearthbreaker.engine.card_lookup` uses to find the
+module of a card from its name.  This has to be run whenever a card is added, renamed or moved to another module.
+
+usage: python update_card_manifest.py
+"""
+import os
+
+from hearthbreaker.cards.registry import write_manifest
+
+
+if __name__ == "__main__":
+    write_manifest(os.path.join(os.path.dirname(os.path.abspath(__file__)), "hearthbreaker", "cards", "manifest.py"))